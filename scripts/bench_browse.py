@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+文字ナビゲーションとブラウズのクエリのベンチマーク（実行時の LIKE 集計と事前計算テーブルの比較）
+
+bench_search.py と同じく一時 SQLite DB を作り、src/lib/db.ts の getLetterStats /
+getLetterStatsDetailed / getWordAtOffset / getWordRange / browseWords の2つの方式を
+同じ SQL で再現して所要時間を比べ、結果が一致するかを確認する。
+
+- scan: 各言語テーブルを `LIKE 'prefix%'` で集めて並べ替える（browseWords は LIMIT/OFFSET）
+- positions: letter_prefixes と word_positions を1回引く
+
+接頭辞は letter_prefixes の全行（1〜3文字）と、単語のない接頭辞をいくつか使う。
+
+使い方:
+    python scripts/bench_browse.py
+    python scripts/bench_browse.py --db /tmp/search.db
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bench_search import build_database, describe, measure
+from sync_to_d1 import LANGUAGES, PREFIX_MAX_LENGTH
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# 単語のない接頭辞（行がない場合の結果も比較する）
+MISSING_PREFIXES = ["qz", "xxx", "zzz"]
+
+# browseWords の比較に使う offset と1ページの件数
+BROWSE_OFFSETS = [0, 50, 500, 2000, 4500]
+BROWSE_LIMIT = 51
+
+
+# ---------------------------------------------------------------------------
+# 従来方式（各言語テーブルの走査）
+# ---------------------------------------------------------------------------
+
+
+def scan_words(conn: sqlite3.Connection, prefix: str) -> List[str]:
+    """接頭辞に一致する翻訳がある英単語（英単語順）"""
+    words = set()
+    for lang in LANGUAGES:
+        rows = conn.execute(
+            f"""SELECT DISTINCT en FROM words_{lang}
+                WHERE translation IS NOT NULL AND translation != ''
+                AND LOWER(en) LIKE ?""",
+            (f"{prefix.lower()}%",),
+        )
+        words.update(en for (en,) in rows)
+    return sorted(words, key=str.lower)
+
+
+def next_letter_counts(words: List[str], length: int) -> Dict[str, int]:
+    """length 文字目の次の文字（a〜z）ごとの単語数"""
+    counts: Dict[str, int] = {}
+    for word in words:
+        if len(word) > length and word[length] in LETTERS:
+            counts[word[length]] = counts.get(word[length], 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def scan_letter_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+    return next_letter_counts(scan_words(conn, ""), 0)
+
+
+def scan_letter_stats_detailed(conn: sqlite3.Connection, prefix: str) -> Dict[str, int]:
+    return next_letter_counts(scan_words(conn, prefix), len(prefix))
+
+
+def scan_word_at_offset(conn: sqlite3.Connection, prefix: str, offset: int) -> Optional[str]:
+    words = scan_words(conn, prefix)
+    return words[offset] if offset < len(words) else None
+
+
+def scan_word_range(conn: sqlite3.Connection, prefix: str) -> Tuple:
+    words = scan_words(conn, prefix)
+    return (words[0], words[-1], len(words)) if words else (None, None, 0)
+
+
+def scan_browse(conn: sqlite3.Connection, prefix: str, limit: int, offset: int) -> List[str]:
+    sql = "SELECT en FROM words_en"
+    params: list = []
+    if prefix:
+        sql += " WHERE en LIKE ? COLLATE NOCASE"
+        params.append(f"{prefix}%")
+    sql += " ORDER BY en COLLATE NOCASE LIMIT ? OFFSET ?"
+    return [en for (en,) in conn.execute(sql, (*params, limit, offset))]
+
+
+# ---------------------------------------------------------------------------
+# 事前計算テーブル（letter_prefixes / word_positions）
+# ---------------------------------------------------------------------------
+
+
+def positions_letter_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+    rows = conn.execute(
+        f"""SELECT prefix, word_count FROM letter_prefixes
+            WHERE prefix IN ({",".join("?" * len(LETTERS))}) AND word_count > 0
+            ORDER BY prefix""",
+        tuple(LETTERS),
+    )
+    return dict(rows)
+
+
+def positions_letter_stats_detailed(conn: sqlite3.Connection, prefix: str) -> Dict[str, int]:
+    row = conn.execute("SELECT next_letters FROM letter_prefixes WHERE prefix = ?", (prefix,)).fetchone()
+    return dict(sorted(json.loads(row[0]).items())) if row else {}
+
+
+def positions_word_at_offset(conn: sqlite3.Connection, prefix: str, offset: int) -> Optional[str]:
+    if prefix:
+        row = conn.execute(
+            """SELECT wp.en FROM letter_prefixes lp
+               JOIN word_positions wp ON wp.nav_rank = lp.first_nav_rank + ?
+               WHERE lp.prefix = ? AND ? < lp.word_count""",
+            (offset, prefix, offset),
+        ).fetchone()
+    else:
+        row = conn.execute("SELECT en FROM word_positions WHERE nav_rank = ?", (offset + 1,)).fetchone()
+    return row[0] if row else None
+
+
+def positions_word_range(conn: sqlite3.Connection, prefix: str) -> Tuple:
+    if prefix:
+        row = conn.execute(
+            """SELECT first_word, last_word, word_count FROM letter_prefixes
+               WHERE prefix = ?""",
+            (prefix,),
+        ).fetchone()
+    else:
+        row = conn.execute("""SELECT
+              (SELECT en FROM word_positions WHERE nav_rank = 1),
+              (SELECT en FROM word_positions
+               WHERE nav_rank = (SELECT MAX(nav_rank) FROM word_positions)),
+              (SELECT IFNULL(MAX(nav_rank), 0) FROM word_positions)""").fetchone()
+    return tuple(row) if row else (None, None, 0)
+
+
+def positions_browse(conn: sqlite3.Connection, prefix: str, limit: int, offset: int) -> List[str]:
+    if prefix:
+        rows = conn.execute(
+            """SELECT wp.en FROM letter_prefixes lp
+               JOIN word_positions wp
+                 ON wp.sort_rank >= lp.first_sort_rank + ?
+                 AND wp.sort_rank <= lp.last_sort_rank
+               WHERE lp.prefix = ?
+               ORDER BY wp.sort_rank LIMIT ?""",
+            (offset, prefix, limit),
+        )
+    else:
+        rows = conn.execute(
+            "SELECT en FROM word_positions WHERE sort_rank > ? ORDER BY sort_rank LIMIT ?", (offset, limit)
+        )
+    return [en for (en,) in rows]
+
+
+# ---------------------------------------------------------------------------
+# 比較
+# ---------------------------------------------------------------------------
+
+
+def compare(
+    name: str, cases: List[tuple], scan: Callable, positions: Callable, conn: sqlite3.Connection
+) -> int:
+    """両方式の所要時間を表示し、結果が異なるケースの数を返す"""
+    scan_timings = measure(lambda case: scan(conn, *case), cases)
+    positions_timings = measure(lambda case: positions(conn, *case), cases)
+    differ = [case for case in cases if scan(conn, *case) != positions(conn, *case)]
+    print(
+        f"{name:<22}{len(cases):>7}"
+        + "".join(f"{v:>9.2f}" for v in describe(scan_timings))
+        + "".join(f"{v:>9.3f}" for v in describe(positions_timings))
+        + f"  {len(cases) - len(differ)}/{len(cases)}"
+    )
+    for case in differ[:5]:
+        print(f"  ❌ {case}: {scan(conn, *case)!r} != {positions(conn, *case)!r}")
+    return len(differ)
+
+
+def run_benchmark(conn: sqlite3.Connection) -> int:
+    prefixes = [prefix for (prefix,) in conn.execute("SELECT prefix FROM letter_prefixes ORDER BY prefix")]
+    print(
+        f"letter_prefixes: {len(prefixes)}行 (1〜{PREFIX_MAX_LENGTH}文字), "
+        f"word_positions: {conn.execute('SELECT COUNT(*) FROM word_positions').fetchone()[0]}行"
+    )
+    prefixes += MISSING_PREFIXES
+
+    offset_cases = [("", 0), ("", 1000), ("", 10**6)]
+    for prefix in prefixes:
+        count = positions_word_range(conn, prefix)[2]
+        offset_cases += [(prefix, 0), (prefix, count // 2), (prefix, count)]
+    browse_cases = [("", BROWSE_LIMIT, offset) for offset in BROWSE_OFFSETS]
+    browse_cases += [(prefix, BROWSE_LIMIT, 0) for prefix in prefixes[::10]]
+    browse_cases += [(prefix, BROWSE_LIMIT, 60) for prefix in LETTERS]
+
+    print()
+    print(f"{'':<22}{'件数':>7}{'scan ms (平均 / p50 / p95)':>27}{'positions ms':>27}  一致")
+    failed = 0
+    failed += compare("getLetterStats", [()], scan_letter_stats, positions_letter_stats, conn)
+    failed += compare(
+        "getLetterStatsDetailed",
+        [(prefix,) for prefix in prefixes],
+        scan_letter_stats_detailed,
+        positions_letter_stats_detailed,
+        conn,
+    )
+    failed += compare("getWordAtOffset", offset_cases, scan_word_at_offset, positions_word_at_offset, conn)
+    failed += compare(
+        "getWordRange",
+        [("",)] + [(prefix,) for prefix in prefixes],
+        scan_word_range,
+        positions_word_range,
+        conn,
+    )
+    failed += compare("browseWords", browse_cases, scan_browse, positions_browse, conn)
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark letter navigation against precomputed position tables"
+    )
+    parser.add_argument("--db", type=Path, help="Reuse or create the SQLite database at this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "browse.db"
+        if not db_path.exists():
+            build_database(db_path)
+        conn = sqlite3.connect(db_path)
+        try:
+            return run_benchmark(conn)
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
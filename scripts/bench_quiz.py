@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+クイズ生成（getQuizQuestions）のベンチマーク（全候補のシャッフルと quiz_pool の比較）
+
+bench_search.py と同じく一時 SQLite DB（ローカル同期の複製）を作り、src/lib/db.ts の
+getQuizQuestions の2つの方式を同じ SQL で再現して比べる。
+
+- scan: 選んだ言語テーブルの候補をすべて読み、シャッフルして count 件を取る
+- pool: 出題数を言語に振り分け、quiz_pool のランダムな位置から連続した区間を読む
+
+所要時間に加えて、1言語10問のクイズでの性別の偏り（各性別の出題数と、その言語全体の割合から
+期待される数との差の最大値）を比べる。quiz_pool の position が連番で、行が言語テーブルの
+候補と一致することも確認する。
+
+使い方:
+    python scripts/bench_quiz.py
+    python scripts/bench_quiz.py --trials 500 --db /tmp/search.db
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from bench_search import build_database, describe, measure
+from sync_to_d1 import LANGUAGES
+
+QuizRow = Tuple[str, str, str, str]
+
+# 比較する言語の組み合わせ（/api/quiz の既定は fr-de-es）と出題数（/api/quiz の上限は20）
+LANGUAGE_SETS = [["fr"], ["fr", "de", "es"], LANGUAGES]
+COUNTS = [10, 20]
+
+# 性別の偏りを比べるクイズの出題数
+BALANCE_COUNT = 10
+
+
+def scan_quiz(
+    conn: sqlite3.Connection, languages: Sequence[str], count: int, rng: random.Random
+) -> List[QuizRow]:
+    """従来方式（全候補を読んでシャッフル）"""
+    candidates = []
+    for lang in languages:
+        rows = conn.execute(f"""SELECT en, translation, gender FROM words_{lang}
+                WHERE translation IS NOT NULL AND translation != ''
+                AND gender IN ('m', 'f', 'n')""")
+        candidates += [(en, translation, lang, gender) for en, translation, gender in rows]
+    rng.shuffle(candidates)
+    return candidates[:count]
+
+
+def pool_quiz(
+    conn: sqlite3.Connection, languages: Sequence[str], count: int, rng: random.Random
+) -> List[QuizRow]:
+    """quiz_pool の区間を読む方式"""
+    shuffled = list(languages)
+    rng.shuffle(shuffled)
+    questions = []
+    for i, lang in enumerate(shuffled):
+        take = count // len(shuffled) + (1 if i < count % len(shuffled) else 0)
+        if take == 0:
+            continue
+        rows = conn.execute(
+            """SELECT en, translation, gender FROM quiz_pool
+               WHERE lang = ?
+               AND position >= CAST(? * MAX((SELECT MAX(position) FROM quiz_pool WHERE lang = ?) + 2 - ?, 1) AS INTEGER)
+               ORDER BY position LIMIT ?""",
+            (lang, rng.random(), lang, take, take),
+        )
+        questions += [(en, translation, lang, gender) for en, translation, gender in rows]
+    rng.shuffle(questions)
+    return questions
+
+
+def check_pool(conn: sqlite3.Connection) -> int:
+    """quiz_pool が言語テーブルの候補と一致し position が連番かを確認し、不一致の言語数を返す"""
+    failed = 0
+    for lang in LANGUAGES:
+        rows = conn.execute(
+            "SELECT position, en, translation, gender FROM quiz_pool WHERE lang = ? ORDER BY position",
+            (lang,),
+        ).fetchall()
+        candidates = Counter(conn.execute(f"""SELECT en, translation, gender FROM words_{lang}
+                WHERE translation IS NOT NULL AND translation != ''
+                AND gender IN ('m', 'f', 'n')"""))
+        dense = [position for position, *_ in rows] == list(range(len(rows)))
+        if not dense or Counter(tuple(row[1:]) for row in rows) != candidates:
+            print(f"❌ quiz_pool ({lang}): 連番 {dense}, 行数 {len(rows)} / 候補 {sum(candidates.values())}")
+            failed += 1
+    return failed
+
+
+def gender_deviation(questions: List[QuizRow], ratios: Dict[str, float]) -> float:
+    """各性別の出題数と期待される数（出題数 × 言語全体の割合）の差の最大値"""
+    counts = Counter(gender for *_, gender in questions)
+    return max(abs(counts[gender] - len(questions) * ratio) for gender, ratio in ratios.items())
+
+
+def run_benchmark(conn: sqlite3.Connection, trials: int, seed: int) -> int:
+    sizes = dict(conn.execute("SELECT lang, COUNT(*) FROM quiz_pool GROUP BY lang"))
+    print(f"quiz_pool: {sum(sizes.values())}行 ({', '.join(f'{lang} {n}' for lang, n in sizes.items())})")
+    failed = check_pool(conn)
+    print()
+
+    print(f"{'言語':<26}{'問題数':>6}{'scan ms (平均 / p50 / p95)':>27}{'pool ms':>27}")
+    rng = random.Random(seed)
+    for languages in LANGUAGE_SETS:
+        for count in COUNTS:
+            scan_timings = measure(lambda _: scan_quiz(conn, languages, count, rng), range(trials))
+            pool_timings = measure(lambda _: pool_quiz(conn, languages, count, rng), range(trials))
+            short = sum(len(pool_quiz(conn, languages, count, rng)) != count for _ in range(trials))
+            failed += short
+            print(
+                f"{'-'.join(languages):<26}{count:>6}"
+                + "".join(f"{v:>9.2f}" for v in describe(scan_timings))
+                + "".join(f"{v:>9.3f}" for v in describe(pool_timings))
+                + (f"  ❌ {short}件で問題数が不足" if short else "")
+            )
+    print()
+
+    print(f"性別の偏り（{BALANCE_COUNT}問、期待される数との差の最大値: 平均 / 2以上の割合）")
+    for lang in LANGUAGES:
+        genders = Counter(
+            gender for (gender,) in conn.execute("SELECT gender FROM quiz_pool WHERE lang = ?", (lang,))
+        )
+        ratios = {gender: n / sum(genders.values()) for gender, n in genders.items()}
+        line = f"  {lang}"
+        for name, quiz in (("scan", scan_quiz), ("pool", pool_quiz)):
+            deviations = [
+                gender_deviation(quiz(conn, [lang], BALANCE_COUNT, rng), ratios) for _ in range(trials)
+            ]
+            skewed = sum(deviation >= 2 for deviation in deviations) / trials
+            line += f"  {name} {statistics.mean(deviations):.2f} / {skewed:>5.1%}"
+        print(line)
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quiz generation against precomputed quiz pools")
+    parser.add_argument("--trials", type=int, default=200, help="Quizzes generated per case")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--db", type=Path, help="Reuse or create the SQLite database at this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "quiz.db"
+        if not db_path.exists():
+            build_database(db_path)
+        conn = sqlite3.connect(db_path)
+        try:
+            return run_benchmark(conn, args.trials, args.seed)
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+/api/search の検索クエリのベンチマーク（従来の LIKE '%q%' 走査と search_terms の比較）
+
+sync_to_d1.py --target sqlite と同じ手順で一時 SQLite DB を作り、
+src/lib/db.ts の2つの検索方式を同じ SQL で再現して所要時間を比べる。
+
+- scan: words_en と各言語テーブルを LOWER(...) LIKE '%q%' で走査し、優先順位は行ごとに判定
+  （findMatchesByScan）
+- terms: search_terms の term 索引で完全一致・前方一致を範囲検索し、limit 語に満たない
+  場合だけ部分一致を追加（findMatchesInSearchTerms）。部分一致は3文字以上なら
+  trigram 索引（search_terms_fts）を引く。--no-trigram では常に instr で走査する
+
+部分一致だけの所要時間（instr による走査と trigram 索引）と、両者の結果の一致も確認する。
+
+クエリは英単語・翻訳の全体・先頭・途中の部分文字列から乱数の種を固定して選ぶ。
+上位 limit 語（優先順位→長さ→文字列順）が両方式で一致するかも確認する。
+search_terms はアクセントを除いて比較するため、従来方式の LOWER を fold_search_term に
+置き換えた結果（scan+fold）とは完全に一致し、従来方式との差はアクセント由来のものだけになる。
+
+使い方:
+    python scripts/bench_search.py
+    python scripts/bench_search.py --queries 500 --limit 10 --limit 1000
+    python scripts/bench_search.py --languages fr de --db /tmp/search.db
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import sync_to_d1
+from dataset import load_dataset
+from sync_to_d1 import LANGUAGES, fold_search_term
+
+# 前方一致の上限（src/lib/db.ts の PREFIX_END と同じ）
+PREFIX_END = "\U0010ffff"
+
+# trigram 索引で部分一致を引ける最短の語の長さ（src/lib/db.ts の TRIGRAM_MIN_LENGTH と同じ）
+TRIGRAM_MIN_LENGTH = 3
+
+Matches = Dict[str, float]
+
+
+def build_database(db_path: Path):
+    """sync_to_d1 のローカルSQLite同期（全テーブル）で DB を作る"""
+    if not sync_to_d1.sync_sqlite(db_path, list(sync_to_d1.SYNC_ORDER)):
+        raise RuntimeError(f"SQLite の作成に失敗しました: {db_path}")
+
+
+def match_type(en: str, translation: str, query: str) -> float:
+    """従来方式の行ごとの優先順位（db.ts の matchType と同じ判定）"""
+    if en == query:
+        return 1
+    if translation == query:
+        return 2
+    if len(en) <= 4 and en.startswith(query):
+        return 2.5
+    if en.startswith(query):
+        return 3
+    if translation.startswith(query):
+        return 4
+    return 5
+
+
+def search_scan(
+    conn: sqlite3.Connection, query: str, languages: Sequence[str], fold: Callable[[str], str] = str.lower
+) -> Matches:
+    """従来方式（findMatchesByScan）。fold=fold_search_term でアクセントを無視する"""
+    lower = "fold" if fold is fold_search_term else "LOWER"
+    term = fold(query)
+    pattern = f"%{term}%"
+    priorities: Matches = {}
+    for (en,) in conn.execute(f"SELECT en FROM words_en WHERE {lower}(en) LIKE ?", (pattern,)):
+        priorities[en] = 999
+    for lang in languages:
+        rows = conn.execute(
+            f"""SELECT en, translation FROM words_{lang}
+                WHERE translation IS NOT NULL AND translation != ''
+                AND ({lower}(translation) LIKE ?
+                     OR en IN (SELECT en FROM words_en WHERE {lower}(en) LIKE ?))""",
+            (pattern, pattern),
+        )
+        for en, translation in rows:
+            current = match_type(fold(en), fold(translation), term)
+            priorities[en] = min(priorities.get(en, 999), current)
+    return priorities
+
+
+def contains_condition(term: str, trigram: bool) -> Tuple[str, str]:
+    """search_terms の部分一致の条件とパラメーター（3文字未満は trigram を使わない）"""
+    if trigram and len(term) >= TRIGRAM_MIN_LENGTH:
+        phrase = '"' + term.replace('"', '""') + '"'
+        return ("rowid IN (SELECT rowid FROM search_terms_fts WHERE search_terms_fts MATCH ?)", phrase)
+    return "instr(term, ?) > 0", term
+
+
+def search_terms(
+    conn: sqlite3.Connection, query: str, languages: Sequence[str], limit: int, trigram: bool = True
+) -> Matches:
+    """search_terms 方式（findMatchesInSearchTerms）"""
+    term = fold_search_term(query)
+    placeholders = ",".join("?" * len(languages))
+    language_filter = f"""(s.lang IN ({placeholders}) OR (s.kind = 'headword' AND EXISTS (
+        SELECT 1 FROM search_terms t WHERE t.en = s.en AND t.lang IN ({placeholders}))))"""
+    rows = conn.execute(
+        f"""SELECT s.en, MIN(CASE
+              WHEN s.term = ? THEN (CASE s.kind WHEN 'headword' THEN 1 ELSE 2 END)
+              WHEN s.kind = 'headword' AND LENGTH(s.en) <= 4 THEN 2.5
+              WHEN s.kind = 'headword' THEN 3
+              ELSE 4 END) AS priority
+            FROM search_terms s
+            WHERE s.term >= ? AND s.term < ? AND {language_filter}
+            GROUP BY s.en""",
+        (term, term, term + PREFIX_END, *languages, *languages),
+    )
+    priorities: Matches = dict(rows)
+    if len(priorities) < limit:
+        condition, param = contains_condition(term, trigram)
+        rows = conn.execute(
+            f"""WITH s AS MATERIALIZED (
+                  SELECT en, lang, kind FROM search_terms WHERE {condition}
+                )
+                SELECT DISTINCT s.en FROM s WHERE {language_filter}""",
+            (param, *languages, *languages),
+        )
+        for (en,) in rows:
+            priorities.setdefault(en, 5)
+    return priorities
+
+
+def contains_rows(conn: sqlite3.Connection, query: str, trigram: bool) -> List[int]:
+    """部分一致する search_terms の rowid（部分一致だけの比較用）"""
+    condition, param = contains_condition(fold_search_term(query), trigram)
+    rows = conn.execute(f"SELECT rowid FROM search_terms WHERE {condition}", (param,))
+    return sorted(rowid for (rowid,) in rows)
+
+
+def top_words(priorities: Matches, limit: int) -> List[str]:
+    """search() と同じ並び順で上位 limit 語を返す（翻訳のない語 = 999 は結果から外れる）"""
+    words = sorted(priorities, key=lambda en: (priorities[en], len(en), en))
+    return [en for en in words[:limit] if priorities[en] != 999]
+
+
+def sample_queries(count: int, languages: Sequence[str], seed: int) -> List[str]:
+    """英単語・翻訳の全体、先頭2〜4文字、途中の3〜5文字から検索語を選ぶ"""
+    ds = load_dataset()
+    words = sorted({w.en.strip().lower() for w in ds.words if w.en.strip()})
+    translations = sorted(
+        {
+            row.translation.strip()
+            for lang in languages
+            for row in ds.translations.get(lang, [])
+            if row.translation.strip()
+        }
+    )
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        text = rng.choice(words if i % 2 == 0 else translations)
+        shape = i % 3
+        if shape == 1 and len(text) > 2:
+            text = text[: rng.randint(2, min(4, len(text)))]
+        elif shape == 2 and len(text) > 5:
+            size = rng.randint(3, 5)
+            start = rng.randint(1, len(text) - size)
+            text = text[start : start + size]
+        queries.append(text)
+    return queries
+
+
+def measure(run: Callable[[str], Matches], queries: List[str]) -> List[float]:
+    """各クエリの所要時間（ミリ秒）"""
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def describe(timings: List[float]) -> Tuple[float, float, float]:
+    """平均・p50・p95（ミリ秒）"""
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return statistics.mean(ordered), statistics.median(ordered), p95
+
+
+def print_plans(conn: sqlite3.Connection, languages: Sequence[str]):
+    """両方式の主要クエリの実行計画"""
+    placeholders = ",".join("?" * len(languages))
+    plans = {
+        f"scan: words_{languages[0]}": (
+            f"""SELECT en, translation FROM words_{languages[0]}
+                WHERE translation IS NOT NULL AND translation != ''
+                AND (LOWER(translation) LIKE ?
+                     OR en IN (SELECT en FROM words_en WHERE LOWER(en) LIKE ?))""",
+            ("%cat%", "%cat%"),
+        ),
+        "terms: prefix": (
+            f"""SELECT s.en FROM search_terms s
+                WHERE s.term >= ? AND s.term < ? AND (s.lang IN ({placeholders})
+                OR (s.kind = 'headword' AND EXISTS (SELECT 1 FROM search_terms t
+                    WHERE t.en = s.en AND t.lang IN ({placeholders}))))
+                GROUP BY s.en""",
+            ("cat", "cat" + PREFIX_END, *languages, *languages),
+        ),
+        "terms: contains (trigram)": (
+            f"SELECT rowid FROM search_terms WHERE {contains_condition('ati', True)[0]}",
+            contains_condition("ati", True)[1:],
+        ),
+    }
+    for name, (sql, params) in plans.items():
+        print(f"  {name}")
+        for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+            print(f"    {row[-1]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LIKE scans against the search_terms table")
+    parser.add_argument("--queries", type=int, default=300, help="Number of queries (default: 300)")
+    parser.add_argument(
+        "--limit", type=int, action="append", help="Result limit (repeatable, default: 10 and 1000)"
+    )
+    parser.add_argument(
+        "--languages", nargs="+", default=LANGUAGES, choices=LANGUAGES, help="Search languages (default: all)"
+    )
+    parser.add_argument(
+        "--no-trigram",
+        action="store_true",
+        help="Use instr() scans for contains matches instead of search_terms_fts",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--db", type=Path, help="Reuse or create the SQLite database at this path")
+    args = parser.parse_args()
+    limits = args.limit or [10, 1000]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "search.db"
+        if not db_path.exists():
+            build_database(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.create_function("fold", 1, fold_search_term, deterministic=True)
+        try:
+            return run_benchmark(conn, args, limits)
+        finally:
+            conn.close()
+
+
+def run_benchmark(conn: sqlite3.Connection, args, limits: List[int]) -> int:
+    languages = args.languages
+    trigram = not args.no_trigram
+    queries = sample_queries(args.queries, languages, args.seed)
+    terms_count = conn.execute("SELECT COUNT(*) FROM search_terms").fetchone()[0]
+    print(f"search_terms: {terms_count:,}行, 言語: {', '.join(languages)}")
+    print(f"クエリ: {len(queries)}件 (seed={args.seed})")
+    print()
+
+    scan_timings = measure(lambda q: search_scan(conn, q, languages), queries)
+    print(f"{'方式':<20}{'平均ms':>10}{'p50ms':>10}{'p95ms':>10}")
+    print(f"{'scan':<20}" + "".join(f"{v:>10.2f}" for v in describe(scan_timings)))
+    for limit in limits:
+        timings = measure(lambda q: search_terms(conn, q, languages, limit, trigram), queries)
+        label = f"terms (limit={limit})"
+        print(f"{label:<20}" + "".join(f"{v:>10.2f}" for v in describe(timings)))
+    print()
+
+    # 上位 limit 語の比較（アクセントを無視した従来方式とは完全一致するはず）
+    failed = 0
+    for limit in limits:
+        mismatches = accent_only = 0
+        for query in queries:
+            expected = top_words(search_scan(conn, query, languages, fold_search_term), limit)
+            actual = top_words(search_terms(conn, query, languages, limit, trigram), limit)
+            if actual != expected:
+                mismatches += 1
+                print(f"❌ 不一致 (limit={limit}): {query!r}")
+                print(f"  scan+fold: {expected[:10]}")
+                print(f"  terms:     {actual[:10]}")
+            elif actual != top_words(search_scan(conn, query, languages), limit):
+                accent_only += 1
+        print(
+            f"limit={limit}: 上位語の一致 {len(queries) - mismatches}/{len(queries)}件"
+            f"（従来方式との差はアクセントのみ: {accent_only}件）"
+        )
+        failed += mismatches
+    print()
+
+    # 部分一致だけの比較（trigram 索引を引ける3文字以上のクエリ）
+    long_queries = [q for q in queries if len(fold_search_term(q)) >= TRIGRAM_MIN_LENGTH]
+    print(f"部分一致のみ（{TRIGRAM_MIN_LENGTH}文字以上のクエリ {len(long_queries)}件）")
+    for label, use_trigram in (("instr", False), ("trigram", True)):
+        timings = measure(lambda q: contains_rows(conn, q, use_trigram), long_queries)
+        print(f"{label:<20}" + "".join(f"{v:>10.2f}" for v in describe(timings)))
+    differ = [q for q in long_queries if contains_rows(conn, q, True) != contains_rows(conn, q, False)]
+    for query in differ:
+        print(f"❌ 部分一致の不一致: {query!r}")
+    print(f"部分一致の一致: {len(long_queries) - len(differ)}/{len(long_queries)}件")
+    failed += len(differ)
+    print()
+
+    print("実行計画:")
+    print_plans(conn, languages)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+単語ページ（getWord）のベンチマーク（テーブルからの組み立てと word_docs の比較）
+
+bench_search.py と同じく一時 SQLite DB を作り、src/lib/db.ts の getWord の2つの方式を
+同じ SQL で再現して、全単語について結果（WordData）が一致するかを確認する。
+
+- tables: 意味 → 各言語の翻訳 → 言語ごとの覚え方 → 例文翻訳の順にクエリを発行して組み立てる
+- docs: word_docs の1行を読んで JSON を解析する
+
+D1 ではクエリ1回ごとに往復が発生するため、所要時間に加えて1ページあたりのクエリ数も表示する。
+word_docs の全単語分の生成時間（rows_word_docs。CSVの読み込みを含む）も計測する。
+
+使い方:
+    python scripts/bench_word_docs.py
+    python scripts/bench_word_docs.py --db /tmp/search.db
+"""
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import sync_to_d1
+from bench_search import build_database, describe, measure
+from sync_to_d1 import DOC_LANGUAGES, UI_LANGUAGES
+
+# 存在しない単語（null を返すことも比較する）
+MISSING_WORDS = ["qwertyuiop", "notaword"]
+
+
+def word_from_tables(conn: sqlite3.Connection, word: str) -> Tuple[Optional[dict], int]:
+    """従来の getWord（テーブルから組み立てる）。(WordData, クエリ数) を返す"""
+    queries = 1
+    conn.row_factory = sqlite3.Row
+    meaning = conn.execute(
+        """SELECT wm.*, ex.example_en
+           FROM word_meanings wm
+           LEFT JOIN examples ex ON wm.en = ex.en
+           WHERE LOWER(wm.en) = LOWER(?)""",
+        (word,),
+    ).fetchone()
+    if meaning is None:
+        queries += 1
+        row = conn.execute("SELECT en FROM words_en WHERE LOWER(en) = LOWER(?)", (word,)).fetchone()
+        if row is None:
+            return None, queries
+        english = row["en"]
+    else:
+        english = meaning["en"]
+
+    translations = []
+    for lang in DOC_LANGUAGES:
+        queries += 1
+        row = conn.execute(
+            f"""SELECT t.translation, t.gender FROM words_{lang} t
+                WHERE LOWER(t.en) = LOWER(?)
+                  AND t.translation IS NOT NULL AND t.translation != ''""",
+            (english,),
+        ).fetchone()
+        if row is None or not row["translation"] or row["gender"] not in ("m", "f", "n"):
+            continue
+        queries += 1
+        tricks = {
+            t["ui_lang"]: t["trick_text"]
+            for t in conn.execute(
+                """SELECT ui_lang, trick_text FROM memory_tricks
+                   WHERE en = ? AND translation_lang = ?""",
+                (english, lang),
+            )
+        }
+        entry = {
+            "id": 0,
+            "word_id": 0,
+            "language": lang,
+            "translation": row["translation"],
+            "gender": row["gender"],
+        }
+        entry.update((f"memory_trick_{ui}", tricks[ui]) for ui in UI_LANGUAGES if ui in tricks)
+        translations.append(entry)
+    if not translations:
+        return None, queries
+
+    data = {"english": english}
+    if meaning is not None:
+        data["meaning_en"] = meaning["meaning_en"]
+        data["meanings"] = {
+            lang: meaning[f"meaning_{lang}"]
+            for lang in UI_LANGUAGES
+            if meaning[f"meaning_{lang}"] not in (None, "")
+        }
+    else:
+        data["meanings"] = {}
+    data["translations"] = translations
+    if meaning is not None and meaning["example_en"]:
+        queries += 1
+        rows = conn.execute(
+            "SELECT lang, translation FROM example_translations WHERE example_en = ?",
+            (meaning["example_en"],),
+        )
+        data["example"] = {
+            "example_en": meaning["example_en"],
+            "example_translations": {r["lang"]: r["translation"] for r in rows},
+        }
+    return data, queries
+
+
+def word_from_docs(conn: sqlite3.Connection, word: str) -> Optional[dict]:
+    """word_docs を使う getWord（1クエリ）"""
+    row = conn.execute("SELECT doc FROM word_docs WHERE en = ?", (word.lower(),)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def run_benchmark(conn: sqlite3.Connection) -> int:
+    words = [en for (en,) in conn.execute("SELECT en FROM words_en ORDER BY en")]
+    words += MISSING_WORDS + [words[0].upper()]
+
+    start = time.perf_counter()
+    docs = sum(1 for _ in sync_to_d1.rows_word_docs())
+    build_seconds = time.perf_counter() - start
+    doc_bytes = conn.execute("SELECT SUM(LENGTH(CAST(doc AS BLOB))) FROM word_docs").fetchone()[0]
+    print(f"word_docs: {docs}語, {doc_bytes:,} bytes, 生成 {build_seconds:.2f}秒")
+    print(f"単語: {len(words)}件（存在しない単語 {len(MISSING_WORDS) + 1}件を含む）")
+    print()
+
+    query_counts = [word_from_tables(conn, word)[1] for word in words]
+    table_timings = measure(lambda word: word_from_tables(conn, word), words)
+    doc_timings = measure(lambda word: word_from_docs(conn, word), words)
+    print(f"{'方式':<10}{'クエリ数':>10}{'平均ms':>10}{'p50ms':>10}{'p95ms':>10}")
+    print(
+        f"{'tables':<10}{statistics.mean(query_counts):>10.1f}"
+        + "".join(f"{v:>10.3f}" for v in describe(table_timings))
+        + f"  (最大 {max(query_counts)}クエリ)"
+    )
+    print(f"{'docs':<10}{1:>10.1f}" + "".join(f"{v:>10.3f}" for v in describe(doc_timings)))
+    print()
+
+    differ = [word for word in words if word_from_tables(conn, word)[0] != word_from_docs(conn, word)]
+    for word in differ[:5]:
+        print(f"❌ 不一致: {word}")
+        print(f"  tables: {word_from_tables(conn, word)[0]}")
+        print(f"  docs:   {word_from_docs(conn, word)}")
+    print(f"WordData の一致: {len(words) - len(differ)}/{len(words)}件")
+    return 1 if differ else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the word page queries against word_docs")
+    parser.add_argument("--db", type=Path, help="Reuse or create the SQLite database at this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "word_docs.db"
+        if not db_path.exists():
+            build_database(db_path)
+        conn = sqlite3.connect(db_path)
+        try:
+            return run_benchmark(conn)
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
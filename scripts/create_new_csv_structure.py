@@ -6,6 +6,8 @@
 
 import csv
 
+from dataset import load_dataset
+
 # 対象言語
 LANGUAGES = ["fr", "de", "es", "it", "pt", "ru", "ar", "hi", "ja", "zh"]
 
@@ -14,11 +16,9 @@ def create_language_files():
     """words.csvから各言語用のCSVファイルを作成"""
 
     # words.csvから英単語とmeaning_enを読み込む
-    words = []
-    with open("data/words.csv", "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for row in reader:
-            words.append({"en": row["en"], "meaning_en": row["meaning_en"]})
+    words = [
+        {"en": word.en, "meaning_en": word.meaning_en} for word in load_dataset().words
+    ]
 
     print(f"✅ words.csv読み込み: {len(words)}語")
 
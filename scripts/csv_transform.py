@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+ストリーミング・アトミックな CSV 一括変換
+
+データ修正スクリプト（不要語の削除、セミコロン区切りの重複削除など）の行単位の
+処理を変換（Transform）として組み合わせ、ファイルごとに1回の読み込みと1回の
+書き込みで全変換を適用する。
+
+- 行は1行ずつ読み、同じディレクトリの一時ファイルに書き出してから os.replace で
+  置き換える。途中で失敗しても元のファイルは壊れない
+- 変更がなかった行は読み込んだ元のバイト列（改行コードを含む）のまま書き出す。
+  1行も変わらなかったファイルは書き換えない（mtime も変わらない）
+- 重複判定はすべて set で行う
+- 列は位置ではなくヘッダー名で参照するため、ファイルごとの列構成の違いに依存しない
+- 複数ファイル（translations_{lang}.csv など）はプロセスプールで並列に処理する
+
+変換の追加:
+    class MyTransform(Transform):
+        name = "my_transform"
+        columns = ("translation",)       # この列がないファイルには適用しない
+
+        def apply(self, row):
+            row["translation"] = row["translation"].replace("  ", " ")
+            return row                   # None を返すと行を削除
+
+使い方:
+    python scripts/csv_transform.py --strip --dedupe meaning_translation --dry-run
+    python scripts/csv_transform.py --delete-words ass,bum --normalize-gender
+    python scripts/csv_transform.py --dedupe-rows data/translations_fr.csv
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from dataset import DATA_DIR, source_files
+
+Row = Dict[str, str]
+
+
+class Transform:
+    """行の変換の基底クラス
+
+    apply は行（列名 → 値の dict）を受け取り、変更した行（その場で書き換えてよい）か、
+    行を削除するなら None を返す。begin はファイルごとに呼ばれ、ファイル単位の状態
+    （重複判定の set など）を初期化する。
+    """
+
+    name = ""
+    # 必須の列。ヘッダーにない場合はそのファイルには適用しない
+    columns: Tuple[str, ...] = ()
+
+    def begin(self, header: List[str]) -> bool:
+        """ファイルの処理開始時に呼ばれる。False を返すとこのファイルには適用しない"""
+        return all(column in header for column in self.columns)
+
+    def apply(self, row: Row) -> Optional[Row]:
+        raise NotImplementedError
+
+
+def dedupe_list(value: str, separator: str = ";") -> str:
+    """区切り文字で並んだ値の重複を削除（大文字小文字の区別なし、左を優先）
+
+    残す要素は元の形式（大文字小文字・前後の空白）のまま。空の要素は削除する。
+    """
+    if not value or separator not in value:
+        return value
+    seen = set()
+    result = []
+    for part in value.split(separator):
+        key = part.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            result.append(part)
+    return separator.join(result)
+
+
+class DeleteWords(Transform):
+    """en が指定の単語の行を削除"""
+
+    name = "delete_words"
+    columns = ("en",)
+
+    def __init__(self, words: Iterable[str]):
+        self.words = {word.strip().lower() for word in words}
+
+    def apply(self, row: Row) -> Optional[Row]:
+        return None if row["en"].strip().lower() in self.words else row
+
+
+class StripWhitespace(Transform):
+    """セルの前後の空白を削除（columns を省略すると全列）"""
+
+    name = "strip"
+
+    def __init__(self, columns: Optional[Iterable[str]] = None):
+        self.targets = tuple(columns) if columns else None
+
+    def begin(self, header: List[str]) -> bool:
+        self.active = [c for c in (self.targets or header) if c in header]
+        return bool(self.active)
+
+    def apply(self, row: Row) -> Optional[Row]:
+        for column in self.active:
+            row[column] = row[column].strip()
+        return row
+
+
+class NormalizeGender(Transform):
+    """gender 列を小文字にそろえる（"M " → "m"）"""
+
+    name = "normalize_gender"
+    columns = ("gender",)
+
+    def apply(self, row: Row) -> Optional[Row]:
+        row["gender"] = row["gender"].strip().lower()
+        return row
+
+
+class DedupeList(Transform):
+    """セミコロン区切りの列の中の重複を削除（dedupe_list）"""
+
+    name = "dedupe"
+
+    def __init__(self, columns: Iterable[str], separator: str = ";"):
+        self.targets = tuple(columns)
+        self.separator = separator
+
+    def begin(self, header: List[str]) -> bool:
+        self.active = [c for c in self.targets if c in header]
+        return bool(self.active)
+
+    def apply(self, row: Row) -> Optional[Row]:
+        for column in self.active:
+            row[column] = dedupe_list(row[column], self.separator)
+        return row
+
+
+# 行の同一性を決める列（ファイルにあるものだけを使う）
+KEY_COLUMNS = ("en", "lang", "target_lang", "ui_lang")
+
+
+class DropDuplicateRows(Transform):
+    """キー列（en、言語列）が同じ2行目以降を削除（大文字小文字の区別なし、先頭を優先）"""
+
+    name = "dedupe_rows"
+    columns = ("en",)
+
+    def begin(self, header: List[str]) -> bool:
+        self.key = [c for c in KEY_COLUMNS if c in header]
+        self.seen = set()
+        return super().begin(header)
+
+    def apply(self, row: Row) -> Optional[Row]:
+        key = tuple(row[c].strip().lower() for c in self.key)
+        if key in self.seen:
+            return None
+        self.seen.add(key)
+        return row
+
+
+class Change(NamedTuple):
+    """変換による1行の変更（after が None なら削除）"""
+
+    line: int
+    en: str
+    transform: str
+    before: Dict[str, str]
+    after: Optional[Dict[str, str]]
+
+
+class FileResult(NamedTuple):
+    """1ファイルの処理結果"""
+
+    path: str
+    rows: int
+    kept: int
+    written: bool
+    seconds: float
+    applied: List[str]
+    counts: Dict[str, int]
+    changes: List[Change]
+
+
+def read_raw_rows(f) -> Iterator[Tuple[str, List[str]]]:
+    """(元の行のテキスト, 解析した列) を1行ずつ返す
+
+    csv.reader が消費した物理行をそのまま記録するため、引用符の中の改行を含む行でも
+    元のテキストを取り出せる。
+    """
+    consumed: List[str] = []
+
+    def lines():
+        for line in f:
+            consumed.append(line)
+            yield line
+
+    for fields in csv.reader(lines(), delimiter="\t"):
+        raw = "".join(consumed)
+        consumed.clear()
+        yield raw, fields
+
+
+def line_ending(raw: str) -> str:
+    """行の改行コード（ファイル末尾の改行のない行は空文字）"""
+    if raw.endswith("\r\n"):
+        return "\r\n"
+    return "\n" if raw.endswith("\n") else ""
+
+
+def transform_file(path: Path, transforms: List[Transform], dry_run: bool = False) -> FileResult:
+    """1ファイルに全変換を1回の走査で適用し、一時ファイル経由で置き換える
+
+    dry_run=True なら書き込まずに変更内容だけを返す。
+    """
+    start = time.perf_counter()
+    path = Path(path)
+    counts = {t.name: 0 for t in transforms}
+    changes: List[Change] = []
+    rows = kept = 0
+    changed = False
+
+    if dry_run:
+        tmp_path = None
+        out = open(os.devnull, "w", encoding="utf-8", newline="")
+    else:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        out = open(fd, "w", encoding="utf-8", newline="")
+
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f, out:
+            reader = read_raw_rows(f)
+            header_raw, header = next(reader, ("", []))
+            out.write(header_raw)
+            active = [t for t in transforms if t.begin(header)]
+            # 変更した行は元の行と同じ改行コードで書き出す
+            writers = {
+                ending: csv.writer(out, delimiter="\t", lineterminator=ending)
+                for ending in ("\n", "\r\n", "")
+            }
+
+            for line, (raw, fields) in enumerate(reader, 2):
+                if not fields:
+                    out.write(raw)
+                    continue
+                rows += 1
+                row = {column: fields[i] if i < len(fields) else "" for i, column in enumerate(header)}
+                original = dict(row)
+                for transform in active:
+                    before = dict(row)
+                    result = transform.apply(row)
+                    if result is None:
+                        counts[transform.name] += 1
+                        changes.append(Change(line, original.get("en", ""), transform.name, before, None))
+                        row = None
+                        break
+                    row = result
+                    if row != before:
+                        counts[transform.name] += 1
+                        diff = [c for c in row if row[c] != before.get(c)]
+                        changes.append(
+                            Change(
+                                line,
+                                original.get("en", ""),
+                                transform.name,
+                                {c: before.get(c, "") for c in diff},
+                                {c: row[c] for c in diff},
+                            )
+                        )
+
+                if row is None:
+                    changed = True
+                    continue
+                kept += 1
+                if row == original:
+                    out.write(raw)
+                else:
+                    changed = True
+                    # ヘッダーより列の多い行は余分な列をそのまま残す
+                    writers[line_ending(raw)].writerow([row[c] for c in header] + fields[len(header) :])
+
+            if tmp_path is not None:
+                out.flush()
+                os.fsync(out.fileno())
+
+        if tmp_path is not None and changed:
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+            tmp_path = None
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+    return FileResult(
+        path=str(path),
+        rows=rows,
+        kept=kept,
+        written=changed and not dry_run,
+        seconds=round(time.perf_counter() - start, 4),
+        applied=[t.name for t in active],
+        counts=counts,
+        changes=changes,
+    )
+
+
+def transform_files(
+    paths: List[Path], transforms: List[Transform], dry_run: bool = False, workers: Optional[int] = None
+) -> List[FileResult]:
+    """複数ファイルを並列に変換（結果は paths の順）
+
+    workers=1 ならプロセスプールを使わずに順に処理する。変換はファイルごとに
+    begin で初期化されるため、同じインスタンスを複数ファイルで共有してよい。
+    """
+    workers = workers or min(len(paths), os.cpu_count() or 1) or 1
+    if workers == 1:
+        return [transform_file(path, transforms, dry_run) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(transform_file, path, transforms, dry_run) for path in paths]
+        return [future.result() for future in futures]
+
+
+def data_files(data_dir: Path = DATA_DIR, kinds: Optional[List[str]] = None) -> List[Path]:
+    """対象のデータファイル（存在するもののみ）
+
+    kinds はファイル種別（"words", "translations", "example_translations",
+    "memory_tricks"）。省略すると全種別。
+    """
+    files = []
+    for kind, path in source_files(Path(data_dir)).values():
+        if (kinds is None or kind in kinds) and path.exists():
+            files.append(path)
+    return files
+
+
+def print_results(results: List[FileResult], dry_run: bool, detail: int = 5):
+    """ファイルごとの変更件数と変更例を表示"""
+    for result in results:
+        total = sum(result.counts.values())
+        if dry_run:
+            status = "変更予定" if total else "変更なし"
+        else:
+            status = "書き換え" if result.written else "変更なし"
+        mark = "✏️ " if total else "✅"
+        print(
+            f"{mark} {Path(result.path).name}: {result.rows}行 → {result.kept}行, "
+            f"{status} ({result.seconds * 1000:.0f} ms)"
+        )
+        for name, count in result.counts.items():
+            if count:
+                print(f"  [{name}] {count}件")
+        for change in result.changes[:detail]:
+            if change.after is None:
+                print(f"    Line {change.line}: {change.en} - 削除 ({change.transform})")
+            else:
+                for column, before in change.before.items():
+                    print(
+                        f"    Line {change.line}: {change.en} {column}: "
+                        f"{before!r} → {change.after[column]!r}"
+                    )
+        if len(result.changes) > detail:
+            print(f"    ... and {len(result.changes) - detail} more")
+
+    deleted = sum(r.rows - r.kept for r in results)
+    changed = sum(sum(r.counts.values()) for r in results)
+    written = sum(1 for r in results if r.written)
+    print(
+        f"\n🧹 {len(results)}ファイル: 変更 {changed}件（うち削除 {deleted}行）, "
+        f"書き換え {written}ファイル" + (" （ドライラン: 書き込みなし）" if dry_run else "")
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Apply row transforms to data CSVs in one streaming, atomic pass per file"
+    )
+    parser.add_argument(
+        "files", nargs="*", type=Path, help="CSV files to transform (default: every translations_{lang}.csv)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Transform every data file (words, translations, examples, memory tricks)",
+    )
+    parser.add_argument("--delete-words", type=str, help="Comma-separated words whose rows are deleted")
+    parser.add_argument("--strip", action="store_true", help="Strip whitespace around every cell")
+    parser.add_argument("--normalize-gender", action="store_true", help="Lower-case the gender column")
+    parser.add_argument(
+        "--dedupe",
+        action="append",
+        metavar="COLUMN",
+        help="Remove duplicates inside a semicolon-separated column (repeatable)",
+    )
+    parser.add_argument(
+        "--dedupe-rows",
+        action="store_true",
+        help="Drop rows whose en (and language columns) repeat an earlier row",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per file, up to the CPU count)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing")
+    args = parser.parse_args()
+
+    # 変換は指定した順ではなく、削除 → 整形 → 重複削除 の順に適用する
+    transforms: List[Transform] = []
+    if args.delete_words:
+        transforms.append(DeleteWords(args.delete_words.split(",")))
+    if args.strip:
+        transforms.append(StripWhitespace())
+    if args.normalize_gender:
+        transforms.append(NormalizeGender())
+    if args.dedupe:
+        transforms.append(DedupeList(args.dedupe))
+    if args.dedupe_rows:
+        transforms.append(DropDuplicateRows())
+    if not transforms:
+        parser.print_help()
+        return 1
+
+    if args.files:
+        paths = args.files
+    elif args.all:
+        paths = data_files()
+    else:
+        paths = data_files(kinds=["translations"])
+    missing = [str(p) for p in paths if not p.exists()]
+    if missing:
+        print(f"❌ ファイルが存在しません: {', '.join(missing)}")
+        return 1
+
+    print(f"🧹 {len(paths)}ファイルに適用: {', '.join(t.name for t in transforms)}")
+    results = transform_files(paths, transforms, args.dry_run, args.workers)
+    print_results(results, args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+wrangler d1 execute の並列実行エンジン
+
+SQLチャンクファイルをジョブとして受け取り、依存関係（外部キー順）を守りながら
+asyncio で並列に wrangler を実行する。一時的な失敗は指数バックオフで再試行する。
+
+wrangler コマンドは環境変数 WRANGLER で差し替えられる（テスト用の
+scripts/fake_wrangler.py など）:
+    WRANGLER="python3 scripts/fake_wrangler.py" python3 scripts/sync_to_d1.py
+"""
+
+import asyncio
+import os
+import random
+import shlex
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_WRANGLER = "npx wrangler"
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# 再試行しても結果が変わらないエラー（SQLの誤りなど）
+PERMANENT_ERROR_MARKERS = ("SQLITE_ERROR", "SQLITE_CONSTRAINT", "syntax error")
+
+
+class D1Error(Exception):
+    """wrangler 実行の失敗"""
+
+    def __init__(self, message: str, transient: bool = True):
+        super().__init__(message)
+        self.transient = transient
+
+
+@dataclass
+class Job:
+    """1回の wrangler 実行に相当する作業単位
+
+    SQLはメモリに持たず、sql_file（1チャンク分のSQLファイル）をそのまま wrangler に渡す。
+    skip=True のジョブ（前回の実行で適用済み）は実行せず成功扱いにする。
+    started / finished（time.perf_counter）と retries は実行時に設定される。
+    deps にはジョブ名またはグループ名を指定する。グループ名を指定した場合は
+    そのグループの全ジョブの完了を待つ。
+    """
+
+    name: str
+    sql_file: Path
+    group: str
+    deps: List[str] = field(default_factory=list)
+    skip: bool = False
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    retries: int = 0
+
+
+class D1Executor:
+    """wrangler d1 execute を並列・再試行付きで実行する"""
+
+    def __init__(
+        self,
+        database: str,
+        cwd: Optional[Path] = None,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        wrangler: Optional[str] = None,
+    ):
+        self.database = database
+        self.cwd = cwd
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.command = shlex.split(wrangler or os.environ.get("WRANGLER", DEFAULT_WRANGLER))
+        # ラベル（ジョブ名）ごとの再試行回数。失敗したジョブの分も数える
+        self.retry_counts: Dict[str, int] = {}
+
+    async def execute_once(self, sql_file: Path):
+        """SQLファイルを1回実行（失敗時は D1Error）"""
+        proc = await asyncio.create_subprocess_exec(
+            *self.command,
+            "d1",
+            "execute",
+            self.database,
+            "--remote",
+            f"--file={Path(sql_file).resolve()}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.cwd,
+        )
+        stdout, stderr = await proc.communicate()
+
+        out = stdout.decode("utf-8", "replace")
+        err = stderr.decode("utf-8", "replace")
+        if proc.returncode != 0 or "ERROR" in out:
+            message = (err or out).strip()
+            transient = not any(marker in out + err for marker in PERMANENT_ERROR_MARKERS)
+            raise D1Error(message, transient)
+
+    async def execute(self, sql_file: Path, label: str = "") -> int:
+        """一時的な失敗を指数バックオフで再試行しながら実行。再試行回数を返す"""
+        attempt = 0
+        while True:
+            try:
+                await self.execute_once(sql_file)
+                return attempt
+            except D1Error as e:
+                if not e.transient or attempt >= self.retries:
+                    raise
+                delay = min(BACKOFF_MAX, self.backoff_base * (2**attempt)) * random.uniform(0.5, 1.0)
+                attempt += 1
+                self.retry_counts[label] = attempt
+                print(f"  Retry {attempt}/{self.retries} for {label} in {delay:.1f}s: {str(e)[:200]}")
+                await asyncio.sleep(delay)
+
+    async def run_jobs(
+        self,
+        jobs: List[Job],
+        on_group_done: Optional[Callable[[str], None]] = None,
+        on_job_done: Optional[Callable[[Job], None]] = None,
+    ) -> Dict[str, bool]:
+        """依存関係を守りながらジョブを並列実行し、ジョブ名→成否を返す
+
+        依存先が失敗したジョブは実行せず失敗扱いにする。依存関係のない
+        ジョブは他の失敗に関係なく最後まで実行する。on_job_done は実際に
+        実行して成功したジョブごとに、on_group_done はグループの全ジョブが
+        成功した時点で呼ばれる。
+        """
+        groups: Dict[str, List[str]] = {}
+        for job in jobs:
+            groups.setdefault(job.group, []).append(job.name)
+
+        semaphore = asyncio.Semaphore(self.workers)
+        tasks: Dict[str, asyncio.Task] = {}
+        remaining = {group: len(names) for group, names in groups.items()}
+        group_ok = {group: True for group in groups}
+
+        job_names = {job.name for job in jobs}
+
+        def dep_names(job: Job) -> List[str]:
+            names = []
+            for dep in job.deps:
+                if dep in groups:
+                    names.extend(groups[dep])
+                elif dep in job_names:
+                    names.append(dep)
+                else:
+                    raise ValueError(f"Unknown dependency '{dep}' for job {job.name}")
+            return names
+
+        async def run(job: Job, deps: List[asyncio.Task]) -> bool:
+            results = await asyncio.gather(*deps)
+            ok = all(results)
+            if ok and not job.skip:
+                async with semaphore:
+                    job.started = time.perf_counter()
+                    try:
+                        await self.execute(job.sql_file, job.name)
+                    except D1Error as e:
+                        print(f"  Failed {job.name}: {str(e)[:500]}")
+                        ok = False
+                    job.finished = time.perf_counter()
+                    job.retries = self.retry_counts.get(job.name, 0)
+                if ok and on_job_done:
+                    on_job_done(job)
+            elif not ok:
+                print(f"  Skipped {job.name} (dependency failed)")
+
+            remaining[job.group] -= 1
+            group_ok[job.group] = group_ok[job.group] and ok
+            if remaining[job.group] == 0 and group_ok[job.group] and on_group_done:
+                on_group_done(job.group)
+            return ok
+
+        # 依存先のタスクが作成済みのジョブから順にタスク化（トポロジカル順）
+        pending = list(jobs)
+        while pending:
+            ready = [job for job in pending if all(name in tasks for name in dep_names(job))]
+            if not ready:
+                raise ValueError(f"Cyclic dependency among jobs: {[job.name for job in pending]}")
+            for job in ready:
+                tasks[job.name] = asyncio.create_task(run(job, [tasks[name] for name in dep_names(job)]))
+            pending = [job for job in pending if job.name not in tasks]
+
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks.keys(), results))
+
+
+def run_jobs(
+    jobs: List[Job],
+    on_group_done: Optional[Callable[[str], None]] = None,
+    on_job_done: Optional[Callable[[Job], None]] = None,
+    **kwargs,
+) -> bool:
+    """同期コードから呼ぶためのラッパー。全ジョブ成功なら True"""
+    executor = D1Executor(**kwargs)
+    results = asyncio.run(executor.run_jobs(jobs, on_group_done, on_job_done))
+    return all(results.values())
@@ -2,6 +2,13 @@
 -- 外部キー制約なし（D1インポート用）
 
 -- Drop existing tables (reverse order of dependencies)
+DROP TABLE IF EXISTS dataset_stats;
+DROP TABLE IF EXISTS quiz_pool;
+DROP TABLE IF EXISTS word_docs;
+DROP TABLE IF EXISTS letter_prefixes;
+DROP TABLE IF EXISTS word_positions;
+DROP TABLE IF EXISTS search_terms_fts;
+DROP TABLE IF EXISTS search_terms;
 DROP TABLE IF EXISTS example_translations;
 DROP TABLE IF EXISTS examples;
 DROP TABLE IF EXISTS word_meanings;
@@ -146,6 +153,85 @@ CREATE TABLE IF NOT EXISTS words_hi (
   confidence_score INTEGER
 );
 
+-- Search index (scripts/sync_to_d1.py rows_search_terms)
+-- term は正規化した語（小文字、ラテン文字のアクセントなし）。kind は headword / translation / alternative
+CREATE TABLE IF NOT EXISTS search_terms (
+  term TEXT NOT NULL,
+  lang TEXT NOT NULL,
+  en TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  PRIMARY KEY (term, lang, en)
+);
+
+-- search_terms の部分一致用の trigram 索引（外部コンテンツ。term は正規化済みのため大文字小文字を区別する）
+-- 行の追加・削除・更新はトリガーで反映する。3文字未満の部分一致は search_terms を走査する
+CREATE VIRTUAL TABLE IF NOT EXISTS search_terms_fts USING fts5(
+  term,
+  content = 'search_terms',
+  tokenize = 'trigram case_sensitive 1'
+);
+
+CREATE TRIGGER IF NOT EXISTS search_terms_fts_insert AFTER INSERT ON search_terms BEGIN
+  INSERT INTO search_terms_fts (rowid, term) VALUES (new.rowid, new.term);
+END;
+
+CREATE TRIGGER IF NOT EXISTS search_terms_fts_delete AFTER DELETE ON search_terms BEGIN
+  INSERT INTO search_terms_fts (search_terms_fts, rowid, term) VALUES ('delete', old.rowid, old.term);
+END;
+
+CREATE TRIGGER IF NOT EXISTS search_terms_fts_update AFTER UPDATE ON search_terms BEGIN
+  INSERT INTO search_terms_fts (search_terms_fts, rowid, term) VALUES ('delete', old.rowid, old.term);
+  INSERT INTO search_terms_fts (rowid, term) VALUES (new.rowid, new.term);
+END;
+
+-- Browse positions (scripts/sync_to_d1.py rows_word_positions)
+-- sort_rank は words_en 全体での並び順、nav_rank は翻訳がある単語だけでの並び順（1始まりの連番、翻訳がなければ NULL）
+CREATE TABLE IF NOT EXISTS word_positions (
+  en TEXT PRIMARY KEY NOT NULL,
+  sort_rank INTEGER NOT NULL,
+  nav_rank INTEGER,
+  prev_en TEXT,
+  next_en TEXT
+);
+
+-- Letter navigation (scripts/sync_to_d1.py rows_letter_prefixes)
+-- 1〜3文字の接頭辞ごとの単語数・最初と最後の単語・次の文字ごとの単語数（next_letters は JSON）
+-- first_sort_rank / last_sort_rank は words_en 全体での接頭辞の範囲（browseWords 用）
+CREATE TABLE IF NOT EXISTS letter_prefixes (
+  prefix TEXT PRIMARY KEY NOT NULL,
+  word_count INTEGER NOT NULL,
+  first_word TEXT,
+  last_word TEXT,
+  first_nav_rank INTEGER,
+  first_sort_rank INTEGER NOT NULL,
+  last_sort_rank INTEGER NOT NULL,
+  next_letters TEXT NOT NULL
+);
+
+-- Word page documents (scripts/sync_to_d1.py rows_word_docs)
+-- doc は getWord が返す WordData の JSON（意味・全言語の翻訳と性別・覚え方・例文とその翻訳）
+CREATE TABLE IF NOT EXISTS word_docs (
+  en TEXT PRIMARY KEY NOT NULL,
+  doc TEXT NOT NULL
+);
+
+-- Quiz pools (scripts/sync_to_d1.py rows_quiz_pool)
+-- 言語ごとに性別で層別してシャッフルした出題順（position は言語ごとの0始まりの連番、同期のたびに並べ直す）
+CREATE TABLE IF NOT EXISTS quiz_pool (
+  lang TEXT NOT NULL,
+  position INTEGER NOT NULL,
+  en TEXT NOT NULL,
+  translation TEXT NOT NULL,
+  gender TEXT NOT NULL,
+  PRIMARY KEY (lang, position)
+);
+
+-- Precomputed statistics (scripts/gender_matrix.py, value is JSON)
+CREATE TABLE IF NOT EXISTS dataset_stats (
+  key TEXT PRIMARY KEY NOT NULL,
+  value TEXT NOT NULL
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_words_en_en ON words_en(en);
 CREATE INDEX IF NOT EXISTS idx_words_fr_en ON words_fr(en);
@@ -160,3 +246,6 @@ CREATE INDEX IF NOT EXISTS idx_word_meanings_en ON word_meanings(en);
 CREATE INDEX IF NOT EXISTS idx_examples_en ON examples(en);
 CREATE INDEX IF NOT EXISTS idx_example_translations_example ON example_translations(example_en);
 CREATE INDEX IF NOT EXISTS idx_memory_tricks_en ON memory_tricks(en);
+CREATE INDEX IF NOT EXISTS idx_search_terms_en ON search_terms(en);
+CREATE INDEX IF NOT EXISTS idx_word_positions_sort_rank ON word_positions(sort_rank);
+CREATE INDEX IF NOT EXISTS idx_word_positions_nav_rank ON word_positions(nav_rank);
@@ -13,36 +13,12 @@ echo "=============================================="
 echo "D1 Full Sync (Delete All + Insert All)"
 echo "=============================================="
 
-# Step 1: 全データ削除（依存関係の逆順）
-echo ""
-echo "Step 1: Deleting all data..."
-
-npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM example_translations;"
-echo "  - example_translations deleted"
-
-npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM examples;"
-echo "  - examples deleted"
-
-npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM word_meanings;"
-echo "  - word_meanings deleted"
-
-npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM memory_tricks;"
-echo "  - memory_tricks deleted"
-
-for lang in fr de es it pt ru ar hi; do
-  npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM words_${lang};"
-  echo "  - words_${lang} deleted"
-done
-
-npx wrangler d1 execute $DB_NAME --remote --command "DELETE FROM words_en;"
-echo "  - words_en deleted"
-
+# 全データ削除（依存関係の逆順）と再挿入を sync_to_d1.py 内で並列実行する
 # gender_markersは固定値なので削除しない
-
-# Step 2: CSVからデータ挿入
+# 途中で失敗した場合は `d1_sync_all.sh --resume` で適用済みのチャンクを飛ばして再開できる
 echo ""
-echo "Step 2: Inserting data from CSV..."
-python3 "$SCRIPT_DIR/sync_to_d1.py"
+echo "Deleting all data and inserting from CSV..."
+python3 "$SCRIPT_DIR/sync_to_d1.py" --truncate "$@"
 
 echo ""
 echo "=============================================="
@@ -52,7 +28,10 @@ echo "=============================================="
 # 確認
 echo ""
 echo "Record counts:"
-for tbl in words_en words_fr word_meanings examples example_translations; do
-  count=$(npx wrangler d1 execute $DB_NAME --remote --command "SELECT COUNT(*) as c FROM $tbl;" 2>&1 | grep -o '"c": [0-9]*' | grep -o '[0-9]*')
-  echo "  $tbl: $count"
-done
+npx wrangler d1 execute $DB_NAME --remote --json --command "
+  SELECT 'words_en' AS tbl, COUNT(*) AS c FROM words_en
+  UNION ALL SELECT 'words_fr', COUNT(*) FROM words_fr
+  UNION ALL SELECT 'word_meanings', COUNT(*) FROM word_meanings
+  UNION ALL SELECT 'examples', COUNT(*) FROM examples
+  UNION ALL SELECT 'example_translations', COUNT(*) FROM example_translations;" \
+  | python3 -c 'import json, sys; [print("  %s: %s" % (r["tbl"], r["c"])) for r in json.load(sys.stdin)[0]["results"]]'
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+共有データセットローダー
+
+words.csv / translations_{lang}.csv / example_translations.csv /
+memory_tricks_creation.csv を一度だけ読み込み、__slots__ 付きの軽量レコード（NamedTuple）として
+各スクリプトに提供する。
+
+解析結果はファイルごとに .cache/dataset/{キー}.pickle にスナップショットとして保存し、
+ファイルの mtime / サイズが変わったものだけを再解析する。同期（sync_to_d1.py）・検証
+（validate.py）・load_dataset() はすべてこのスナップショットから読むため、同期と検証を
+続けて実行しても各ファイルの解析は1回で済む。同じプロセス内では load_dataset() の結果を
+使い回す。
+
+スナップショットは SNAPSHOT_BATCH 行ずつ pickle したバッチの列で、先頭から1バッチずつ
+読める。データセット全体をメモリに載せたくない場合（sync_to_d1.py）は、同じ属性を持ち
+アクセスのたびにスナップショットを読み直す DatasetSnapshot を使う。
+
+使い方:
+    from dataset import load_dataset
+    ds = load_dataset()
+    for t in ds.translations["fr"]:
+        print(t.en, t.translation, t.gender)
+
+    python scripts/dataset.py          # 読み込み統計を表示
+    python scripts/dataset.py --no-cache
+"""
+
+import csv
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+CACHE_DIR = PROJECT_ROOT / ".cache"
+SNAPSHOT_DIR = CACHE_DIR / "dataset"
+
+# レコード構造・ファイル形式を変えたら上げる（古いスナップショットを無効化）
+SNAPSHOT_VERSION = 3
+
+# スナップショットの1バッチの行数（読み書きで同時にメモリに載る行数）
+SNAPSHOT_BATCH = 4096
+
+# translations_{lang}.csv を持つ言語（ja, zh は意味翻訳のみ）
+TRANSLATION_LANGUAGES = ["fr", "de", "es", "it", "pt", "ru", "ar", "hi", "ja", "zh"]
+
+
+# レコードは NamedTuple（__slots__ = () で __dict__ を持たない）。
+# スナップショットには素のタプルとして保存し、読み込み時に _make で復元する
+
+
+class Word(NamedTuple):
+    """words.csv の1行"""
+
+    en: str
+    meaning_en: str
+    example_en: str
+
+
+class Translation(NamedTuple):
+    """translations_{lang}.csv の1行"""
+
+    en: str
+    translation: str
+    gender: str
+    meaning_translation: str
+
+
+class ExampleTranslation(NamedTuple):
+    """example_translations.csv の1行"""
+
+    en: str
+    lang: str
+    example_translation: str
+
+
+class MemoryTrick(NamedTuple):
+    """memory_tricks_creation.csv の1行"""
+
+    en: str
+    target_lang: str
+    translation: str
+    gender: str
+    ui_lang: str
+    trick_text_en: str
+    trick_text_translated: str
+    status: str
+
+
+# ファイル種別ごとの (レコードクラス, intern する列)。CSVにない列は空文字になる
+RECORD_SPECS = {
+    "words": (Word, ("en",)),
+    "translations": (Translation, ("en", "gender")),
+    "example_translations": (ExampleTranslation, ("en", "lang")),
+    "memory_tricks": (MemoryTrick, ("en", "target_lang", "translation", "gender", "ui_lang", "status")),
+}
+
+
+class Dataset:
+    """全データファイルの解析結果
+
+    translations は存在する translations_{lang}.csv のみを含む。
+    各リストの並びはCSVの行順（ヘッダーを除いて0始まり）。
+    """
+
+    def __init__(
+        self,
+        words: List[Word],
+        translations: Dict[str, List[Translation]],
+        example_translations: List[ExampleTranslation],
+        memory_tricks: List[MemoryTrick],
+    ):
+        self.words = words
+        self.translations = translations
+        self.example_translations = example_translations
+        self.memory_tricks = memory_tricks
+        # load_dataset が設定する（今回解析したファイルと、無効化判定用のスタンプ）
+        self.parsed_files: List[str] = []
+        self._stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+
+
+def source_files(data_dir: Path = DATA_DIR) -> Dict[str, Tuple[str, Path]]:
+    """スナップショットのキー → (ファイル種別, パス)"""
+    files = {
+        "words": ("words", data_dir / "words.csv"),
+        "example_translations": ("example_translations", data_dir / "example_translations.csv"),
+        "memory_tricks": ("memory_tricks", data_dir / "memory_tricks_creation.csv"),
+    }
+    for lang in TRANSLATION_LANGUAGES:
+        files[f"translations_{lang}"] = ("translations", data_dir / f"translations_{lang}.csv")
+    return files
+
+
+def parse_file(kind: str, path: Path) -> List[tuple]:
+    """タブ区切りCSVを1回だけ読み、素のタプルのリストに変換（列順はレコードクラスと同じ）"""
+    return list(iter_file(kind, path))
+
+
+def iter_file(kind: str, path: Path) -> Iterator[tuple]:
+    """タブ区切りCSVを1行ずつ素のタプルに変換して返す（列順はレコードクラスと同じ）"""
+    cls, interned = RECORD_SPECS[kind]
+    fields = cls._fields
+    intern = sys.intern
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader, [])
+        index = {name: i for i, name in enumerate(header)}
+        positions = [index.get(name) for name in fields]
+        intern_flags = [name in interned for name in fields]
+
+        for row in reader:
+            if not row:
+                continue
+            values = []
+            for pos, do_intern in zip(positions, intern_flags):
+                value = row[pos] if pos is not None and pos < len(row) else ""
+                values.append(intern(value) if do_intern else value)
+            yield tuple(values)
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """無効化判定用の (mtime_ns, size)。ファイルがなければ None"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def write_rows(path: Path, rows: Iterable[tuple], header: dict, batch_size: int = SNAPSHOT_BATCH) -> int:
+    """header に続けて行を batch_size 行ずつ pickle して一時ファイル経由で書き出し、行数を返す"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 別のプロセスが同じファイルを書いていても壊れないよう、一時ファイルはプロセスごとに分ける
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    count = 0
+    try:
+        with open(tmp_file, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+                count += len(batch)
+        os.replace(tmp_file, path)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return count
+
+
+def read_header(path: Path) -> Optional[dict]:
+    """write_rows で書いたファイルの header（なければ・壊れていれば None）"""
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+    except Exception:
+        return None
+    return header if isinstance(header, dict) else None
+
+
+def read_rows(path: Path) -> Iterator[tuple]:
+    """write_rows で書いたファイルの行を1バッチずつ読んで返す"""
+    with open(path, "rb") as f:
+        pickle.load(f)
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+def snapshot_file(key: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    """ファイル（source_files のキー）のスナップショット"""
+    return snapshot_dir / f"{key}.pickle"
+
+
+def refresh_snapshot(key: str, kind: str, path: Path, snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[int]:
+    """ファイルの (mtime_ns, size) がスナップショットと違えば解析し直す
+
+    解析した行数を返す（スナップショットが最新で解析しなかった場合は None）。
+    """
+    header = {"version": SNAPSHOT_VERSION, "source": str(path), "stamp": file_stamp(path)}
+    cache_file = snapshot_file(key, snapshot_dir)
+    if read_header(cache_file) == header:
+        return None
+    return write_rows(cache_file, iter_file(kind, path), header)
+
+
+class DatasetSnapshot:
+    """Dataset と同じ属性で、アクセスのたびにスナップショットを先頭から1バッチずつ読むビュー
+
+    作成時に変更されたファイルだけを解析してスナップショットを更新する（parsed_files・parsed_rows）。
+    属性にアクセスしてもCSVは解析し直さず、レコードをリストとして保持しないため、
+    メモリは読んでいる1バッチ分で済む（各属性は1回だけ走査すること）。
+    存在しない translations_{lang}.csv は translations に含めない。
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR, snapshot_dir: Path = SNAPSHOT_DIR):
+        files = source_files(Path(data_dir))
+        if not files["words"][1].exists():
+            raise FileNotFoundError(files["words"][1])
+        # キー → (ファイル種別, スナップショット)
+        self.snapshots: Dict[str, Tuple[str, Path]] = {}
+        self.parsed_files: List[str] = []
+        self.parsed_rows = 0
+        for key, (kind, path) in files.items():
+            if not path.exists():
+                continue
+            parsed = refresh_snapshot(key, kind, path, snapshot_dir)
+            if parsed is not None:
+                self.parsed_files.append(key)
+                self.parsed_rows += parsed
+            self.snapshots[key] = (kind, snapshot_file(key, snapshot_dir))
+
+    def records(self, key: str) -> Iterator[tuple]:
+        if key not in self.snapshots:
+            return iter(())
+        kind, path = self.snapshots[key]
+        return map(RECORD_SPECS[kind][0]._make, read_rows(path))
+
+    @property
+    def words(self) -> Iterator[Word]:
+        return self.records("words")
+
+    @property
+    def translations(self) -> Dict[str, Iterator[Translation]]:
+        return {
+            lang: self.records(f"translations_{lang}")
+            for lang in TRANSLATION_LANGUAGES
+            if f"translations_{lang}" in self.snapshots
+        }
+
+    @property
+    def example_translations(self) -> Iterator[ExampleTranslation]:
+        return self.records("example_translations")
+
+    @property
+    def memory_tricks(self) -> Iterator[MemoryTrick]:
+        return self.records("memory_tricks")
+
+
+_loaded: Dict[Tuple[Path, bool], Dataset] = {}
+
+
+def load_dataset(
+    data_dir: Path = DATA_DIR, use_cache: bool = True, snapshot_dir: Path = SNAPSHOT_DIR
+) -> Dataset:
+    """データセットを読み込む
+
+    スナップショットの (mtime_ns, size) が一致するファイルは再解析しない（use_cache=False なら
+    スナップショットを使わずにすべて解析する）。
+    同じプロセス内では2回目以降も同じ Dataset を返す（ファイルが変わっていれば読み直す）。
+    """
+    data_dir = Path(data_dir)
+    files = source_files(data_dir)
+    stamps = {key: file_stamp(path) for key, (_, path) in files.items()}
+
+    memo_key = (data_dir.resolve(), use_cache)
+    cached = _loaded.get(memo_key)
+    if cached is not None and cached._stamps == stamps:
+        return cached
+
+    if stamps["words"] is None:
+        raise FileNotFoundError(files["words"][1])
+    if use_cache:
+        snapshot = DatasetSnapshot(data_dir, snapshot_dir)
+        parsed = snapshot.parsed_files
+
+        def records(key: str) -> list:
+            return list(snapshot.records(key))
+
+    else:
+        parsed = [key for key, stamp in stamps.items() if stamp is not None]
+
+        def records(key: str) -> list:
+            kind, path = files[key]
+            if stamps[key] is None:
+                return []
+            return list(map(RECORD_SPECS[kind][0]._make, iter_file(kind, path)))
+
+    dataset = Dataset(
+        words=records("words"),
+        translations={
+            lang: records(f"translations_{lang}")
+            for lang in TRANSLATION_LANGUAGES
+            if stamps[f"translations_{lang}"] is not None
+        },
+        example_translations=records("example_translations"),
+        memory_tricks=records("memory_tricks"),
+    )
+    dataset._stamps = stamps
+    dataset.parsed_files = parsed
+    _loaded[memo_key] = dataset
+    return dataset
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load the shared dataset and print stats")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the snapshot and parse every file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    ds = load_dataset(use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+
+    print(f"words: {len(ds.words)}")
+    for lang, rows in ds.translations.items():
+        print(f"translations_{lang}: {len(rows)}")
+    print(f"example_translations: {len(ds.example_translations)}")
+    print(f"memory_tricks: {len(ds.memory_tricks)}")
+    print(f"parsed: {', '.join(ds.parsed_files) or '(all from snapshot)'}")
+    print(f"loaded in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
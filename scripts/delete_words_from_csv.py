@@ -1,71 +1,114 @@
 #!/usr/bin/env python3
 """
 CSVファイルから削除対象単語の行を削除するスクリプト
+
+words.csv / translations_{lang}.csv / example_translations.csv /
+memory_tricks_creation.csv のすべてから、en が削除対象単語の行を削除する。
+各ファイルは csv_transform.py で1回だけ読み、一時ファイル経由で置き換える
+（全ファイルを並列に処理し、単語の判定は set で行う）。
+
+--target を指定すると、同じ単語を D1（またはローカルSQLite）からも外部キー順に
+`DELETE ... WHERE en IN (...)` でまとめて削除し、単語の並び順の位置・接頭辞の集計・
+クイズの出題順（quiz_pool）・dataset_stats を作り直す（sync_to_d1.delete_words）。
+
+使い方:
+    python scripts/delete_words_from_csv.py                       # DELETE_WORDS を削除
+    python scripts/delete_words_from_csv.py --dry-run             # 削除される行を表示のみ
+    python scripts/delete_words_from_csv.py wimp zit --target d1  # CSV と D1 から削除
+    python scripts/delete_words_from_csv.py --file words.txt --target sqlite:data/noun_gender.db
 """
 
-import csv
-import os
+import sys
 from pathlib import Path
+from typing import List
+
+import sync_to_d1
+from csv_transform import DeleteWords, data_files, transform_files
+from dataset import load_dataset
 
 # 削除対象単語リスト
-DELETE_WORDS = [
-    'ass', 'bum', 'satan', 'wimp', 'zit'
-]
-
-def delete_words_from_csv(csv_file_path):
-    """指定されたCSVファイルから削除対象単語の行を削除"""
-    if not os.path.exists(csv_file_path):
-        print(f"ファイルが存在しません: {csv_file_path}")
-        return
-    
-    print(f"処理中: {csv_file_path}")
-    
-    # 元ファイルを読み取り
-    rows_to_keep = []
-    deleted_count = 0
-    
-    with open(csv_file_path, 'r', encoding='utf-8') as file:
-        reader = csv.reader(file, delimiter='\t')
-        header = next(reader)  # ヘッダー行を保存
-        rows_to_keep.append(header)
-        
-        for row in reader:
-            if row and row[0] not in DELETE_WORDS:
-                rows_to_keep.append(row)
-            else:
-                deleted_count += 1
-                print(f"  削除: {row[0] if row else 'empty row'}")
-    
-    # ファイルを書き戻し
-    with open(csv_file_path, 'w', encoding='utf-8', newline='') as file:
-        writer = csv.writer(file, delimiter='\t')
-        writer.writerows(rows_to_keep)
-    
-    print(f"  削除完了: {deleted_count}行削除, 残り{len(rows_to_keep)-1}行")
-    return deleted_count
+DELETE_WORDS = ["ass", "bum", "satan", "wimp", "zit"]
+
+# ファイルごとに表示する削除行の数
+DETAIL_LIMIT = 10
+
+
+def read_word_list(path: Path) -> List[str]:
+    """1行1単語のファイルを読む（空行と # で始まる行は無視）"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
 
 def main():
-    """メイン処理"""
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / 'data'
-    
-    csv_files = [
-        'word_meaning_translations.csv',
-        'word_examples.csv', 
-        'word_gender_translations.csv'
-    ]
-    
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Delete the rows of unwanted words from every data file (and D1)"
+    )
+    parser.add_argument("words", nargs="*", help=f"Words to delete (default: {' '.join(DELETE_WORDS)})")
+    parser.add_argument("--file", type=Path, help="Read the words to delete from a file, one per line")
+    parser.add_argument("--target", type=str, help="Also delete from the database: d1 or sqlite:PATH")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per file, up to the CPU count)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Show the rows without deleting them")
+    args = parser.parse_args()
+
+    words = list(args.words)
+    if args.file:
+        words += read_word_list(args.file)
+    words = words or DELETE_WORDS
+    if args.target and args.target != "d1" and not args.target.startswith("sqlite:"):
+        print(f"❌ 不明な削除先: {args.target}")
+        return 1
+
+    # D1 の example_translations のマニフェストは例文がキーのため、CSVから消す前に引いておく
+    targets = {word.strip().lower() for word in words}
+    examples = [w.example_en for w in load_dataset().words if w.en.strip().lower() in targets]
+
+    results = transform_files(data_files(), [DeleteWords(words)], args.dry_run, args.workers)
+
     total_deleted = 0
-    
-    for csv_file in csv_files:
-        csv_path = data_dir / csv_file
-        deleted = delete_words_from_csv(csv_path)
-        if deleted:
-            total_deleted += deleted
+    for result in results:
+        print(f"処理中: {result.path}")
+        for change in result.changes[:DETAIL_LIMIT]:
+            print(f"  削除: {change.en}")
+        if len(result.changes) > DETAIL_LIMIT:
+            print(f"  ... 他 {len(result.changes) - DETAIL_LIMIT}行")
+        deleted = result.rows - result.kept
+        total_deleted += deleted
+        print(f"  削除完了: {deleted}行削除, 残り{result.kept}行")
         print()
-    
-    print(f"全体削除完了: {total_deleted}行削除")
-    print(f"削除対象語数: {len(DELETE_WORDS)}語")
 
-if __name__ == '__main__':
-    main()
\ No newline at end of file
+    print(f"全体削除完了: {total_deleted}行削除" + (" （ドライラン: 書き込みなし）" if args.dry_run else ""))
+    print(f"削除対象語数: {len(words)}語")
+
+    if not args.target:
+        return 0
+    print()
+    if args.target == "d1":
+        success = sync_to_d1.delete_words(
+            words,
+            examples,
+            dry_run=args.dry_run,
+            refresh_stats=not args.dry_run,
+            workers=args.workers or sync_to_d1.DEFAULT_WORKERS,
+        )
+        return 0 if success else 1
+
+    db_path = Path(args.target[len("sqlite:") :])
+    if args.dry_run:
+        print(f"[DRY-RUN] {db_path} は変更しません")
+        return 0
+    deleted = sync_to_d1.delete_words_sqlite(db_path, words)
+    for table, count in deleted.items():
+        print(f"  {table}: {count}行削除")
+    print(f"{db_path}: {sum(deleted.values())}行削除")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
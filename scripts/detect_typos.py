@@ -1,221 +1,431 @@
 #!/usr/bin/env python3
 """
-体系的誤字検出スクリプト
-CSVファイル内の日本語翻訳における潜在的な誤字を検出する
+文字種の整合性・文字化け・誤字の検出スクリプト
+
+translations_{lang}.csv の translation / meaning_translation 列と
+example_translations.csv の example_translation 列をすべて走査し、以下を検出する。
+
+1. 文字種の不一致
+   - foreign_script: その言語で使わない文字種が混入している
+     （ラテン文字の言語にキリル文字・漢字、アラビア語にキリル文字など）
+   - missing_script: 空でないのに、その言語の文字種の文字が1つもない
+     （ロシア語の意味翻訳が "m" だけ、など列ずれの疑い）
+2. 文字化け: U+FFFD、C1制御文字、BOM、UTF-8 を Latin-1/cp1252 で読んだときの並び（Ã© など）
+3. 日本語・中国語の既知の誤字と危険ゾーンの漢字、重複語、簡体字の混入
+
+文字種の判定は SCRIPT_RANGES（コードポイント範囲 → 文字種）から言語ごとに
+事前にコンパイルした文字クラスで行うため、1フィールドあたり正規表現の検索数回で済む。
+
+使い方:
+    python scripts/detect_typos.py               # 全ファイルを走査（ファイルごとの MB/s を表示）
+    python scripts/detect_typos.py --lang ru --lang ar
+    python scripts/detect_typos.py --limit 20    # 種類ごとの詳細表示件数
 """
 
-import csv
 import re
-from typing import Dict, List, Tuple, Set
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 文字種ごとのコードポイント範囲（両端を含む）
+SCRIPT_RANGES: Dict[str, List[Tuple[int, int]]] = {
+    "Latin": [
+        (0x0041, 0x005A),
+        (0x0061, 0x007A),
+        (0x00AA, 0x00AA),
+        (0x00BA, 0x00BA),
+        (0x00C0, 0x00D6),
+        (0x00D8, 0x00F6),
+        (0x00F8, 0x02AF),
+        (0x1E00, 0x1EFF),
+        (0x2C60, 0x2C7F),
+        (0xA720, 0xA7FF),
+        (0xFB00, 0xFB06),
+        (0xFF21, 0xFF3A),
+        (0xFF41, 0xFF5A),
+    ],
+    "Greek": [(0x0370, 0x03FF), (0x1F00, 0x1FFF)],
+    "Cyrillic": [(0x0400, 0x052F), (0x1C80, 0x1C8F), (0x2DE0, 0x2DFF), (0xA640, 0xA69F)],
+    "Hebrew": [(0x0590, 0x05FF)],
+    "Arabic": [(0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFC)],
+    "Devanagari": [(0x0900, 0x097F), (0xA8E0, 0xA8FF)],
+    "Thai": [(0x0E00, 0x0E7F)],
+    "Hangul": [(0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)],
+    "Kana": [(0x3040, 0x30FF), (0x31F0, 0x31FF), (0xFF66, 0xFF9F)],
+    "Han": [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF), (0x20000, 0x2FA1F)],
+}
+
+# 言語ごとの (主な文字種, 併用を許す文字種)。主な文字種は1文字以上必要。
+# 非ラテン文字の言語では、学名・略語（Homo sapiens, SI など）のラテン文字を許す
+LANGUAGE_SCRIPTS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "fr": (("Latin",), ()),
+    "de": (("Latin",), ()),
+    "es": (("Latin",), ()),
+    "it": (("Latin",), ()),
+    "pt": (("Latin",), ()),
+    "ru": (("Cyrillic",), ("Latin",)),
+    "ar": (("Arabic",), ("Latin",)),
+    "hi": (("Devanagari",), ("Latin",)),
+    "ja": (("Han", "Kana"), ("Latin",)),
+    "zh": (("Han",), ("Latin",)),
+}
+
+
+def char_class(scripts) -> str:
+    """文字種の範囲を正規表現の文字クラスの中身にする"""
+    parts = []
+    for script in scripts:
+        for start, end in SCRIPT_RANGES[script]:
+            parts.append(re.escape(chr(start)))
+            if end != start:
+                parts.append("-" + re.escape(chr(end)))
+    return "".join(parts)
+
+
+# 範囲の開始位置でソートした表（文字 → 文字種の二分探索用）
+_RANGE_STARTS: List[int] = []
+_RANGE_TABLE: List[Tuple[int, int, str]] = []
+for _script, _ranges in SCRIPT_RANGES.items():
+    _RANGE_TABLE.extend((start, end, _script) for start, end in _ranges)
+_RANGE_TABLE.sort()
+_RANGE_STARTS = [start for start, _, _ in _RANGE_TABLE]
+
+
+def script_of(char: str) -> Optional[str]:
+    """文字の文字種（SCRIPT_RANGES にない文字・記号・数字は None）"""
+    code = ord(char)
+    i = bisect_right(_RANGE_STARTS, code) - 1
+    if i >= 0 and code <= _RANGE_TABLE[i][1]:
+        return _RANGE_TABLE[i][2]
+    return None
+
+
+# 言語ごとに (主な文字種のパターン, 許されない文字種のパターン) を事前にコンパイルする
+SCRIPT_PATTERNS: Dict[str, Tuple["re.Pattern", "re.Pattern"]] = {}
+for _lang, (_primary, _secondary) in LANGUAGE_SCRIPTS.items():
+    _foreign = [s for s in SCRIPT_RANGES if s not in _primary + _secondary]
+    SCRIPT_PATTERNS[_lang] = (
+        re.compile(f"[{char_class(_primary)}]"),
+        re.compile(f"[{char_class(_foreign)}]+"),
+    )
+
+# 連結したテキストの中で、空白以外を含むのに主な文字種の文字が1つもない行
+MISSING_SCRIPT_PATTERNS: Dict[str, "re.Pattern"] = {
+    _lang: re.compile(f"^(?=[^\\n]*\\S)[^{char_class(_primary)}\\n]*$", re.MULTILINE)
+    for _lang, (_primary, _) in LANGUAGE_SCRIPTS.items()
+}
+
+
+def detect_script_issues(text: str, lang: str) -> List[str]:
+    """文字種の不一致を検出"""
+    patterns = SCRIPT_PATTERNS.get(lang)
+    if patterns is None or not text.strip():
+        return []
+    primary, foreign = patterns
+
+    issues = []
+    for match in foreign.finditer(text):
+        scripts = sorted({script_of(c) for c in match.group()})
+        issues.append(f"foreign_script: '{match.group()}' ({', '.join(scripts)})")
+    if primary.search(text) is None:
+        expected = "/".join(LANGUAGE_SCRIPTS[lang][0])
+        issues.append(f"missing_script: no {expected} characters")
+    return issues
+
+
+# UTF-8 の継続バイト（0x80-0xBF）を Latin-1 / cp1252 で読んだときの文字
+_CONTINUATION = "\u0080-¿ŒœŠšŸŽžƒˆ˜–—‘-„†-•…‰‹›€™"
+
+# 文字化けのパターン（1つの正規表現にまとめ、グループ名で種類を区別する）
+MOJIBAKE_PATTERN = re.compile(
+    # 先頭文字の候補を1つの文字クラスで先に判定し、大半の位置では分岐を試さない
+    "(?=[Â-ô\ufffd\ufeff\x00-\x08\x0b\x0c\x0e-\x1f\u0080-\u009f])"
+    # UTF-8 の2〜4バイト文字を Latin-1 / cp1252 で読んだもの（Ã© → é, â€™ → ’ など）
+    f"(?:(?P<double_encoded>[Â-ß][{_CONTINUATION}]"
+    f"|[à-ï][{_CONTINUATION}]{{2}}"
+    f"|[ð-ô][{_CONTINUATION}]{{3}})"
+    "|(?P<replacement>\ufffd)"
+    "|(?P<bom>\ufeff)"
+    "|(?P<control>[\x00-\x08\x0b\x0c\x0e-\x1f\u0080-\u009f]))"
+)
+
+
+def detect_encoding_issues(text: str) -> List[str]:
+    """エンコーディング問題を検出"""
+    return [
+        f"文字化け疑い ({match.lastgroup}): {match.group()!r}" for match in MOJIBAKE_PATTERN.finditer(text)
+    ]
+
+
+# 明らかに間違った文字（既知のパターン）
+KNOWN_TYPOS = {
+    0x4ED2: ("仒", "仲の誤字"),
+    0x4EDA: ("仚", "仲の誤字"),
+    0x4ED1: ("仑", "会の誤字"),
+    0x4ED3: ("仓", "倉の誤字"),
+}
+
+# 常用漢字範囲内だが誤字が多発する危険ゾーン（範囲, 除外する文字, 説明）
+DANGER_ZONES = [
+    (
+        (0x4ED0, 0x4EDF),
+        {0x4ED4, 0x4ED5, 0x4ED6, 0x4ED7, 0x4ED8, 0x4ED9},  # 仔仕他付仙は除外
+        "危険ゾーン1: 仐-仟",
+    ),
+    ((0x4FE0, 0x4FE9), {0x4FE1}, "危険ゾーン2: 俠-俩"),  # 信は除外
+    ((0x5000, 0x500F), {0x5009, 0x500B, 0x500D}, "危険ゾーン3: 倀-倏"),  # 倉個倍は除外
+]
+
+# 既知の誤字と危険ゾーンの文字 → 説明（事前計算した表）
+SUSPICIOUS_CHARS: Dict[int, str] = {}
+for (_start, _end), _excluded, _desc in DANGER_ZONES:
+    for _code in range(_start, _end + 1):
+        if _code not in _excluded:
+            SUSPICIOUS_CHARS[_code] = _desc
+for _code, (_char, _desc) in KNOWN_TYPOS.items():
+    SUSPICIOUS_CHARS[_code] = f"既知誤字: {_desc}"
+
+SUSPICIOUS_PATTERN = re.compile(
+    "[" + "".join(re.escape(chr(code)) for code in sorted(SUSPICIOUS_CHARS)) + "]"
+)
+
 
 def detect_suspicious_characters(text: str) -> List[Tuple[str, int, str]]:
     """疑わしい文字を検出"""
-    suspicious = []
-    
-    for char in text:
-        code = ord(char)
-        
-        # 1. 明らかに間違った文字（既知のパターン）
-        known_typos = {
-            0x4ed2: ('仒', '仲の誤字'),
-            0x4eda: ('仚', '仲の誤字'),
-            0x4ed1: ('仑', '会の誤字'),
-            0x4ed3: ('仓', '倉の誤字'),
-        }
-        
-        if code in known_typos:
-            char_info, desc = known_typos[code]
-            suspicious.append((char, code, f"既知誤字: {desc}"))
-            continue
-            
-        # 2. 常用漢字範囲内だが疑わしい範囲
-        if 0x4e00 <= code <= 0x9fff:  # CJK統合漢字
-            # 特に誤字が多発する危険ゾーン
-            if (0x4ed0 <= code <= 0x4edf and code not in [0x4ed4, 0x4ed5, 0x4ed6, 0x4ed7, 0x4ed8, 0x4ed9]):  # 仐-仟（仔仕他付仙は除外）
-                suspicious.append((char, code, "危険ゾーン1: 仐-仟"))
-            elif (0x4fe0 <= code <= 0x4fe9 and code not in [0x4fe1]):  # 俠-俩（信は除外）  
-                suspicious.append((char, code, "危険ゾーン2: 俠-俩"))
-            elif (0x5000 <= code <= 0x500f and code not in [0x5009, 0x500b, 0x500d]):  # 倀-倏（倉個倍は除外）
-                suspicious.append((char, code, "危険ゾーン3: 倀-倏"))
-                
-    return suspicious
+    return [
+        (match.group(), ord(match.group()), SUSPICIOUS_CHARS[ord(match.group())])
+        for match in SUSPICIOUS_PATTERN.finditer(text)
+    ]
+
+
+# 異常な文字組み合わせ
+STRANGE_PATTERNS = [
+    "仒",  # 仲の誤字
+    "仚",  # 仲の誤字
+    "测",  # 測の簡体字が混入
+    "运",  # 運の簡体字が混入
+    "记",  # 記の簡体字が混入
+]
+STRANGE_PATTERN = re.compile("|".join(STRANGE_PATTERNS))
+
 
 def detect_pattern_anomalies(text: str) -> List[str]:
     """パターン異常を検出"""
     anomalies = []
-    
+
     # 1. 重複する単語（例: 仲間; 仲間）
-    words = [w.strip() for w in text.split(';')]
-    if len(words) != len(set(words)):
-        duplicates = [w for w in set(words) if words.count(w) > 1]
-        anomalies.append(f"重複語: {', '.join(duplicates)}")
-    
+    if ";" in text:
+        words = [w.strip() for w in text.split(";")]
+        if len(words) != len(set(words)):
+            duplicates = [w for w in set(words) if words.count(w) > 1]
+            anomalies.append(f"重複語: {', '.join(duplicates)}")
+
     # 2. 異常な文字組み合わせ
-    strange_patterns = [
-        r'仒',  # 仲の誤字
-        r'仚',  # 仲の誤字  
-        r'测',  # 測の簡体字が混入
-        r'运',  # 運の簡体字が混入
-        r'记',  # 記の簡体字が混入
-    ]
-    
-    for pattern in strange_patterns:
-        if re.search(pattern, text):
-            anomalies.append(f"異常パターン: {pattern}")
-            
+    for pattern in sorted(set(STRANGE_PATTERN.findall(text))):
+        anomalies.append(f"異常パターン: {pattern}")
+
     return anomalies
 
-def detect_encoding_issues(text: str) -> List[str]:
-    """エンコーディング問題を検出"""
-    issues = []
-    
-    # 文字化けパターン
-    mojibake_patterns = [
-        r'[ï¿½]',  # UTF-8 replacement character
-        r'[â€]',   # UTF-8 encoding issues
-        r'[Ã]',    # Latin-1/UTF-8 混在
-    ]
-    
-    for pattern in mojibake_patterns:
-        if re.search(pattern, text):
-            issues.append(f"文字化け疑い: {pattern}")
-            
-    return issues
 
-def analyze_csv_file(filename: str, japanese_column: int) -> Dict:
-    """CSVファイルを分析"""
-    results = {
-        'suspicious_chars': [],
-        'pattern_anomalies': [],
-        'encoding_issues': [],
-        'total_rows': 0,
-        'problematic_rows': 0
+# 既知の誤字・危険ゾーン・簡体字の混入の検出は日本語のみ
+# （仑 仓 测 などは中国語では正しい文字）
+TYPO_LANGUAGES = ("ja",)
+
+
+def scan_text(text: str, lang: str) -> List[Tuple[str, str]]:
+    """1フィールドを走査し (種類, 説明) のリストを返す"""
+    found = []
+    for issue in detect_script_issues(text, lang):
+        kind, _, desc = issue.partition(": ")
+        found.append((kind, desc))
+    for issue in detect_encoding_issues(text):
+        found.append(("encoding", issue))
+    if lang in TYPO_LANGUAGES:
+        for char, code, desc in detect_suspicious_characters(text):
+            found.append(("suspicious_char", f"'{char}' (U+{code:04X}): {desc}"))
+        for anomaly in detect_pattern_anomalies(text):
+            found.append(("pattern_anomaly", anomaly))
+    return found
+
+
+def scan_texts(texts: List[str], lang: str) -> List[Tuple[int, str, str]]:
+    """同じ言語のフィールドをまとめて走査し (添字, 種類, 説明) のリストを返す
+
+    フィールドを改行で連結した1つの文字列に各正規表現を1回ずつ適用し、
+    一致位置からフィールドの添字を求める。結果は scan_text を各フィールドに
+    適用したものと同じ（順序は添字順）。
+    """
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text) + 1
+    joined = "\n".join(text.replace("\n", " ") for text in texts)
+
+    def index(match) -> int:
+        return bisect_right(starts, match.start()) - 1
+
+    found = []
+    patterns = SCRIPT_PATTERNS.get(lang)
+    if patterns is not None:
+        _, foreign = patterns
+        for match in foreign.finditer(joined):
+            scripts = sorted({script_of(c) for c in match.group()})
+            found.append((index(match), "foreign_script", f"'{match.group()}' ({', '.join(scripts)})"))
+        expected = "/".join(LANGUAGE_SCRIPTS[lang][0])
+        for match in MISSING_SCRIPT_PATTERNS[lang].finditer(joined):
+            found.append((index(match), "missing_script", f"no {expected} characters"))
+    for match in MOJIBAKE_PATTERN.finditer(joined):
+        found.append((index(match), "encoding", f"文字化け疑い ({match.lastgroup}): {match.group()!r}"))
+    if lang in TYPO_LANGUAGES:
+        # 件数が少ないためフィールドごとに走査する
+        for i, text in enumerate(texts):
+            for char, code, desc in detect_suspicious_characters(text):
+                found.append((i, "suspicious_char", f"'{char}' (U+{code:04X}): {desc}"))
+            for anomaly in detect_pattern_anomalies(text):
+                found.append((i, "pattern_anomaly", anomaly))
+    # 同じフィールド内では scan_text と同じ種類順にする
+    order = {kind: n for n, kind in enumerate(ISSUE_TITLES)}
+    found.sort(key=lambda issue: (issue[0], order[issue[1]]))
+    return found
+
+
+def scan_file(kind: str, path: Path, languages: Optional[List[str]] = None) -> Dict:
+    """1ファイルを走査する。所要時間にはファイルの読み込みと解析を含む"""
+    from dataset import parse_file
+
+    start = time.perf_counter()
+    size = path.stat().st_size
+    rows = parse_file(kind, path)
+    # 言語ごとに (行番号, en, 列名, テキスト) をまとめて scan_texts に渡す
+    fields: Dict[str, List[Tuple[int, str, str, str]]] = {}
+    if kind == "translations":
+        lang = path.stem.split("_", 1)[1]
+        # (en, translation, gender, meaning_translation)
+        fields[lang] = [
+            (n, row[0], column, row[i])
+            for column, i in (("translation", 1), ("meaning_translation", 3))
+            for n, row in enumerate(rows, 1)
+        ]
+    else:
+        # (en, lang, example_translation)
+        for n, row in enumerate(rows, 1):
+            if not languages or row[1] in languages:
+                fields.setdefault(row[1], []).append((n, row[0], "example_translation", row[2]))
+
+    issues = []
+    for lang, lang_fields in fields.items():
+        texts = [field[3] for field in lang_fields]
+        for i, issue_kind, desc in scan_texts(texts, lang):
+            n, en, column, text = lang_fields[i]
+            issues.append((n, en, lang, column, text, issue_kind, desc))
+    issues.sort(key=lambda issue: issue[0])
+    elapsed = time.perf_counter() - start
+    return {
+        "file": path.name,
+        "rows": len(rows),
+        "bytes": size,
+        "seconds": elapsed,
+        "mb_per_sec": size / 1024 / 1024 / elapsed if elapsed > 0 else 0.0,
+        "issues": issues,
     }
-    
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            next(reader)  # ヘッダーをスキップ
-            
-            for row_num, row in enumerate(reader, 2):  # 2行目から開始
-                results['total_rows'] += 1
-                
-                if len(row) <= japanese_column:
-                    continue
-                    
-                japanese_text = row[japanese_column]
-                en_word = row[0] if len(row) > 0 else 'unknown'
-                
-                row_issues = []
-                
-                # 疑わしい文字検出
-                suspicious = detect_suspicious_characters(japanese_text)
-                if suspicious:
-                    row_issues.extend(suspicious)
-                    results['suspicious_chars'].append({
-                        'row': row_num,
-                        'word': en_word,
-                        'text': japanese_text,
-                        'issues': suspicious
-                    })
-                
-                # パターン異常検出
-                pattern_issues = detect_pattern_anomalies(japanese_text)
-                if pattern_issues:
-                    row_issues.extend(pattern_issues)
-                    results['pattern_anomalies'].append({
-                        'row': row_num,
-                        'word': en_word,
-                        'text': japanese_text,
-                        'issues': pattern_issues
-                    })
-                
-                # エンコーディング問題検出
-                encoding_issues = detect_encoding_issues(japanese_text)
-                if encoding_issues:
-                    row_issues.extend(encoding_issues)
-                    results['encoding_issues'].append({
-                        'row': row_num,
-                        'word': en_word,
-                        'text': japanese_text,
-                        'issues': encoding_issues
-                    })
-                
-                if row_issues:
-                    results['problematic_rows'] += 1
-                    
-    except Exception as e:
-        print(f"エラー: {filename} の処理中にエラーが発生: {e}")
-        
-    return results
+
+
+# 種類ごとの見出し
+ISSUE_TITLES = {
+    "foreign_script": "🔤 他の文字種の混入",
+    "missing_script": "🔤 その言語の文字がない（列ずれの疑い）",
+    "encoding": "💥 エンコーディング問題",
+    "suspicious_char": "🚨 疑わしい文字",
+    "pattern_anomaly": "⚠️  パターン異常",
+}
+
 
 def main():
     """メイン処理"""
-    csv_files = [
-        ('data/word_meaning_translations.csv', 2),  # 日本語意味列
-        ('data/word_examples.csv', 2),               # 例文は英語のみなのでスキップ
-        ('data/word_gender_translations.csv', 1),   # 意味列
+    import argparse
+
+    from dataset import DATA_DIR
+
+    parser = argparse.ArgumentParser(
+        description="Scan translations for script mismatches, mojibake and typos"
+    )
+    parser.add_argument(
+        "--lang",
+        action="append",
+        choices=sorted(LANGUAGE_SCRIPTS),
+        help="Only scan the given language (repeatable)",
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Issues to show per kind and file")
+    args = parser.parse_args()
+
+    files = [
+        ("translations", DATA_DIR / f"translations_{lang}.csv")
+        for lang in LANGUAGE_SCRIPTS
+        if not args.lang or lang in args.lang
     ]
-    
-    print("=== CSV誤字検出スクリプト ===\n")
-    
+    files.append(("example_translations", DATA_DIR / "example_translations.csv"))
+
+    print("=== 文字種・文字化け・誤字検出スクリプト ===\n")
+
     total_issues = 0
-    
-    for filename, japanese_col in csv_files:
-        if 'examples' in filename:  # 例文ファイルは英語のみなのでスキップ
+    total_bytes = 0
+    total_seconds = 0.0
+
+    for kind, path in files:
+        if not path.exists():
+            print(f"⚠️  {path.name} が見つかりません。スキップします")
             continue
-            
-        print(f"📁 分析中: {filename}")
+
+        results = scan_file(kind, path, args.lang)
+        total_bytes += results["bytes"]
+        total_seconds += results["seconds"]
+        issues = results["issues"]
+
+        print(f"📁 {results['file']}")
         print("-" * 50)
-        
-        results = analyze_csv_file(filename, japanese_col)
-        
-        print(f"総行数: {results['total_rows']}")
-        print(f"問題のある行: {results['problematic_rows']}")
+        print(
+            f"総行数: {results['rows']} / {results['bytes'] / 1024 / 1024:.2f} MB / "
+            f"{results['seconds'] * 1000:.0f} ms ({results['mb_per_sec']:.1f} MB/s)"
+        )
+        print(f"問題のある行: {len({issue[0] for issue in issues})}")
         print()
-        
-        # 疑わしい文字の報告
-        if results['suspicious_chars']:
-            print("🚨 疑わしい文字:")
-            for item in results['suspicious_chars']:
-                print(f"  行{item['row']}: {item['word']} -> {item['text']}")
-                for char, code, desc in item['issues']:
-                    print(f"    └─ '{char}' (U+{code:04X}): {desc}")
-            print()
-            total_issues += len(results['suspicious_chars'])
-        
-        # パターン異常の報告
-        if results['pattern_anomalies']:
-            print("⚠️  パターン異常:")
-            for item in results['pattern_anomalies']:
-                print(f"  行{item['row']}: {item['word']} -> {item['text']}")
-                for issue in item['issues']:
-                    print(f"    └─ {issue}")
-            print()
-            total_issues += len(results['pattern_anomalies'])
-        
-        # エンコーディング問題の報告
-        if results['encoding_issues']:
-            print("💥 エンコーディング問題:")
-            for item in results['encoding_issues']:
-                print(f"  行{item['row']}: {item['word']} -> {item['text']}")
-                for issue in item['issues']:
-                    print(f"    └─ {issue}")
+
+        by_kind: Dict[str, list] = {}
+        for issue in issues:
+            by_kind.setdefault(issue[5], []).append(issue)
+        for issue_kind, title in ISSUE_TITLES.items():
+            kind_issues = by_kind.get(issue_kind, [])
+            if not kind_issues:
+                continue
+            print(f"{title}: {len(kind_issues)}件")
+            for row, en, lang, column, text, _, desc in kind_issues[: args.limit]:
+                print(f"  行{row}: {en} [{lang} {column}] -> {text[:60]}")
+                print(f"    └─ {desc}")
+            if len(kind_issues) > args.limit:
+                print(f"  ... and {len(kind_issues) - args.limit} more")
             print()
-            total_issues += len(results['encoding_issues'])
-        
-        if not any([results['suspicious_chars'], results['pattern_anomalies'], results['encoding_issues']]):
+        total_issues += len(issues)
+
+        if not issues:
             print("✅ 問題は検出されませんでした")
             print()
-    
+
     print("=" * 50)
     print(f"🔍 検出結果: 合計 {total_issues} 件の問題")
-    
+    if total_seconds > 0:
+        print(
+            f"⏱️  {total_bytes / 1024 / 1024:.2f} MB を {total_seconds:.2f}s で走査 "
+            f"({total_bytes / 1024 / 1024 / total_seconds:.1f} MB/s)"
+        )
+
     if total_issues > 0:
         print("\n📋 推奨アクション:")
         print("1. 上記の問題箇所をCSVファイルで手動修正")
-        print("2. python scripts/sync_meaning_translations.py で同期")
+        print("2. python scripts/validate.py で全体を再検証")
         print("3. 修正後、再度このスクリプトを実行して確認")
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
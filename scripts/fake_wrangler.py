@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+wrangler のテスト用スタンドイン
+
+`wrangler d1 execute <DB> --remote --file=X` / `--command=SQL` を受け取り、
+遅延と失敗を模擬する。FAKE_WRANGLER_DB を指定するとローカルSQLiteに
+実際にSQLを適用するので、同期結果を検証できる。
+
+使い方:
+    WRANGLER="python3 scripts/fake_wrangler.py" python3 scripts/sync_to_d1.py
+
+環境変数:
+    FAKE_WRANGLER_LATENCY    1回の実行にかかる秒数（0.5〜1.5倍でゆらぐ。既定 0.2）
+    FAKE_WRANGLER_FAIL_RATE  一時的エラーを返す確率（0〜1。既定 0）
+    FAKE_WRANGLER_DB         SQLを適用するSQLiteファイル（省略時は適用しない）
+    FAKE_WRANGLER_LOG        実行ログ（1実行1行）を追記するファイル
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    if args[:2] != ["d1", "execute"]:
+        print(f"fake_wrangler: unsupported command: {' '.join(args)}", file=sys.stderr)
+        return 2
+
+    sql = None
+    for arg in args[2:]:
+        if arg.startswith("--file="):
+            with open(arg[len("--file="):], "r", encoding="utf-8") as f:
+                sql = f.read()
+        elif arg.startswith("--command="):
+            sql = arg[len("--command="):]
+    if sql is None:
+        print("fake_wrangler: --file or --command is required", file=sys.stderr)
+        return 2
+
+    latency = float(os.environ.get("FAKE_WRANGLER_LATENCY", "0.2"))
+    fail_rate = float(os.environ.get("FAKE_WRANGLER_FAIL_RATE", "0"))
+    time.sleep(latency * random.uniform(0.5, 1.5))
+
+    failed = random.random() < fail_rate
+    log_file = os.environ.get("FAKE_WRANGLER_LOG")
+    if log_file:
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(f"{time.time():.3f}\t{'fail' if failed else 'ok'}\t{len(sql.encode('utf-8'))}\n")
+
+    if failed:
+        print("✘ [ERROR] A request to the Cloudflare API failed: Network connection lost.", file=sys.stderr)
+        return 1
+
+    db_file = os.environ.get("FAKE_WRANGLER_DB")
+    if db_file:
+        # D1 と同様に1回の実行をまとめて適用する
+        conn = sqlite3.connect(db_file, timeout=60, isolation_level=None)
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE;\n{sql}\nCOMMIT;")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"✘ [ERROR] {e}: SQLITE_ERROR")
+            return 1
+        finally:
+            conn.close()
+
+    print('[{"results": [], "success": true, "meta": {}}]')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+言語間の性別の整合性チェック
+
+近い言語どうし（fr/es/it/pt など）で性別が食い違う単語は、データの誤りである
+可能性が高い。全言語の translations_{lang}.csv を en で結合した性別マトリクス
+（gender_matrix.py）から、グループ内で1言語だけ性別が異なる単語を抽出し、
+翻訳どうしが同語源（綴りが似ている）ほど上位になるように並べる。
+
+例: es/it/pt が女性で fr だけ男性、かつ各言語の翻訳の綴りが近い単語
+
+使い方:
+    python scripts/gender_consistency.py                  # ロマンス語グループの外れ値
+    python scripts/gender_consistency.py --group de,ru    # 任意のグループ
+    python scripts/gender_consistency.py --limit 50 --json
+"""
+
+import json
+import sys
+import time
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from dataset import Dataset, load_dataset
+from gender_matrix import GENDER_CODES, GENDER_NAMES, LANGUAGES, GenderMatrix
+
+# 既定の比較グループ（性別の体系が近い言語）
+ROMANCE = ["fr", "es", "it", "pt"]
+
+# m/f/n のコード（none, other は比較しない）
+GENDERED = list(GENDER_CODES.values())
+
+
+class Outlier(NamedTuple):
+    """グループ内で1言語だけ性別が異なる単語"""
+
+    en: str
+    lang: str
+    gender: str
+    majority: str
+    agreeing: int
+    similarity: float
+    pattern: str
+    translations: Dict[str, str]
+
+
+def fold(text: str) -> str:
+    """綴りの比較用に小文字化し、アクセントを除く"""
+    decomposed = unicodedata.normalize("NFKD", text.strip().lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def cognate_similarity(text: str, others: List[str]) -> float:
+    """外れた言語の翻訳と多数派の翻訳の綴りの類似度（平均、0〜1）"""
+    if not others:
+        return 0.0
+    folded = fold(text)
+    return sum(SequenceMatcher(None, folded, fold(o)).ratio() for o in others) / len(others)
+
+
+def gender_pattern(matrix: GenderMatrix, index: int, group: List[str]) -> str:
+    """単語の性別の並び（例: "fr:m es:f it:f pt:f"）"""
+    parts = []
+    for lang in group:
+        covered = matrix.covered(lang)[index]
+        parts.append(f"{lang}:{GENDER_NAMES[matrix.gender(lang)[index]] if covered else '-'}")
+    return " ".join(parts)
+
+
+def gendered_counts(matrix: GenderMatrix, group: List[str]) -> np.ndarray:
+    """[m/f/n の数 x 単語数] のグループ内の件数"""
+    counts = np.zeros((len(GENDERED), len(matrix.words)), dtype=np.int64)
+    for lang in group:
+        genders = matrix.gender(lang)
+        covered = matrix.covered(lang)
+        for i, code in enumerate(GENDERED):
+            counts[i] += covered & (genders == code)
+    return counts
+
+
+def find_outliers(
+    matrix: GenderMatrix, ds: Dataset, group: List[str], min_agreeing: int = 2
+) -> List[Outlier]:
+    """グループ内で1言語だけ性別が異なり、残りが min_agreeing 言語以上一致する単語
+
+    同語源らしさ（similarity）の高い順、一致する言語数の多い順に並べる。
+    """
+    counts = gendered_counts(matrix, group)
+    majority = counts.argmax(axis=0)
+    majority_count = counts.max(axis=0)
+    total = counts.sum(axis=0)
+    # 多数派以外がちょうど1言語
+    candidates = np.flatnonzero((majority_count >= min_agreeing) & (total - majority_count == 1))
+
+    # 候補の単語についてだけ翻訳の綴りを引く（en → 翻訳のハッシュ結合）
+    wanted = {matrix.words[i] for i in candidates}
+    texts: Dict[str, Dict[str, str]] = {lang: {} for lang in group}
+    for lang in group:
+        for t in ds.translations.get(lang, []):
+            en = t.en.strip().lower()
+            if en in wanted:
+                texts[lang][en] = t.translation.strip()
+
+    genders = {lang: matrix.gender(lang) for lang in group}
+    covered = {lang: matrix.covered(lang) for lang in group}
+    outliers = []
+    for index in candidates:
+        en = matrix.words[index]
+        majority_code = GENDERED[majority[index]]
+        odd = None
+        agreeing = []
+        for lang in group:
+            if not covered[lang][index]:
+                continue
+            code = genders[lang][index]
+            if code == majority_code:
+                agreeing.append(lang)
+            elif code in GENDERED:
+                odd = lang
+        if odd is None:
+            continue
+        translations = {lang: texts[lang].get(en, "") for lang in group}
+        outliers.append(
+            Outlier(
+                en=en,
+                lang=odd,
+                gender=GENDER_NAMES[genders[odd][index]],
+                majority=GENDER_NAMES[majority_code],
+                agreeing=len(agreeing),
+                similarity=round(
+                    cognate_similarity(translations[odd], [translations[lang] for lang in agreeing]), 3
+                ),
+                pattern=gender_pattern(matrix, index, group),
+                translations=translations,
+            )
+        )
+    outliers.sort(key=lambda o: (-o.similarity, -o.agreeing, o.en))
+    return outliers
+
+
+def agreement_patterns(matrix: GenderMatrix, group: List[str]) -> Dict[str, int]:
+    """グループ内の性別の並び（"m m f m" など）ごとの単語数（件数の多い順）"""
+    codes = np.stack([matrix.gender(lang) for lang in group])
+    covered = np.stack([matrix.covered(lang) for lang in group])
+    # 翻訳がない言語は "-"（GENDER_NAMES の範囲外のコードにする）
+    codes = np.where(covered, codes, len(GENDER_NAMES))
+    unique, counts = np.unique(codes, axis=1, return_counts=True)
+    names = GENDER_NAMES + ["-"]
+    patterns = {" ".join(names[c] for c in column): int(n) for column, n in zip(unique.T, counts)}
+    return dict(sorted(patterns.items(), key=lambda item: -item[1]))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Find words whose gender disagrees within a group of languages"
+    )
+    parser.add_argument(
+        "--group",
+        type=str,
+        default=",".join(ROMANCE),
+        help=f"Comma-separated languages to compare (default: {','.join(ROMANCE)})",
+    )
+    parser.add_argument(
+        "--min-agreeing",
+        type=int,
+        default=2,
+        help="Languages that must agree against the outlier (default: 2)",
+    )
+    parser.add_argument("--limit", type=int, default=30, help="Outliers to show (default: 30)")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    group = [lang.strip() for lang in args.group.split(",") if lang.strip()]
+    unknown = [lang for lang in group if lang not in LANGUAGES]
+    if len(group) < 3 or unknown:
+        print(
+            f"❌ 3言語以上を指定してください（{', '.join(LANGUAGES)}）"
+            + (f": 不明な言語 {', '.join(unknown)}" if unknown else "")
+        )
+        sys.exit(1)
+
+    start = time.perf_counter()
+    ds = load_dataset()
+    matrix = GenderMatrix.from_dataset(ds)
+    outliers = find_outliers(matrix, ds, group, args.min_agreeing)
+    patterns = agreement_patterns(matrix, group)
+    elapsed = time.perf_counter() - start
+
+    by_lang: Dict[str, int] = {lang: 0 for lang in group}
+    for outlier in outliers:
+        by_lang[outlier.lang] += 1
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "group": group,
+                    "words": len(matrix.words),
+                    "patterns": patterns,
+                    "outliers_by_language": by_lang,
+                    "outliers": [o._asdict() for o in outliers[: args.limit]],
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+        return
+
+    print("=" * 80)
+    print(f"⚖️  性別の整合性チェック: {' / '.join(group)} ({len(matrix.words)}語)")
+    print("=" * 80)
+
+    print(f"\n性別の並び（上位10件、{' '.join(group)} の順）")
+    for pattern, count in list(patterns.items())[:10]:
+        print(f"  {pattern:<20} {count:>6}")
+
+    print(f"\n1言語だけ性別が異なる単語: {len(outliers)}件")
+    for lang, count in sorted(by_lang.items(), key=lambda item: -item[1]):
+        print(f"  {lang}: {count}件")
+
+    print(f"\n同語源らしい順（上位{args.limit}件）")
+    for o in outliers[: args.limit]:
+        texts = ", ".join(f"{lang}={text}" for lang, text in o.translations.items())
+        print(
+            f"  {o.en:<20} {o.lang}={o.gender} (他 {o.agreeing}言語は {o.majority}) "
+            f"類似度 {o.similarity:.2f}"
+        )
+        print(f"    └─ {texts}")
+
+    print(f"\n⏱️  {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
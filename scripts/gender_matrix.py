@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+性別マトリクス（NumPy による列指向の集計）
+
+words.csv の単語（正規化した en の重複を除いた行順）を列、性別を持つ8言語を行とする
+uint8 の性別コード行列と、単語ごとの翻訳カバレッジのビットマスク（uint16、
+bit i = LANGUAGES[i]）を作り、言語別・頭文字別の分布や言語間のクロス集計を
+ベクトル演算で求める。
+
+同期時には api_stats() の結果が dataset_stats テーブルに入り、/api/stats が返す。
+
+使い方:
+    from gender_matrix import GenderMatrix
+    matrix = GenderMatrix.from_dataset()
+    matrix.count(fr="m", es="f")        # fr で男性、es で女性の単語数
+    matrix.crosstab("fr", "es")         # 5x5 のクロス集計（GENDER_NAMES 順）
+    matrix.by_initial("de")             # 頭文字ごとの性別分布
+
+    python scripts/gender_matrix.py                     # QAレポート
+    python scripts/gender_matrix.py --crosstab fr es
+    python scripts/gender_matrix.py --by-initial de
+    python scripts/gender_matrix.py --json              # レポートをJSONで出力
+"""
+
+import json
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from dataset import Dataset, load_dataset
+
+# 性別を持つ言語（words_{lang} テーブル）
+LANGUAGES = ["fr", "de", "es", "it", "pt", "ru", "ar", "hi"]
+
+# 性別コード。none は翻訳はあるが性別が空、other は m/f/n 以外の値
+# （翻訳があるかどうかはカバレッジのビットマスクで区別する）
+GENDER_NAMES = ["none", "m", "f", "n", "other"]
+GENDER_CODES = {"m": 1, "f": 2, "n": 3}
+OTHER = 4
+
+# src/lib/db.ts の ALL_LANGUAGES と同じ順（languageStats で件数が同じときの並び）
+API_LANGUAGE_ORDER = ["ar", "fr", "de", "hi", "it", "pt", "ru", "es"]
+
+
+def gender_code(gender: str) -> int:
+    """性別の文字列をコードに変換"""
+    gender = gender.strip().lower()
+    if not gender:
+        return 0
+    return GENDER_CODES.get(gender, OTHER)
+
+
+class GenderMatrix:
+    """単語 × 言語の性別コード行列とカバレッジ"""
+
+    def __init__(self, words: List[str], languages: List[str], genders: np.ndarray, coverage: np.ndarray):
+        self.words = words
+        self.languages = languages
+        # genders[i] が languages[i] の性別コード（単語の行順）
+        self.genders = genders
+        self.coverage = coverage
+        self._initials: Optional[Tuple[List[str], np.ndarray]] = None
+
+    @classmethod
+    def from_dataset(cls, ds: Optional[Dataset] = None, languages: List[str] = LANGUAGES) -> "GenderMatrix":
+        """データセットから作る。words.csv にない単語の翻訳は含めない"""
+        ds = ds or load_dataset()
+
+        words: List[str] = []
+        row_of: Dict[str, int] = {}
+        for word in ds.words:
+            en = word.en.strip().lower()
+            if en and en not in row_of:
+                row_of[en] = len(words)
+                words.append(en)
+
+        genders = np.zeros((len(languages), len(words)), dtype=np.uint8)
+        coverage = np.zeros(len(words), dtype=np.uint16)
+        for i, lang in enumerate(languages):
+            rows = []
+            codes = []
+            for t in ds.translations.get(lang, []):
+                row = row_of.get(t.en.strip().lower())
+                if row is None or not t.translation.strip():
+                    continue
+                rows.append(row)
+                codes.append(gender_code(t.gender))
+            rows = np.asarray(rows, dtype=np.int64)
+            # 同じ単語が複数行あれば最後の行（同期時の INSERT OR REPLACE と同じ）
+            genders[i, rows] = np.asarray(codes, dtype=np.uint8)
+            coverage[rows] |= np.uint16(1 << i)
+        return cls(words, list(languages), genders, coverage)
+
+    def _index(self, lang: str) -> int:
+        try:
+            return self.languages.index(lang)
+        except ValueError:
+            raise KeyError(f"Unknown language: {lang}") from None
+
+    def gender(self, lang: str) -> np.ndarray:
+        """言語の性別コード配列（単語の行順）"""
+        return self.genders[self._index(lang)]
+
+    def covered(self, lang: str) -> np.ndarray:
+        """言語の翻訳がある単語の真偽値配列"""
+        return (self.coverage >> self._index(lang)) & 1 == 1
+
+    def mask(self, **genders: str) -> np.ndarray:
+        """指定した言語ですべて指定の性別になる単語の真偽値配列
+
+        例: mask(fr="m", es="f")。性別は GENDER_NAMES のいずれか。
+        """
+        result = np.ones(len(self.words), dtype=bool)
+        for lang, name in genders.items():
+            code = GENDER_NAMES.index(name)
+            result &= self.covered(lang) & (self.gender(lang) == code)
+        return result
+
+    def count(self, **genders: str) -> int:
+        """mask() に該当する単語数"""
+        return int(self.mask(**genders).sum())
+
+    def words_where(self, **genders: str) -> List[str]:
+        """mask() に該当する単語"""
+        return [self.words[i] for i in np.flatnonzero(self.mask(**genders))]
+
+    def distribution(self, lang: str) -> Dict[str, int]:
+        """翻訳がある単語の性別分布"""
+        counts = np.bincount(self.gender(lang)[self.covered(lang)], minlength=len(GENDER_NAMES))
+        return dict(zip(GENDER_NAMES, counts.tolist()))
+
+    def crosstab(self, lang_a: str, lang_b: str) -> np.ndarray:
+        """両言語に翻訳がある単語の性別クロス集計（行: lang_a、列: lang_b）"""
+        both = self.covered(lang_a) & self.covered(lang_b)
+        n = len(GENDER_NAMES)
+        pairs = self.gender(lang_a)[both].astype(np.int64) * n + self.gender(lang_b)[both]
+        return np.bincount(pairs, minlength=n * n).reshape(n, n)
+
+    def initials(self) -> Tuple[List[str], np.ndarray]:
+        """(頭文字の一覧, 単語ごとの頭文字番号)"""
+        if self._initials is None:
+            letters = np.array([w[0] for w in self.words])
+            unique, inverse = np.unique(letters, return_inverse=True)
+            self._initials = (unique.tolist(), inverse)
+        return self._initials
+
+    def by_initial(self, lang: str) -> Tuple[List[str], np.ndarray]:
+        """頭文字ごとの性別分布。(頭文字, [頭文字数 x len(GENDER_NAMES)] の件数)"""
+        letters, inverse = self.initials()
+        covered = self.covered(lang)
+        n = len(GENDER_NAMES)
+        cells = inverse[covered] * n + self.gender(lang)[covered]
+        counts = np.bincount(cells, minlength=len(letters) * n).reshape(len(letters), n)
+        return letters, counts
+
+    def coverage_counts(self) -> Dict[str, int]:
+        """言語ごとの翻訳数"""
+        return {lang: int(((self.coverage >> i) & 1).sum()) for i, lang in enumerate(self.languages)}
+
+    def coverage_histogram(self) -> np.ndarray:
+        """翻訳がある言語数ごとの単語数（添字 = 言語数）"""
+        bits = np.zeros(len(self.words), dtype=np.int64)
+        for i in range(len(self.languages)):
+            bits += (self.coverage >> i) & 1
+        return np.bincount(bits, minlength=len(self.languages) + 1)
+
+    def agreement(self) -> np.ndarray:
+        """言語ペアごとの性別一致率（両言語で m/f/n が付いている単語のうち同じ性別の割合）"""
+        n = len(self.languages)
+        result = np.full((n, n), np.nan)
+        gendered = [
+            self.covered(lang) & np.isin(self.genders[i], (1, 2, 3)) for i, lang in enumerate(self.languages)
+        ]
+        for a in range(n):
+            for b in range(n):
+                both = gendered[a] & gendered[b]
+                total = both.sum()
+                if total:
+                    same = (self.genders[a][both] == self.genders[b][both]).sum()
+                    result[a, b] = same / total
+        return result
+
+    def api_stats(self) -> Dict:
+        """/api/stats のレスポンス（src/lib/db.ts の getStats と同じ形・同じ定義）"""
+        counts = self.coverage_counts()
+        language_stats = [
+            {"language": lang, "count": counts[lang]}
+            for lang in API_LANGUAGE_ORDER
+            if counts.get(lang, 0) > 0
+        ]
+        language_stats.sort(key=lambda s: -s["count"])
+        total_translations = sum(counts.values())
+        return {
+            "totalWords": int((self.coverage != 0).sum()),
+            "totalTranslations": total_translations,
+            "multilingualTerms": total_translations + len(self.words),
+            "searchLanguages": len(language_stats) + 1,
+            "languageStats": language_stats,
+        }
+
+
+def report(matrix: GenderMatrix) -> Dict:
+    """QAレポート（JSON化できる dict）"""
+    return {
+        "words": len(matrix.words),
+        "languages": matrix.languages,
+        "distribution": {lang: matrix.distribution(lang) for lang in matrix.languages},
+        "coverage": matrix.coverage_counts(),
+        "coverage_histogram": matrix.coverage_histogram().tolist(),
+        "agreement": {
+            a: {b: None if np.isnan(v) else round(float(v), 4) for b, v in zip(matrix.languages, row)}
+            for a, row in zip(matrix.languages, matrix.agreement())
+        },
+        "api_stats": matrix.api_stats(),
+    }
+
+
+def print_table(title: str, row_labels: List[str], col_labels: List[str], values):
+    """件数の表を表示"""
+    print(f"\n{title}")
+    width = max(6, *(len(c) for c in col_labels))
+    print(" " * 8 + "".join(f"{c:>{width + 1}}" for c in col_labels))
+    for label, row in zip(row_labels, values):
+        print(f"{label:<8}" + "".join(f"{int(v):>{width + 1}}" for v in row))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gender statistics over the words x languages matrix")
+    parser.add_argument("--crosstab", nargs=2, metavar=("LANG_A", "LANG_B"), help="Gender cross-tab")
+    parser.add_argument("--by-initial", metavar="LANG", help="Gender distribution per initial letter")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    ds = load_dataset()
+    start = time.perf_counter()
+    matrix = GenderMatrix.from_dataset(ds)
+    built = time.perf_counter() - start
+
+    try:
+        if args.crosstab:
+            lang_a, lang_b = args.crosstab
+            print_table(
+                f"{lang_a} (行) × {lang_b} (列)", GENDER_NAMES, GENDER_NAMES, matrix.crosstab(lang_a, lang_b)
+            )
+            return
+        if args.by_initial:
+            letters, counts = matrix.by_initial(args.by_initial)
+            print_table(f"{args.by_initial} の頭文字別性別分布", letters, GENDER_NAMES, counts)
+            return
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    result = report(matrix)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"📊 性別マトリクス: {len(matrix.words)}語 × {len(matrix.languages)}言語")
+    print(f"   構築 {built * 1000:.1f} ms / 集計 {elapsed * 1000:.1f} ms")
+    print("=" * 60)
+
+    print_table(
+        "言語別の性別分布（翻訳あり）",
+        matrix.languages,
+        GENDER_NAMES + ["total"],
+        [
+            list(result["distribution"][lang].values()) + [result["coverage"][lang]]
+            for lang in matrix.languages
+        ],
+    )
+
+    print("\n翻訳がある言語数ごとの単語数")
+    for n, count in enumerate(result["coverage_histogram"]):
+        print(f"  {n}言語: {count}")
+
+    print("\n性別一致率（両言語で m/f/n が付いている単語）")
+    print(" " * 6 + "".join(f"{lang:>7}" for lang in matrix.languages))
+    for a in matrix.languages:
+        row = result["agreement"][a]
+        print(
+            f"{a:<6}"
+            + "".join(f"{'-':>7}" if row[b] is None else f"{row[b] * 100:>6.1f}%" for b in matrix.languages)
+        )
+
+    stats = result["api_stats"]
+    print(
+        f"\n/api/stats: {stats['totalWords']} words, "
+        f"{stats['totalTranslations']} translations, {stats['searchLanguages']} languages"
+    )
+
+
+if __name__ == "__main__":
+    main()
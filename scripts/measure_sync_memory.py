@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+sync_to_d1.py のピークメモリ（最大RSS）計測
+
+data/ の CSV を N 倍に複製した合成データを作り、このスクリプトと同じ scripts/ の sync_to_d1.py を
+fake_wrangler（遅延0）相手に実行して最大RSSと所要時間を表示する。
+
+使い方:
+    python scripts/measure_sync_memory.py                          # 1倍と100倍
+    python scripts/measure_sync_memory.py --scales 1 10
+    python scripts/measure_sync_memory.py --target sqlite
+
+最大RSSは os.wait4 で取得する（子プロセスの fake_wrangler を含む最大値）。
+計測用のツリーにはスナップショット（.cache/）がないため、CSVの解析も計測に含まれる。
+別のリビジョンと比べるときは、そのリビジョンを git worktree で取り出し、同じ data/ の構成
+（words.csv と translations_{lang}.csv）を読むリビジョンどうしでこのスクリプトを実行する。
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from dataset import DATA_DIR, source_files
+
+SCRIPTS_DIR = Path(__file__).parent
+FAKE_WRANGLER = SCRIPTS_DIR / "fake_wrangler.py"
+
+# 複製時に接尾辞を付けて一意にする列（自然キーと examples のキー）
+SUFFIX_COLUMNS = {"en": "~{k}", "example_en": " ({k})"}
+
+
+def write_synthetic_data(dest: Path, scale: int) -> int:
+    """data/ の各CSVを scale 倍に複製して dest に書き出す。総バイト数を返す
+
+    2周目以降は en（と例文）に接尾辞を付け、別の単語として扱われるようにする。
+    1行ずつ読み書きするため、元データも複製データもメモリに載せない。
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    total = 0
+    for _, path in source_files(DATA_DIR).values():
+        if not path.exists():
+            continue
+        out_path = dest / path.name
+        with open(out_path, "w", encoding="utf-8", newline="") as out:
+            writer = csv.writer(out, delimiter="\t", lineterminator="\n")
+            for k in range(scale):
+                with open(path, "r", encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f, delimiter="\t")
+                    header = next(reader, [])
+                    if k == 0:
+                        writer.writerow(header)
+                    suffixes = [
+                        (i, SUFFIX_COLUMNS[name].format(k=k))
+                        for i, name in enumerate(header)
+                        if name in SUFFIX_COLUMNS
+                    ]
+                    for row in reader:
+                        if k > 0:
+                            for i, suffix in suffixes:
+                                if i < len(row) and row[i]:
+                                    row[i] += suffix
+                        writer.writerow(row)
+        total += out_path.stat().st_size
+    return total
+
+
+def prepare_tree(root: Path, data_dir: Path):
+    """計測用のプロジェクトツリー（scripts/ のコピーと data/ へのシンボリックリンク）を作る"""
+    root.mkdir(parents=True)
+    shutil.copytree(SCRIPTS_DIR, root / "scripts", ignore=shutil.ignore_patterns("__pycache__"))
+    (root / "data").symlink_to(data_dir.resolve(), target_is_directory=True)
+
+
+def measure(root: Path, target: str) -> Tuple[float, float, int]:
+    """sync_to_d1.py を1回実行し (最大RSS[MB], 秒, 終了コード) を返す"""
+    command = [sys.executable, str(root / "scripts" / "sync_to_d1.py")]
+    if target == "sqlite":
+        command.append(f"--target=sqlite:{root / 'local.db'}")
+
+    env = dict(os.environ)
+    env["WRANGLER"] = f"{sys.executable} {FAKE_WRANGLER}"
+    env["FAKE_WRANGLER_LATENCY"] = "0"
+    env.pop("FAKE_WRANGLER_DB", None)
+    env.pop("FAKE_WRANGLER_FAIL_RATE", None)
+
+    log_file = root / "sync.log"
+    start = time.perf_counter()
+    with open(log_file, "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(command, cwd=root, env=env, stdout=log, stderr=log)
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - start
+    # Linux の ru_maxrss は KB 単位
+    return usage.ru_maxrss / 1024, elapsed, proc.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure peak RSS of sync_to_d1.py on synthetic data")
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1, 100], help="Copies of data/ to sync (default: 1 100)"
+    )
+    parser.add_argument(
+        "--target", choices=["d1", "sqlite"], default="d1", help="d1 (fake wrangler, no latency) or sqlite"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary directory")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="sync_memory_"))
+    results: List[Tuple[int, float, float, int]] = []
+    try:
+        for scale in args.scales:
+            data_dir = work_dir / f"data_x{scale}"
+            size = write_synthetic_data(data_dir, scale)
+            print(f"x{scale}: synthetic data {size / 1024 / 1024:.1f} MB")
+            root = work_dir / f"tree_x{scale}"
+            prepare_tree(root, data_dir)
+            rss, elapsed, code = measure(root, args.target)
+            status = "" if code == 0 else f" (exit {code}, see {root / 'sync.log'})"
+            print(f"  {rss:.1f} MB peak RSS, {elapsed:.1f}s{status}")
+            results.append((scale, rss, elapsed, code))
+            # 合成データ・スナップショット・SQLiteファイルは大きいので消しておく（--keep 時は残す）
+            if not args.keep:
+                shutil.rmtree(data_dir)
+                shutil.rmtree(root / ".cache", ignore_errors=True)
+                (root / "local.db").unlink(missing_ok=True)
+    finally:
+        if args.keep:
+            print(f"Kept {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print()
+    print(f"{'scale':>6} {'peak RSS':>12} {'time':>8}")
+    for scale, rss, elapsed, code in results:
+        mark = "" if code == 0 else "  FAILED"
+        print(f"{'x' + str(scale):>6} {rss:>9.1f} MB {elapsed:>7.1f}s{mark}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+意味・例文の近似重複検出（MinHash / LSH）
+
+別々の単語（en）に付いた、ほぼ同じ意味翻訳・例文（コピー＆ペーストされた定義や
+"Il/La abbazia" のようなテンプレートの埋め草）を見つける。
+
+1. テキストを正規化（小文字化・空白の圧縮）し、その行の翻訳語・英単語を
+   プレースホルダーに置き換える（テンプレートに単語を埋めただけの文を同一視するため）
+2. 文字 k-gram（shingle）のハッシュを NumPy でまとめて計算
+3. MinHash シグネチャを作り、LSH（band に分割してバケット化）で候補を絞る
+4. 候補だけ shingle 集合の Jaccard 係数を計算し、閾値以上をクラスタにまとめる
+
+言語・列ごと（fr の meaning_translation、ja の例文など）に別のバケットとして扱う。
+全ペアを比較しないため、約4.6万件のテキストでも数秒で終わる。
+
+使い方:
+    python scripts/near_duplicates.py                        # 全言語の意味翻訳・例文・meaning_en
+    python scripts/near_duplicates.py --threshold 0.9 --lang fr
+    python scripts/near_duplicates.py --file data/translations_it_test.csv
+    python scripts/near_duplicates.py --no-mask --json
+"""
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from dataset import RECORD_SPECS, Dataset, load_dataset, parse_file
+
+# MinHash の置換に使う素数（2^32 より大きい）
+PRIME = (1 << 32) + 15
+
+# 行の翻訳語・英単語を置き換えるプレースホルダー（通常のテキストに現れない文字）
+PLACEHOLDER = "␀"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class Text(NamedTuple):
+    """比較対象のテキスト（row はヘッダーを除いた1始まりの行番号）"""
+
+    source: str
+    row: int
+    en: str
+    text: str
+    mask: Tuple[str, ...]
+
+
+class Cluster(NamedTuple):
+    """近似重複のクラスタ（similarity は代表との Jaccard 係数の最小値）"""
+
+    bucket: str
+    similarity: float
+    members: List[Text]
+
+
+def normalize(text: str, mask: Iterable[str] = ()) -> str:
+    """小文字化・空白の圧縮をし、mask の語をプレースホルダーに置き換える"""
+    text = _WHITESPACE.sub(" ", text.strip().lower())
+    # 長い語から置き換える（"ice cream" の前に "ice" を置き換えない）
+    for term in sorted({m.strip().lower() for m in mask if m.strip()}, key=len, reverse=True):
+        text = text.replace(term, PLACEHOLDER)
+    return text
+
+
+def collect_texts(
+    ds: Dataset, languages: Optional[List[str]] = None, extra_files: Iterable[Path] = ()
+) -> Dict[str, List[Text]]:
+    """バケット名（"fr meaning_translation" など）→ テキストのリスト"""
+    buckets: Dict[str, List[Text]] = {}
+
+    if not languages:
+        buckets["en meaning_en"] = [
+            Text("words.csv", i, w.en, w.meaning_en, (w.en,)) for i, w in enumerate(ds.words, 1)
+        ]
+
+    for lang, rows in ds.translations.items():
+        if languages and lang not in languages:
+            continue
+        buckets[f"{lang} meaning_translation"] = [
+            Text(f"translations_{lang}.csv", i, t.en, t.meaning_translation, (t.translation, t.en))
+            for i, t in enumerate(rows, 1)
+        ]
+
+    # 例文の中の翻訳語も置き換える
+    translations = {lang: {t.en: t.translation for t in rows} for lang, rows in ds.translations.items()}
+    for i, e in enumerate(ds.example_translations, 1):
+        if languages and e.lang not in languages:
+            continue
+        word = translations.get(e.lang, {}).get(e.en, "")
+        buckets.setdefault(f"{e.lang} example_translation", []).append(
+            Text("example_translations.csv", i, e.en, e.example_translation, (word, e.en))
+        )
+
+    # 任意の translations 形式のファイル（translations_it_test.csv など）
+    make = RECORD_SPECS["translations"][0]._make
+    for path in extra_files:
+        path = Path(path)
+        buckets[f"{path.name} meaning_translation"] = [
+            Text(path.name, i, t.en, t.meaning_translation, (t.translation, t.en))
+            for i, t in enumerate(map(make, parse_file("translations", path)), 1)
+        ]
+    return buckets
+
+
+def shingle_hashes(texts: List[str], k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """全テキストの文字 k-gram のハッシュ（uint64, 32ビット値）をまとめて計算する
+
+    Returns:
+        (ハッシュ, テキストごとの開始位置, テキストごとの個数)。
+        k 文字未満のテキストは個数0。
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    # 区切りなしで連結し、テキストをまたぐ窓は後で除く
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(texts) else lengths
+    counts = np.maximum(lengths - k + 1, 0)
+
+    windows = max(len(codes) - k + 1, 0)
+    rolling = np.zeros(windows, dtype=np.uint64)
+    mask = np.uint64(0xFFFFFFFF)
+    base = np.uint64(1_000_003)
+    for j in range(k):
+        rolling = (rolling * base + codes[j : j + windows]) & mask
+
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(texts) else counts
+    total = int(counts.sum())
+    owner = np.repeat(np.arange(len(texts)), counts)
+    positions = starts[owner] + (np.arange(total) - offsets[owner])
+    return rolling[positions], offsets, counts
+
+
+def minhash_signatures(
+    hashes: np.ndarray, offsets: np.ndarray, counts: np.ndarray, num_perm: int, seed: int
+) -> np.ndarray:
+    """[テキスト数 x num_perm] の MinHash シグネチャ（shingle のないテキストは最大値）"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+    signatures = np.full((len(counts), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    nonempty = counts > 0
+    if not nonempty.any():
+        return signatures
+    starts = offsets[nonempty]
+    prime = np.uint64(PRIME)
+    for p in range(num_perm):
+        values = (a[p] * hashes + b[p]) % prime
+        signatures[nonempty, p] = np.minimum.reduceat(values, starts)
+    return signatures
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """閾値 ≈ (1/bands)^(1/rows) となる (bands, rows)（bands * rows <= num_perm）"""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def lsh_buckets(signatures: np.ndarray, bands: int, rows: int) -> Iterable[np.ndarray]:
+    """band ごとに同じ値を持つテキストの添字の配列（2件以上のもの）を返す"""
+    for band in range(bands):
+        chunk = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        keys = chunk.view(np.dtype((np.void, chunk.dtype.itemsize * rows))).ravel()
+        _, inverse, sizes = np.unique(keys, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind="stable")
+        boundaries = np.concatenate(([0], np.cumsum(sizes)))
+        for group in np.flatnonzero(sizes > 1):
+            yield order[boundaries[group] : boundaries[group + 1]]
+
+
+def find_clusters(
+    bucket: str,
+    texts: List[Text],
+    threshold: float = 0.8,
+    k: int = 5,
+    num_perm: int = 64,
+    min_length: int = 12,
+    mask: bool = True,
+    seed: int = 1,
+) -> List[Cluster]:
+    """1バケットの近似重複クラスタ（異なる en が2つ以上あるもののみ）"""
+    # 短すぎるテキスト（"m" だけなど）は比較しない。長さは置き換え前で判定する
+    normalized = [
+        (normalize(t.text, t.mask if mask else ()) if len(t.text.strip()) >= min_length else "")
+        for t in texts
+    ]
+
+    hashes, offsets, counts = shingle_hashes(normalized, k)
+    signatures = minhash_signatures(hashes, offsets, counts, num_perm, seed)
+    bands, rows = choose_bands(num_perm, threshold)
+
+    shingles: Dict[int, set] = {}
+
+    def shingle_set(i: int) -> set:
+        if i not in shingles:
+            shingles[i] = set(hashes[offsets[i] : offsets[i] + counts[i]].tolist())
+        return shingles[i]
+
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    similarity: Dict[Tuple[int, int], float] = {}
+    for members in lsh_buckets(signatures, bands, rows):
+        members = [int(i) for i in members if counts[i] > 0]
+        if len(members) < 2:
+            continue
+        # バケットの先頭と比較する（同じテンプレートが数千件あっても O(n)）
+        head = members[0]
+        head_set = shingle_set(head)
+        for i in members[1:]:
+            if find(i) == find(head):
+                continue
+            other = shingle_set(i)
+            jaccard = len(head_set & other) / len(head_set | other)
+            if jaccard >= threshold:
+                parent[find(i)] = find(head)
+                similarity[(head, i)] = jaccard
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(texts)):
+        if counts[i] > 0:
+            groups.setdefault(find(i), []).append(i)
+
+    clusters = []
+    for root, members in groups.items():
+        if len(members) < 2 or len({texts[i].en for i in members}) < 2:
+            continue
+        scores = [s for (a, b), s in similarity.items() if find(a) == root]
+        clusters.append(Cluster(bucket, round(min(scores), 3), [texts[i] for i in members]))
+    clusters.sort(key=lambda c: (-len(c.members), -c.similarity))
+    return clusters
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find near-duplicate meaning and example texts across words")
+    parser.add_argument(
+        "--threshold", type=float, default=0.8, help="Jaccard similarity of shingle sets (default: 0.8)"
+    )
+    parser.add_argument("--shingle", type=int, default=5, help="Shingle size in characters (default: 5)")
+    parser.add_argument("--num-perm", type=int, default=64, help="MinHash permutations (default: 64)")
+    parser.add_argument("--min-length", type=int, default=12, help="Skip shorter texts (default: 12)")
+    parser.add_argument(
+        "--no-mask", action="store_true", help="Do not replace the row's own word with a placeholder"
+    )
+    parser.add_argument("--lang", action="append", help="Only the given language (repeatable)")
+    parser.add_argument(
+        "--file",
+        type=Path,
+        action="append",
+        default=[],
+        help="Also scan a translations-format CSV (e.g. data/translations_it_test.csv)",
+    )
+    parser.add_argument("--limit", type=int, default=5, help="Clusters to show per bucket")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    if not 0 < args.threshold <= 1:
+        print("❌ --threshold は 0〜1 で指定してください")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    buckets = collect_texts(load_dataset(), args.lang, args.file)
+    results: Dict[str, List[Cluster]] = {}
+    for bucket, texts in buckets.items():
+        results[bucket] = find_clusters(
+            bucket,
+            texts,
+            threshold=args.threshold,
+            k=args.shingle,
+            num_perm=args.num_perm,
+            min_length=args.min_length,
+            mask=not args.no_mask,
+        )
+    elapsed = time.perf_counter() - start
+    total_texts = sum(len(texts) for texts in buckets.values())
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    bucket: [
+                        {"similarity": c.similarity, "members": [m._asdict() for m in c.members]}
+                        for c in clusters
+                    ]
+                    for bucket, clusters in results.items()
+                    if clusters
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+        return
+
+    print("=" * 80)
+    print(
+        f"🧬 近似重複検出: {total_texts}件 / {len(buckets)}バケット "
+        f"(閾値 {args.threshold}, {args.shingle}-gram, {args.num_perm} perm)"
+    )
+    print("=" * 80)
+
+    found = 0
+    for bucket, clusters in results.items():
+        if not clusters:
+            continue
+        found += len(clusters)
+        words = sum(len(c.members) for c in clusters)
+        print(f"\n📁 {bucket}: {len(clusters)}クラスタ / {words}件")
+        for c in clusters[: args.limit]:
+            print(f"  [{len(c.members)}件, 類似度 >= {c.similarity:.2f}]")
+            for m in c.members[:3]:
+                print(f"    {m.source} 行{m.row}: {m.en} → {m.text[:70]}")
+            if len(c.members) > 3:
+                print(f"    ... and {len(c.members) - 3} more")
+        if len(clusters) > args.limit:
+            print(f"  ... and {len(clusters) - args.limit} more clusters")
+
+    print("\n" + "=" * 80)
+    if found:
+        print(f"⚠️  {found}クラスタの近似重複が見つかりました ({elapsed:.2f}s)")
+    else:
+        print(f"✅ 近似重複はありません ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+接頭辞パターンの照合（トライ木）
+
+冠詞や品詞パターンのように「文字列がどのパターンで始まるか」を調べる処理を、
+パターンのリストを1つずつ startswith で試す代わりに、事前に構築したトライ木を
+先頭から1回たどるだけで判定する。1行あたりのコストはパターン数ではなく
+最長パターンの長さで決まるため、パターンが数百に増えても変わらない。
+
+複数のパターンが一致する場合は、登録順が最も早いパターンの値を返す
+（リストを先頭から startswith で試して最初に一致したものと同じ結果）。
+
+使い方:
+    from prefix_matcher import PrefixMatcher
+    matcher = PrefixMatcher([("To ", "VERB"), ("Relating to", "ADJECTIVE")])
+    matcher.match("To run quickly")      # "VERB"
+    matcher.match("A building")          # None
+
+    python scripts/prefix_matcher.py --bench             # startswith との速度比較
+    python scripts/prefix_matcher.py --bench --patterns 500
+"""
+
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# ノードの終端情報を入れるキー（文字と衝突しない）
+_END = None
+
+
+class PrefixMatcher:
+    """接頭辞 → 値のトライ木"""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = ()):
+        self._root: Dict = {}
+        self._size = 0
+        for prefix, value in patterns:
+            self.add(prefix, value)
+
+    def add(self, prefix: str, value: Any):
+        """パターンを追加する。同じ接頭辞が既にあれば先に登録した値を残す"""
+        if not prefix:
+            raise ValueError("Empty prefix")
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        if _END not in node:
+            # (登録順, 値)。一致した中で登録順が最小のものを返す
+            node[_END] = (self._size, value)
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def match(self, text: str) -> Optional[Any]:
+        """text の先頭に一致するパターンのうち、登録順が最も早いものの値（なければ None）"""
+        node = self._root
+        best = None
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            hit = node.get(_END)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+        return None if best is None else best[1]
+
+
+def benchmark(pattern_count: int, rows: int = 50000):
+    """startswith の線形探索とトライ木の1行あたりの時間を比較"""
+    import random
+
+    random.seed(0)
+    letters = "abcdefghijklmnopqrstuvwxyz "
+    patterns = [
+        "".join(random.choice(letters) for _ in range(random.randint(2, 12))) for _ in range(pattern_count)
+    ]
+    texts = ["".join(random.choice(letters) for _ in range(40)) for _ in range(rows)]
+    # 一部の行はパターンで始まるようにする
+    for i in range(0, rows, 10):
+        texts[i] = random.choice(patterns) + texts[i]
+
+    start = time.perf_counter()
+    linear = [next((p for p in patterns if t.startswith(p)), None) for t in texts]
+    linear_time = time.perf_counter() - start
+
+    matcher = PrefixMatcher((p, p) for p in patterns)
+    start = time.perf_counter()
+    trie = [matcher.match(t) for t in texts]
+    trie_time = time.perf_counter() - start
+
+    assert linear == trie
+    print(
+        f"{pattern_count:>5} patterns: startswith {linear_time / rows * 1e6:6.2f} µs/row, "
+        f"trie {trie_time / rows * 1e6:6.2f} µs/row"
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prefix matcher benchmark")
+    parser.add_argument("--bench", action="store_true", help="Compare against a startswith scan")
+    parser.add_argument(
+        "--patterns",
+        type=int,
+        nargs="+",
+        default=[10, 100, 500],
+        help="Pattern counts to benchmark (default: 10 100 500)",
+    )
+    args = parser.parse_args()
+
+    if not args.bench:
+        parser.print_help()
+        sys.exit(1)
+    for count in args.patterns:
+        benchmark(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,95 +2,518 @@
 """
 進捗管理ヘルパースクリプト
 使い方:
-  python scripts/progress_manager.py init stage1           # 進捗ファイル初期化
+  python scripts/progress_manager.py init stage1           # 進捗を初期化
   python scripts/progress_manager.py show                  # 全ステージ進捗表示
   python scripts/progress_manager.py show stage1           # 特定ステージ詳細表示
   python scripts/progress_manager.py reset stage1 abbey    # 特定単語をリセット
+  python scripts/progress_manager.py set stage2 abbey completed fr   # 状態を更新
+  python scripts/progress_manager.py migrate               # 旧JSONLを取り込む
+  python scripts/progress_manager.py claim stage3 fr --batch 20 --lease 10m   # 作業を受け取る
+  python scripts/progress_manager.py complete <lease_id> [word ...]          # 完了を報告
+  python scripts/progress_manager.py fail <lease_id> abbey --error "..."     # 失敗を報告
+  python scripts/progress_manager.py renew <lease_id> --lease 10m            # 期限を延長
+
+進捗は SQLite（WAL モード）の1ファイルに (stage, language, en) を主キーとして保存する。
+1単語の更新は主キーによる1行の UPDATE、集計は (stage, language, status) の索引だけで
+済むため、単語数が増えてもファイル全体を読み書きしない。言語ごとの翻訳ワーカーが
+並列に更新しても、各更新は独立したトランザクションなので互いの書き込みを消さない
+（書き込みが重なった場合は busy_timeout の間待つ）。
+
+並列ワーカーは claim で pending の単語をまとめて受け取る。受け取った単語は
+in_progress になり、リース ID と期限が付く。complete / fail はリース ID が一致する
+単語だけを更新するため、期限切れで他のワーカーに渡った単語を古いワーカーが
+上書きすることはない。期限切れのリース（とリースのない in_progress）は次の
+claim が pending に戻してから配る。
+
+ワーカーからの利用:
+    from progress_manager import open_progress
+    with open_progress() as store:
+        lease = store.claim("stage3", "fr", batch=20, lease_seconds=600)
+        for en in lease.words:
+            ...
+        store.complete(lease.lease_id, lease.words)
 """
 
 import json
-import csv
+import re
+import sqlite3
 import sys
-from pathlib import Path
+import time
+import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from word_index import open_index
 
 PROGRESS_DIR = Path(".claude/workflow/progress")
+PROGRESS_DB = PROGRESS_DIR / "progress.db"
 CHECKPOINT_DIR = Path(".claude/workflow/checkpoints")
-CSV_FILES = {
-    "stage1": "data/word_gender_translations.csv",
-    "stage2": "data/word_examples.csv",
-    "stage3": "data/word_gender_translations.csv",
-    "stage4": "data/word_meaning_translations.csv",
+# 全ステージとも words.csv の単語リストを対象にする
+STAGES = ("stage1", "stage2", "stage3", "stage4")
+STATUSES = ("pending", "in_progress", "completed", "failed")
+
+# 他の書き込みが終わるのを待つ最大時間（ミリ秒）
+BUSY_TIMEOUT_MS = 30_000
+
+# claim の既定値
+DEFAULT_BATCH = 10
+DEFAULT_LEASE = "10m"
+
+# PRAGMA user_version。スキーマを変えたら上げ、MIGRATIONS に変更を追加する
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+  stage TEXT NOT NULL,
+  language TEXT NOT NULL DEFAULT '',
+  en TEXT NOT NULL,
+  status TEXT NOT NULL,
+  timestamp TEXT,
+  data TEXT,
+  lease_id TEXT,
+  lease_expires REAL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (stage, language, en)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_progress_status ON progress(stage, language, status);
+CREATE INDEX IF NOT EXISTS idx_progress_lease ON progress(lease_id) WHERE lease_id IS NOT NULL;
+"""
+
+# バージョン → そのバージョンに上げるSQL（既存のデータベース用）
+MIGRATIONS = {
+    2: """
+ALTER TABLE progress ADD COLUMN lease_id TEXT;
+ALTER TABLE progress ADD COLUMN lease_expires REAL;
+ALTER TABLE progress ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0;
+CREATE INDEX IF NOT EXISTS idx_progress_lease ON progress(lease_id) WHERE lease_id IS NOT NULL;
+""",
 }
 
 
-def load_progress(stage: str, language: Optional[str] = None) -> Dict:
-    """進捗を読み込み"""
-    if language:
-        filename = f"{stage}-{language}.jsonl"
-    else:
-        filename = f"{stage}.jsonl"
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
-    progress_file = PROGRESS_DIR / filename
 
-    if not progress_file.exists():
-        return {}
+def parse_duration(text: str) -> float:
+    """ "10m" / "30s" / "1h" / "90" （秒）を秒数に変換"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", text)
+    if not match:
+        raise ValueError(f"Invalid duration: {text}")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
 
-    progress = {}
-    with open(progress_file, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                record = json.loads(line)
-                progress[record["en"]] = record
 
-    return progress
+def stage_label(stage: str, language: Optional[str]) -> str:
+    """表示・旧JSONLファイル名用のステージ名（例: stage2-fr）"""
+    return f"{stage}-{language}" if language else stage
 
 
-def save_progress(stage: str, progress: Dict, language: Optional[str] = None):
-    """進捗を保存"""
-    if language:
-        filename = f"{stage}-{language}.jsonl"
-    else:
-        filename = f"{stage}.jsonl"
+class Lease(NamedTuple):
+    """claim で受け取った作業"""
 
-    progress_file = PROGRESS_DIR / filename
-    progress_file.parent.mkdir(parents=True, exist_ok=True)
+    lease_id: str
+    stage: str
+    language: str
+    words: List[str]
+    expires: float
 
-    with open(progress_file, "w", encoding="utf-8") as f:
-        for record in progress.values():
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
+class ProgressStore:
+    """進捗データベース
 
-def init_progress(stage: str, language: Optional[str] = None):
-    """進捗ファイルを初期化"""
-    # CSVファイルを決定
-    if stage.startswith("stage3"):
-        csv_file = CSV_FILES["stage3"]
-    elif stage.startswith("stage4"):
-        csv_file = CSV_FILES["stage4"]
-    else:
-        csv_file = CSV_FILES.get(stage)
+    language は省略時に空文字として保存する（言語に依存しないステージ）。
+    レコードは旧JSONLと同じ dict（en, status, timestamp と任意の追加フィールド）。
+    """
 
-    if not csv_file:
+    def __init__(self, path: Path = PROGRESS_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        created = not self.path.exists()
+        # 自動コミット。書き込みは transaction() で明示的に囲む
+        self.conn = sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self._ensure_schema(created)
+        # 作成時に旧JSONLから取り込んだレコード数
+        self.imported = self.import_jsonl() if created else 0
+
+    def _ensure_schema(self, created: bool):
+        """スキーマを作る、または古いバージョンのデータベースを移行する"""
+        with self.transaction():
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'progress'"
+            ).fetchone()
+            if created or not exists:
+                self._execute_script(SCHEMA)
+            else:
+                # user_version を持たない最初の形式はバージョン1
+                for target in range(max(version, 1) + 1, SCHEMA_VERSION + 1):
+                    self._execute_script(MIGRATIONS[target])
+            if version != SCHEMA_VERSION:
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _execute_script(self, sql: str):
+        """複数の文を実行（executescript と違いトランザクションを勝手にコミットしない）"""
+        for statement in sql.split(";"):
+            if statement.strip():
+                self.conn.execute(statement)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "ProgressStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def transaction(self):
+        """書き込みトランザクション（BEGIN IMMEDIATE で最初に書き込みロックを取る）"""
+        return _Transaction(self.conn)
+
+    # --- 書き込み
+
+    def init(self, stage: str, words: Iterable[str], language: Optional[str] = None):
+        """ステージの進捗を全単語 pending で作り直す"""
+        language = language or ""
+        timestamp = now()
+        with self.transaction():
+            self.conn.execute(
+                "DELETE FROM progress WHERE stage = ? AND language = ?",
+                (stage, language),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO progress (stage, language, en, status, timestamp) "
+                "VALUES (?, ?, ?, 'pending', ?)",
+                ((stage, language, en, timestamp) for en in words),
+            )
+
+    def set_status(
+        self,
+        stage: str,
+        en: str,
+        status: str,
+        language: Optional[str] = None,
+        **fields,
+    ) -> bool:
+        """1単語の状態を更新（追加のフィールドは error などとして保存）。単語がなければ False
+
+        リースは解除する（手動の更新はワーカーの作業より優先する）。
+        """
+        cursor = self.conn.execute(
+            "UPDATE progress SET status = ?, timestamp = ?, data = ?, "
+            "lease_id = NULL, lease_expires = NULL "
+            "WHERE stage = ? AND language = ? AND en = ?",
+            (
+                status,
+                now(),
+                json.dumps(fields, ensure_ascii=False) if fields else None,
+                stage,
+                language or "",
+                en,
+            ),
+        )
+        return cursor.rowcount > 0
+
+    def upsert(
+        self, stage: str, records: Iterable[Dict], language: Optional[str] = None
+    ):
+        """レコード（en, status と任意のフィールド）をまとめて追加・更新"""
+        rows = self._rows(stage, records, language)
+        with self.transaction():
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO progress "
+                "(stage, language, en, status, timestamp, data) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    @staticmethod
+    def _rows(
+        stage: str, records: Iterable[Dict], language: Optional[str]
+    ) -> List[Tuple]:
+        """レコードを progress テーブルの (stage, language, en, status, timestamp, data) に変換"""
+        rows = []
+        for record in records:
+            extra = {
+                k: v
+                for k, v in record.items()
+                if k
+                not in (
+                    "en",
+                    "status",
+                    "timestamp",
+                    "lease_id",
+                    "lease_expires",
+                    "attempts",
+                )
+            }
+            rows.append(
+                (
+                    stage,
+                    language or "",
+                    record["en"],
+                    record["status"],
+                    record.get("timestamp"),
+                    json.dumps(extra, ensure_ascii=False) if extra else None,
+                )
+            )
+        return rows
+
+    # --- 作業キュー
+
+    def reclaim_expired(self, stage: str, language: Optional[str] = None) -> int:
+        """期限切れのリースとリースのない in_progress を pending に戻す。戻した数を返す"""
+        cursor = self.conn.execute(
+            "UPDATE progress SET status = 'pending', lease_id = NULL, lease_expires = NULL "
+            "WHERE stage = ? AND language = ? AND status = 'in_progress' "
+            "AND (lease_expires IS NULL OR lease_expires < ?)",
+            (stage, language or "", time.time()),
+        )
+        return cursor.rowcount
+
+    def claim(
+        self,
+        stage: str,
+        language: Optional[str] = None,
+        batch: int = DEFAULT_BATCH,
+        lease_seconds: float = parse_duration(DEFAULT_LEASE),
+    ) -> Lease:
+        """pending の単語を最大 batch 語、新しいリースで受け取る（words が空なら残りなし）
+
+        期限切れのリースの回収・単語の選択・in_progress への更新は1つの書き込み
+        トランザクションで行うため、同時に claim した2つのワーカーが同じ単語を
+        受け取ることはない。
+        """
+        lease_id = uuid.uuid4().hex[:16]
+        expires = time.time() + lease_seconds
+        language = language or ""
+        with self.transaction():
+            self.reclaim_expired(stage, language)
+            words = [
+                en
+                for (en,) in self.conn.execute(
+                    "SELECT en FROM progress WHERE stage = ? AND language = ? "
+                    "AND status = 'pending' ORDER BY en LIMIT ?",
+                    (stage, language, batch),
+                )
+            ]
+            self.conn.executemany(
+                "UPDATE progress SET status = 'in_progress', timestamp = ?, data = NULL, "
+                "lease_id = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE stage = ? AND language = ? AND en = ?",
+                ((now(), lease_id, expires, stage, language, en) for en in words),
+            )
+        return Lease(lease_id, stage, language, words, expires)
+
+    def _finish(
+        self,
+        lease_id: str,
+        status: str,
+        words: Optional[Iterable[str]],
+        fields: Dict,
+    ) -> int:
+        """リースの単語（words を省略すると全部）を status にする。更新した数を返す"""
+        data = json.dumps(fields, ensure_ascii=False) if fields else None
+        sql = (
+            "UPDATE progress SET status = ?, timestamp = ?, data = ?, "
+            "lease_id = NULL, lease_expires = NULL "
+            "WHERE lease_id = ? AND status = 'in_progress'"
+        )
+        with self.transaction():
+            if words is None:
+                return self.conn.execute(sql, (status, now(), data, lease_id)).rowcount
+            return sum(
+                self.conn.execute(
+                    sql + " AND en = ?", (status, now(), data, lease_id, en)
+                ).rowcount
+                for en in words
+            )
+
+    def complete(self, lease_id: str, words: Optional[Iterable[str]] = None) -> int:
+        """リースの単語を completed にする
+
+        期限切れで他のワーカーに渡った単語はリース ID が変わっているため更新しない。
+        """
+        return self._finish(lease_id, "completed", words, {})
+
+    def fail(
+        self,
+        lease_id: str,
+        words: Optional[Iterable[str]] = None,
+        error: Optional[str] = None,
+    ) -> int:
+        """リースの単語を failed にする（error は show の詳細に表示される）"""
+        return self._finish(
+            lease_id, "failed", words, {"error": error} if error else {}
+        )
+
+    def renew(self, lease_id: str, lease_seconds: float) -> int:
+        """リースの期限を今から lease_seconds 後に延ばす。延長した単語数を返す"""
+        return self.conn.execute(
+            "UPDATE progress SET lease_expires = ? "
+            "WHERE lease_id = ? AND status = 'in_progress'",
+            (time.time() + lease_seconds, lease_id),
+        ).rowcount
+
+    # --- 読み込み
+
+    # 読み込むカラム（_record の引数の順）
+    _COLUMNS = "en, status, timestamp, data, lease_id, lease_expires, attempts"
+
+    @staticmethod
+    def _record(
+        en: str,
+        status: str,
+        timestamp: Optional[str],
+        data: Optional[str],
+        lease_id: Optional[str],
+        lease_expires: Optional[float],
+        attempts: int,
+    ):
+        record = {"en": en, "status": status}
+        if timestamp:
+            record["timestamp"] = timestamp
+        if data:
+            record.update(json.loads(data))
+        if lease_id:
+            record["lease_id"] = lease_id
+            record["lease_expires"] = lease_expires
+        if attempts:
+            record["attempts"] = attempts
+        return record
+
+    def get(
+        self, stage: str, en: str, language: Optional[str] = None
+    ) -> Optional[Dict]:
+        row = self.conn.execute(
+            f"SELECT {self._COLUMNS} FROM progress "
+            "WHERE stage = ? AND language = ? AND en = ?",
+            (stage, language or "", en),
+        ).fetchone()
+        return self._record(*row) if row else None
+
+    def records(
+        self,
+        stage: str,
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """レコードの一覧（status を指定すると索引で絞り込む）"""
+        sql = f"SELECT {self._COLUMNS} FROM progress WHERE stage = ? AND language = ?"
+        params: list = [stage, language or ""]
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._record(*row) for row in self.conn.execute(sql, params)]
+
+    def counts(self, stage: str, language: Optional[str] = None) -> Dict[str, int]:
+        """状態ごとの単語数（索引のみで集計）"""
+        return dict(
+            self.conn.execute(
+                "SELECT status, COUNT(*) FROM progress "
+                "WHERE stage = ? AND language = ? GROUP BY status",
+                (stage, language or ""),
+            ).fetchall()
+        )
+
+    def summary(self) -> Dict[Tuple[str, str], Dict[str, int]]:
+        """(stage, language) ごとの状態別の単語数"""
+        result: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for stage, language, status, count in self.conn.execute(
+            "SELECT stage, language, status, COUNT(*) FROM progress "
+            "GROUP BY stage, language, status ORDER BY stage, language"
+        ):
+            result.setdefault((stage, language), {})[status] = count
+        return result
+
+    # --- 旧形式
+
+    def import_jsonl(self, directory: Path = PROGRESS_DIR) -> int:
+        """旧形式の {stage}[-{language}].jsonl を取り込む。取り込んだレコード数を返す
+
+        progress テーブルが空のときだけ取り込む。空かどうかの確認と INSERT OR IGNORE を
+        同じ BEGIN IMMEDIATE のトランザクションで行うため、同時に取り込もうとした
+        別のプロセスは取り込み済みのテーブルを見て何もしない（進捗やリースを古い内容で
+        上書きしない）。取り込んだファイルは *.jsonl.imported に名前を変える。
+        """
+        imported = 0
+        with self.transaction():
+            paths = sorted(Path(directory).glob("*.jsonl"))
+            has_progress = self.conn.execute(
+                "SELECT 1 FROM progress LIMIT 1"
+            ).fetchone()
+            if not paths or has_progress:
+                return 0
+            for path in paths:
+                stage, _, language = path.stem.partition("-")
+                records = {}
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            records[record["en"]] = record
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO progress "
+                    "(stage, language, en, status, timestamp, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._rows(stage, records.values(), language or None),
+                )
+                imported += len(records)
+        for path in paths:
+            path.rename(path.with_name(path.name + ".imported"))
+        return imported
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def open_progress(path: Path = PROGRESS_DB) -> ProgressStore:
+    """進捗データベースを開く（なければ作り、旧JSONLがあれば取り込む）"""
+    return ProgressStore(path)
+
+
+def load_progress(stage: str, language: Optional[str] = None) -> Dict:
+    """進捗を読み込み（en → レコード）"""
+    with open_progress() as store:
+        return {record["en"]: record for record in store.records(stage, language)}
+
+
+def save_progress(stage: str, progress: Dict, language: Optional[str] = None):
+    """進捗を保存（渡したレコードだけを追加・更新する）"""
+    with open_progress() as store:
+        store.upsert(stage, progress.values(), language)
+
+
+def init_progress(stage: str, language: Optional[str] = None):
+    """進捗を初期化"""
+    if not stage.startswith(STAGES):
         print(f"❌ 不明なステージ: {stage}")
         return
 
     # 単語リストを読み込み
-    words = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        words = [row["en"] for row in reader]
-
-    # 進捗ファイル初期化
-    progress = {}
-    for word in words:
-        progress[word] = {"en": word, "status": "pending"}
+    with open_index() as index:
+        words = [word.en for word in index.words()]
 
-    save_progress(stage, progress, language)
+    with open_progress() as store:
+        store.init(stage, words, language)
 
-    stage_name = f"{stage}-{language}" if language else stage
-    print(f"✅ 進捗ファイル初期化: {stage_name} ({len(words)}語)")
+    print(f"✅ 進捗初期化: {stage_label(stage, language)} ({len(words)}語)")
 
 
 def show_summary():
@@ -99,38 +522,28 @@ def show_summary():
     print("進捗サマリー")
     print("=" * 80)
 
-    if not PROGRESS_DIR.exists():
+    if not PROGRESS_DB.exists() and not any(PROGRESS_DIR.glob("*.jsonl")):
         print("⚠️ 進捗ファイルが存在しません")
         return
 
+    with open_progress() as store:
+        summary = store.summary()
+
     total_all = 0
     completed_all = 0
 
-    for progress_file in sorted(PROGRESS_DIR.glob("*.jsonl")):
-        stage = progress_file.stem
-
-        total = 0
-        completed = 0
-        failed = 0
-        in_progress = 0
-
-        with open(progress_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    record = json.loads(line)
-                    total += 1
-                    if record["status"] == "completed":
-                        completed += 1
-                    elif record["status"] == "failed":
-                        failed += 1
-                    elif record["status"] == "in_progress":
-                        in_progress += 1
+    for (stage, language), counts in summary.items():
+        total = sum(counts.values())
+        completed = counts.get("completed", 0)
+        failed = counts.get("failed", 0)
+        in_progress = counts.get("in_progress", 0)
 
         percent = completed / total * 100 if total > 0 else 0
         status_icon = "✅" if completed == total else "⏳"
 
         print(
-            f"{status_icon} {stage:25s}: {completed:4d}/{total:4d} ({percent:5.1f}%)",
+            f"{status_icon} {stage_label(stage, language):25s}: "
+            f"{completed:4d}/{total:4d} ({percent:5.1f}%)",
             end="",
         )
         if failed > 0:
@@ -150,67 +563,164 @@ def show_summary():
 
 def show_details(stage: str, language: Optional[str] = None):
     """特定ステージの詳細を表示"""
-    progress = load_progress(stage, language)
-
-    if not progress:
-        print(f"❌ 進捗ファイルが存在しません: {stage}")
-        return
-
-    # ステータス別集計
-    pending = [r for r in progress.values() if r["status"] == "pending"]
-    in_progress = [r for r in progress.values() if r["status"] == "in_progress"]
-    completed = [r for r in progress.values() if r["status"] == "completed"]
-    failed = [r for r in progress.values() if r["status"] == "failed"]
-
-    stage_name = f"{stage}-{language}" if language else stage
+    with open_progress() as store:
+        counts = store.counts(stage, language)
+        total = sum(counts.values())
+        if not total:
+            print(f"❌ 進捗が存在しません: {stage_label(stage, language)}")
+            return
+        in_progress = store.records(stage, language, "in_progress", 5)
+        failed = store.records(stage, language, "failed", 10)
+        pending = store.records(stage, language, "pending", 20)
+
+    pending_count = counts.get("pending", 0)
 
     print(f"\n{'=' * 80}")
-    print(f"{stage_name} 詳細")
+    print(f"{stage_label(stage, language)} 詳細")
     print("=" * 80)
-    print(f"総単語数: {len(progress)}")
-    print(f"✅ 完了: {len(completed)} ({len(completed) / len(progress) * 100:.1f}%)")
-    print(f"🔄 処理中: {len(in_progress)}")
-    print(f"⏳ 未処理: {len(pending)}")
-    print(f"❌ 失敗: {len(failed)}")
+    print(f"総単語数: {total}")
+    completed = counts.get("completed", 0)
+    print(f"✅ 完了: {completed} ({completed / total * 100:.1f}%)")
+    print(f"🔄 処理中: {counts.get('in_progress', 0)}")
+    print(f"⏳ 未処理: {pending_count}")
+    print(f"❌ 失敗: {counts.get('failed', 0)}")
 
     if in_progress:
         print(f"\n処理中の単語:")
-        for r in in_progress[:5]:
-            print(f"  - {r['en']} (since {r.get('timestamp', 'unknown')})")
+        for r in in_progress:
+            lease = ""
+            if r.get("lease_id"):
+                remaining = r["lease_expires"] - time.time()
+                lease = f", lease {r['lease_id']} " + (
+                    f"残り{remaining:.0f}秒" if remaining > 0 else "期限切れ"
+                )
+            print(f"  - {r['en']} (since {r.get('timestamp', 'unknown')}{lease})")
 
     if failed:
         print(f"\n失敗した単語:")
-        for r in failed[:10]:
+        for r in failed:
             error_msg = r.get("error", "Unknown error")
             print(f"  - {r['en']}: {error_msg}")
 
-    if pending and len(pending) <= 20:
+    if pending and pending_count <= 20:
         print(f"\n未処理の単語:")
         for r in pending:
             print(f"  - {r['en']}")
     elif pending:
         print(f"\n未処理の単語（最初の20件）:")
-        for r in list(pending)[:20]:
+        for r in pending:
             print(f"  - {r['en']}")
-        print(f"  ... 他 {len(pending) - 20}語")
+        print(f"  ... 他 {pending_count - 20}語")
 
     print("=" * 80 + "\n")
 
 
 def reset_word(stage: str, word: str, language: Optional[str] = None):
     """特定の単語をリセット"""
-    progress = load_progress(stage, language)
+    with open_progress() as store:
+        found = store.set_status(stage, word, "pending", language)
+
+    if not found:
+        with open_index() as index:
+            known = word in index
+        if known:
+            print(f"❌ 単語が見つかりません: {word}（進捗に含まれていません）")
+        else:
+            print(f"❌ 単語が見つかりません: {word}（words.csv にありません）")
+        return
+
+    print(f"✅ リセット完了: {stage_label(stage, language)} / {word}")
 
-    if word not in progress:
-        print(f"❌ 単語が見つかりません: {word}")
+
+def set_word_status(stage: str, word: str, status: str, language: Optional[str] = None):
+    """特定の単語の状態を更新"""
+    if status not in STATUSES:
+        print(f"❌ 不明な状態: {status}（{', '.join(STATUSES)}）")
+        return
+    with open_progress() as store:
+        found = store.set_status(stage, word, status, language)
+    if not found:
+        print(f"❌ 単語が見つかりません: {word}（進捗に含まれていません）")
         return
+    print(f"✅ 更新完了: {stage_label(stage, language)} / {word} → {status}")
+
+
+def lease_command(command: str, argv: List[str]):
+    """claim / complete / fail / renew（オプションを持つため argparse で解析する）"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=f"progress_manager.py {command}")
+    if command == "claim":
+        parser.add_argument("stage", help="Stage to take work from")
+        parser.add_argument("language", nargs="?", help="Language of the stage")
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=DEFAULT_BATCH,
+            help=f"Words to claim (default: {DEFAULT_BATCH})",
+        )
+    else:
+        parser.add_argument("lease_id", help="Lease id printed by claim")
+    if command in ("complete", "fail"):
+        parser.add_argument(
+            "words",
+            nargs="*",
+            help="Words to report (default: every word of the lease)",
+        )
+    if command == "fail":
+        parser.add_argument("--error", type=str, help="Error message to record")
+    if command in ("claim", "renew"):
+        parser.add_argument(
+            "--lease",
+            type=str,
+            default=DEFAULT_LEASE,
+            help=f"Lease duration such as 30s, 10m or 1h (default: {DEFAULT_LEASE})",
+        )
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
 
-    progress[word] = {"en": word, "status": "pending"}
+    try:
+        lease_seconds = parse_duration(args.lease) if "lease" in args else 0.0
+    except ValueError:
+        print(f"❌ 不正な期間: {args.lease}")
+        sys.exit(1)
 
-    save_progress(stage, progress, language)
+    with open_progress() as store:
+        if command == "claim":
+            lease = store.claim(args.stage, args.language, args.batch, lease_seconds)
+            if args.json:
+                print(json.dumps(lease._asdict(), ensure_ascii=False))
+            elif not lease.words:
+                print(
+                    f"✅ 未処理の単語はありません: {stage_label(args.stage, args.language)}"
+                )
+            else:
+                expires = datetime.fromtimestamp(lease.expires, timezone.utc)
+                print(
+                    f"🔑 リース {lease.lease_id}: {len(lease.words)}語 "
+                    f"（期限 {expires.isoformat(timespec='seconds')}）"
+                )
+                for en in lease.words:
+                    print(en)
+            return
+        if command == "renew":
+            count = store.renew(args.lease_id, lease_seconds)
+        elif command == "complete":
+            count = store.complete(args.lease_id, args.words or None)
+        else:
+            count = store.fail(args.lease_id, args.words or None, args.error)
 
-    stage_name = f"{stage}-{language}" if language else stage
-    print(f"✅ リセット完了: {stage_name} / {word}")
+    if args.json:
+        print(json.dumps({"lease_id": args.lease_id, command: count}))
+    elif count:
+        label = {"complete": "完了", "fail": "失敗", "renew": "期限延長"}[command]
+        print(f"✅ {label}: {count}語（リース {args.lease_id}）")
+    else:
+        # 期限切れで回収された、または既に報告済み
+        print(
+            f"⚠️ リース {args.lease_id} の処理中の単語はありません（期限切れの可能性）"
+        )
+        sys.exit(1)
 
 
 def main():
@@ -245,6 +755,26 @@ def main():
         language = sys.argv[4] if len(sys.argv) > 4 else None
         reset_word(stage, word, language)
 
+    elif command == "set":
+        if len(sys.argv) < 5:
+            print("使い方: progress_manager.py set <stage> <word> <status> [language]")
+            sys.exit(1)
+        language = sys.argv[5] if len(sys.argv) > 5 else None
+        set_word_status(sys.argv[2], sys.argv[3], sys.argv[4], language)
+
+    elif command in ("claim", "complete", "fail", "renew"):
+        lease_command(command, sys.argv[2:])
+
+    elif command == "migrate":
+        with open_progress() as store:
+            imported = store.imported + store.import_jsonl()
+        if not imported and any(PROGRESS_DIR.glob("*.jsonl")):
+            print(f"⚠️ {PROGRESS_DB} に進捗があるため、旧JSONLは取り込みませんでした")
+            sys.exit(1)
+        print(
+            f"✅ 取り込み完了: {imported}件（{PROGRESS_DIR}/*.jsonl → {PROGRESS_DB}）"
+        )
+
     else:
         print(f"❌ 不明なコマンド: {command}")
         print(__doc__)
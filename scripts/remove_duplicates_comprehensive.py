@@ -3,87 +3,87 @@
 """
 意味翻訳CSVファイルの同一言語内重複削除スクリプト
 セミコロン区切りの翻訳内で、同一言語内の重複を削除する
+
+対象は translations_{lang}.csv の meaning_translation 列（--column で変更可）。
+列はヘッダー名で探すため、列構成の異なるファイルにもそのまま使える。
+各ファイルは csv_transform.py で1回だけ読み、一時ファイル経由で置き換える。
+
+使い方:
+    python scripts/remove_duplicates_comprehensive.py                 # 全言語
+    python scripts/remove_duplicates_comprehensive.py --dry-run
+    python scripts/remove_duplicates_comprehensive.py data/translations_fr.csv
+    python scripts/remove_duplicates_comprehensive.py --column meaning_en data/words.csv
 """
 
-import csv
 import sys
-from typing import List
+from pathlib import Path
+
+from csv_transform import DedupeList, data_files, dedupe_list, transform_files
+
 
 def remove_duplicates_in_field(field_value: str) -> str:
     """
     セミコロン区切りフィールド内の重複を削除
     大文字小文字の区別なし、左を優先して右を削除
     """
-    if not field_value or ';' not in field_value:
-        return field_value
-    
-    parts = field_value.split(';')
-    seen_lower = []  # 小文字版で重複チェック
-    result = []      # 元の形式を保持
-    
-    for part in parts:
-        cleaned = part.strip()
-        if not cleaned:
-            continue
-            
-        cleaned_lower = cleaned.lower()
-        
-        # 大文字小文字を区別せずに重複チェック
-        if cleaned_lower not in seen_lower:
-            seen_lower.append(cleaned_lower)
-            result.append(part)  # 元の形式（大文字小文字・スペース）を保持
-    
-    return ';'.join(result)
-
-def process_csv_file(input_file: str, output_file: str):
-    """CSVファイルを処理して重複を削除"""
-    
+    return dedupe_list(field_value, ";")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Remove duplicates inside semicolon-separated translation columns"
+    )
+    parser.add_argument(
+        "files", nargs="*", type=Path, help="CSV files to process (default: every translations_{lang}.csv)"
+    )
+    parser.add_argument(
+        "--column", action="append", help="Column to de-duplicate (repeatable, default: meaning_translation)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per file, up to the CPU count)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Show the fixes without writing")
+    args = parser.parse_args()
+
+    paths = args.files or data_files(kinds=["translations"])
+    missing = [str(p) for p in paths if not p.exists()]
+    if missing:
+        print(f"ファイルが存在しません: {', '.join(missing)}")
+        return 1
+    columns = args.column or ["meaning_translation"]
+
+    print("=== 同一言語内重複削除スクリプト実行開始 ===")
+    print(f"対象列: {', '.join(columns)}")
+    print()
+
+    results = transform_files(paths, [DedupeList(columns)], args.dry_run, args.workers)
+
     duplicates_found = 0
-    rows_processed = 0
-    
-    with open(input_file, 'r', encoding='utf-8') as infile, \
-         open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-        
-        reader = csv.reader(infile, delimiter='\t')
-        writer = csv.writer(outfile, delimiter='\t')
-        
-        for row_num, row in enumerate(reader, 1):
-            if len(row) < 12:  # 12列未満はスキップ
-                writer.writerow(row)
-                continue
-                
-            original_row = row.copy()
-            rows_processed += 1
-            
-            # 列2-11（meaning_ja から meaning_hi）を処理
-            for col_idx in range(2, 12):
-                if col_idx < len(row):
-                    original_value = row[col_idx]
-                    cleaned_value = remove_duplicates_in_field(original_value)
-                    
-                    if original_value != cleaned_value:
-                        duplicates_found += 1
-                        print(f"行{row_num}: {row[0]} - 列{col_idx+1}で重複削除")
-                        print(f"  修正前: {original_value}")
-                        print(f"  修正後: {cleaned_value}")
-                        print()
-                    
-                    row[col_idx] = cleaned_value
-            
-            writer.writerow(row)
-    
-    print(f"\n=== 処理完了 ===")
-    print(f"処理行数: {rows_processed}")
+    for result in results:
+        for change in result.changes:
+            for column, before in change.before.items():
+                duplicates_found += 1
+                print(f"{Path(result.path).name} 行{change.line}: {change.en} - {column}で重複削除")
+                print(f"  修正前: {before}")
+                print(f"  修正後: {change.after[column]}")
+                print()
+
+    print("\n=== 処理完了 ===")
+    print(f"処理ファイル数: {len(results)}")
+    print(f"処理行数: {sum(r.rows for r in results)}")
     print(f"重複発見・修正: {duplicates_found} 箇所")
-    print(f"出力ファイル: {output_file}")
+    written = [Path(r.path).name for r in results if r.written]
+    if args.dry_run:
+        print("ドライラン: 書き込みなし")
+    else:
+        print(f"書き換えたファイル: {', '.join(written) if written else 'なし'}")
+    return 0
+
 
 if __name__ == "__main__":
-    input_file = "/home/kako-jun/repos/2025/noun-gender/data/word_meaning_translations.csv"
-    output_file = "/home/kako-jun/repos/2025/noun-gender/data/word_meaning_translations_fixed.csv"
-    
-    print("=== 同一言語内重複削除スクリプト実行開始 ===")
-    print(f"入力ファイル: {input_file}")
-    print(f"出力ファイル: {output_file}")
-    print()
-    
-    process_csv_file(input_file, output_file)
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+同期パイプラインの計測
+
+sync_to_d1.py の各テーブル・各フェーズ（parse / generate / truncate / execute / load）の
+所要時間、行数、生成したSQLのバイト数、チャンク数、再試行回数を記録し、
+最後に表として表示する。--metrics PATH を指定すると JSON Lines として追記し、
+データ量の増加に伴う同期コストの推移を追えるようにする。
+
+フェーズ:
+    parse     データセット（CSV）の読み込みと行数の集計。テーブルは "*"
+    generate  行の生成・ハッシュ計算・SQLチャンクの書き出し
+    truncate  --truncate 時の全行削除
+    execute   wrangler によるチャンクの実行（最初の開始から最後の終了までの経過時間）
+    load      sqlite ターゲットへの一括ロード
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List
+
+PHASES = ["parse", "generate", "truncate", "execute", "load"]
+
+
+@dataclass
+class PhaseMetrics:
+    """1テーブル・1フェーズ分の計測値"""
+
+    table: str
+    phase: str
+    seconds: float = 0.0
+    rows: int = 0
+    statements: int = 0
+    sql_bytes: int = 0
+    chunks: int = 0
+    skipped_chunks: int = 0
+    retries: int = 0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class SyncMetrics:
+    """1回の同期の計測値をまとめる"""
+
+    def __init__(self, target: str = "d1", mode: str = "full"):
+        self.target = target
+        self.mode = mode
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.records: List[PhaseMetrics] = []
+        self._start = time.perf_counter()
+
+    def add(self, table: str, phase: str, **values) -> PhaseMetrics:
+        """計測値を追加して返す"""
+        record = PhaseMetrics(table, phase, **values)
+        self.records.append(record)
+        return record
+
+    @contextmanager
+    def phase(self, table: str, phase: str) -> Iterator[PhaseMetrics]:
+        """with ブロックの所要時間を seconds に記録する（他の値はブロック内で設定）"""
+        record = self.add(table, phase)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+
+    @property
+    def wall_seconds(self) -> float:
+        return time.perf_counter() - self._start
+
+    def print_summary(self):
+        """テーブル×フェーズの表と、フェーズごとの合計を表示"""
+        header = (
+            f"{'table':<22} {'phase':<9} {'time':>8} {'rows':>9} {'rows/s':>10} "
+            f"{'SQL bytes':>12} {'chunks':>7} {'skipped':>7} {'retries':>7}"
+        )
+        print(header)
+        print("-" * len(header))
+        for r in self.records:
+            print(self._format_row(r))
+
+        print("-" * len(header))
+        for phase in PHASES:
+            records = [r for r in self.records if r.phase == phase]
+            if not records:
+                continue
+            total = PhaseMetrics(
+                "(total)",
+                phase,
+                seconds=sum(r.seconds for r in records),
+                rows=sum(r.rows for r in records),
+                statements=sum(r.statements for r in records),
+                sql_bytes=sum(r.sql_bytes for r in records),
+                chunks=sum(r.chunks for r in records),
+                skipped_chunks=sum(r.skipped_chunks for r in records),
+                retries=sum(r.retries for r in records),
+            )
+            print(self._format_row(total))
+        # execute はテーブル間で並列に走るため、合計は経過時間より長くなりうる
+        print(f"Wall time: {self.wall_seconds:.2f}s")
+
+    @staticmethod
+    def _format_row(r: PhaseMetrics) -> str:
+        return (
+            f"{r.table:<22} {r.phase:<9} {r.seconds:>7.2f}s {r.rows:>9,} "
+            f"{r.rows_per_sec:>10,.0f} {r.sql_bytes:>12,} {r.chunks:>7} "
+            f"{r.skipped_chunks:>7} {r.retries:>7}"
+        )
+
+    def write_jsonl(self, path: Path):
+        """計測値を1レコード1行の JSON として追記"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for r in self.records:
+                entry = {
+                    "run": self.started_at,
+                    "target": self.target,
+                    "mode": self.mode,
+                    **asdict(r),
+                    "rows_per_sec": round(r.rows_per_sec, 1),
+                }
+                entry["seconds"] = round(r.seconds, 4)
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.write(
+                json.dumps(
+                    {
+                        "run": self.started_at,
+                        "target": self.target,
+                        "mode": self.mode,
+                        "table": "*",
+                        "phase": "total",
+                        "seconds": round(self.wall_seconds, 4),
+                    }
+                )
+                + "\n"
+            )
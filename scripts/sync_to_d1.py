@@ -6,278 +6,1289 @@ CSVファイルからCloudflare D1にデータを同期するスクリプト。
 外部キー制約を考慮した順序でデータを挿入・更新・削除する。
 
 Usage:
-    python scripts/sync_to_d1.py [--dry-run] [--table TABLE_NAME]
+    python scripts/sync_to_d1.py [--dry-run] [--table TABLE_NAME] [--incremental] [--truncate] [--resume]
+                                 [--chunk-bytes N] [--chunk-statements N]
+                                 [--workers N] [--retries N] [--target d1|sqlite:PATH]
+                                 [--metrics PATH] [--quiz-seed N]
 
 Options:
-    --dry-run       SQLファイルを生成するが、D1には実行しない
-    --table         特定のテーブルのみ同期（words_en, words_fr, etc.）
+    --dry-run           SQLファイルを .d1_sync/dry-run/ に生成するが、D1には実行しない
+    --table             特定のテーブルのみ同期（words_en, words_fr, etc.）。そのテーブルと同じCSVから
+                        作る派生テーブル（search_terms・word_docs・dataset_stats など）も一緒に同期する
+    --incremental       前回同期時のマニフェストと比較し、変更された行のみ同期する
+    --chunk-bytes       1回の wrangler 実行に送るSQLの最大バイト数
+    --chunk-statements  1回の wrangler 実行に送るSQL文の最大数
+    --truncate          挿入前に対象テーブルの全行を削除する（依存元テーブルから順に）
+    --resume            前回失敗した同期を再開する。ジャーナルに記録済みのチャンク
+                        （テーブル・チャンク番号・内容ハッシュが一致するもの）は送らない。
+                        前回と同じオプションで実行すること
+    --workers           wrangler の同時実行数
+    --retries           一時的な失敗に対するチャンクごとの再試行回数
+    --target            同期先。d1（既定）または sqlite:PATH（例: sqlite:data/noun_gender.db）
+                        sqlite の場合は d1_schema.sql を適用してから全テーブルを一括ロードする
+    --metrics           テーブル・フェーズごとの計測値を JSON Lines として追記するファイル
+                        （例: .d1_sync/metrics.jsonl）。表は指定しなくても最後に表示する
+    --quiz-seed         quiz_pool（クイズの出題順）の乱数の種。省略すると実行ごとに新しい種を使う。
+                        ただし --resume では前回の実行がジャーナルに記録した種、--incremental では
+                        前回同期したときにマニフェストに記録した種を使う（データが変わっていなければ
+                        quiz_pool を送り直さない）
+
+SQLはジェネレーターで1文ずつ生成し、そのままチャンクファイルに書き出す
+（スクリプト全体をメモリ上の文字列として組み立てない）。CSVは dataset.DatasetSnapshot で
+変更されたファイルだけを解析してスナップショットに保存し（validate.py と共有）、各テーブルの行は
+スナップショットから1バッチずつ読んで作る。作った行は一時ファイル（row_spool）に書き出し、
+マニフェストのハッシュ・SQL文・派生テーブル（word_docs・search_terms など）はそこから読むため、
+1回の同期で同じテーブルの行を作り直さず、データセット全体もメモリに載せない。ただし次のものは
+行数に比例して大きくなる（同時に持つのは1テーブル分）:
+  - 同期中のテーブルのマニフェスト（キー → ハッシュ）
+  - 行を並べ替えたり複数のCSVを結合したりして作るテーブル（words_en・word_meanings・
+    example_translations・search_terms・word_positions・letter_prefixes・word_docs・quiz_pool・
+    dataset_stats）の作業用データ
+
+適用に成功したチャンクは .d1_sync/journal.jsonl に1行ずつ記録する。ジャーナルは
+--resume なしで実行するたびに作り直し、全チャンクが成功したら削除する。
+
+wrangler コマンドは環境変数 WRANGLER で差し替えられる（scripts/fake_wrangler.py 参照）。
 """
 
-import csv
-import subprocess
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import sqlite3
 import sys
 import tempfile
+import unicodedata
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from d1_executor import DEFAULT_RETRIES, DEFAULT_WORKERS, Job, run_jobs
+from dataset import DatasetSnapshot, read_rows, write_rows
+from sync_metrics import PhaseMetrics, SyncMetrics
 
 # プロジェクトルート
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
+SCHEMA_FILE = Path(__file__).parent / "d1_schema.sql"
+
+# 同期状態（マニフェストなど）の保存先
+STATE_DIR = PROJECT_ROOT / ".d1_sync"
+MANIFEST_DIR = STATE_DIR / "manifest"
+DRY_RUN_DIR = STATE_DIR / "dry-run"
+JOURNAL_FILE = STATE_DIR / "journal.jsonl"
+MANIFEST_VERSION = 2
 
 # D1データベース名
 D1_DATABASE = "noun-gender-db"
 
+# D1の1文あたりの上限（100KB）に余裕を持たせた複数行 INSERT の最大サイズ
+STATEMENT_MAX_BYTES = 90_000
+
+# チャンク（= 1回の wrangler 実行）の上限。--chunk-bytes / --chunk-statements で変更可能
+CHUNK_MAX_BYTES = 900_000
+CHUNK_MAX_STATEMENTS = 50
+
+# 性別を持つ言語（words_{lang} テーブル）
+LANGUAGES = ["fr", "de", "es", "it", "pt", "ru", "ar", "hi"]
+
+# word_meanings の meaning_{lang} 列の並び
+MEANING_LANGUAGES = ["ja", "zh", "fr", "de", "es", "it", "pt", "ru", "ar", "hi"]
+
+# テーブルごとのカラムと自然キー（先頭カラムの id は差分比較の対象外）
+TABLE_COLUMNS = {
+    "words_en": ["id", "en"],
+    "gender_markers": ["code", "name_en", "name_ja", "description"],
+    "word_meanings": ["id", "en", "meaning_en"] + [f"meaning_{lang}" for lang in MEANING_LANGUAGES],
+    "examples": ["id", "en", "example_en"],
+    "example_translations": ["id", "example_en", "lang", "translation"],
+    "memory_tricks": ["id", "en", "translation_lang", "ui_lang", "trick_text"],
+    "dataset_stats": ["key", "value"],
+    "search_terms": ["term", "lang", "en", "kind"],
+    "word_positions": ["en", "sort_rank", "nav_rank", "prev_en", "next_en"],
+    "word_docs": ["en", "doc"],
+    "quiz_pool": ["lang", "position", "en", "translation", "gender"],
+    "letter_prefixes": ["prefix", "word_count", "first_word", "last_word", "first_nav_rank",
+                        "first_sort_rank", "last_sort_rank", "next_letters"],
+}
+TABLE_KEYS = {
+    "words_en": ["en"],
+    "gender_markers": ["code"],
+    "word_meanings": ["en"],
+    "examples": ["en"],
+    "example_translations": ["example_en", "lang"],
+    "memory_tricks": ["en", "translation_lang", "ui_lang"],
+    "dataset_stats": ["key"],
+    "search_terms": ["en", "lang", "term"],
+    "word_positions": ["en"],
+    "word_docs": ["en"],
+    "letter_prefixes": ["prefix"],
+    "quiz_pool": ["lang", "position"],
+}
+# トリガーで索引（search_terms_fts）を保つテーブル。INSERT OR REPLACE による置換では
+# 削除トリガーが動かないため、全件同期でも ON CONFLICT DO UPDATE で挿入する
+UPSERT_TABLES = {"search_terms"}
+for _lang in LANGUAGES:
+    TABLE_COLUMNS[f"words_{_lang}"] = ["id", "en", "translation", "gender", "confidence_score"]
+    TABLE_KEYS[f"words_{_lang}"] = ["en"]
+
+# 同期順（外部キー制約を考慮した順序）
+SYNC_ORDER = (
+    ["words_en", "gender_markers"]
+    + [f"words_{lang}" for lang in LANGUAGES]
+    + ["word_meanings", "examples", "example_translations", "memory_tricks"]
+    + ["search_terms", "word_positions", "letter_prefixes", "word_docs", "quiz_pool", "dataset_stats"]
+)
+
+# 依存先テーブル。依存先の同期がすべて成功してから実行する
+TABLE_DEPENDENCIES = {table: ["words_en"] for table in SYNC_ORDER}
+TABLE_DEPENDENCIES["words_en"] = []
+TABLE_DEPENDENCIES["gender_markers"] = []
+TABLE_DEPENDENCIES["dataset_stats"] = []
+TABLE_DEPENDENCIES["letter_prefixes"] = []
+TABLE_DEPENDENCIES["quiz_pool"] = []
+TABLE_DEPENDENCIES["example_translations"] = ["examples"]
+
+# 他のテーブルと同じCSVから作る派生テーブル → 元になるテーブル
+# （--table で元のテーブルだけを同期すると派生テーブルが古くなるため、一緒に同期する）
+LANGUAGE_TABLES = [f"words_{lang}" for lang in LANGUAGES]
+DERIVED_TABLES = {
+    "search_terms": ["words_en"] + LANGUAGE_TABLES,
+    "word_positions": ["words_en"] + LANGUAGE_TABLES,
+    "letter_prefixes": ["words_en"] + LANGUAGE_TABLES,
+    "word_docs": ["words_en", "word_meanings", "examples", "example_translations", "memory_tricks"] + LANGUAGE_TABLES,
+    "quiz_pool": LANGUAGE_TABLES,
+    "dataset_stats": ["words_en"] + LANGUAGE_TABLES,
+}
+
+Row = Tuple[Optional[object], ...]
+
+# 同期に使うデータセット（スナップショットから読むビュー）。parse_dataset で作り直す
+DATASET: Optional[DatasetSnapshot] = None
+
+# row_spool の中で生成したテーブルの行の一時ファイル（テーブル → ファイル）
+ROW_SPOOL_DIR: Optional[Path] = None
+SPOOLED_ROWS: Dict[str, Path] = {}
+
+# 一時ファイルに1回に書き出す・読み込む行数（word_docs の行は1行数KBのJSONのため小さめにする）
+ROW_SPOOL_BATCH = 256
+
 def escape_sql(value: str) -> str:
     """SQL用にエスケープ"""
     if value is None or value == "":
         return "NULL"
     return "'" + value.replace("'", "''") + "'"
 
-def run_d1_sql(sql: str, dry_run: bool = False) -> bool:
-    """D1にSQLを実行"""
-    if dry_run:
-        print(f"[DRY-RUN] SQL:\n{sql[:500]}...")
-        return True
+def sql_value(value) -> str:
+    """値をSQLリテラルに変換（整数はそのまま）"""
+    if isinstance(value, int):
+        return str(value)
+    return escape_sql(value)
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-        f.write(sql)
-        sql_file = f.name
+# ---------------------------------------------------------------------------
+# CSV → テーブル行
+# ---------------------------------------------------------------------------
 
-    try:
-        result = subprocess.run(
-            ["npx", "wrangler", "d1", "execute", D1_DATABASE, "--remote", f"--file={sql_file}"],
-            capture_output=True,
-            text=True,
-            cwd=PROJECT_ROOT
-        )
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
-            return False
-        if "ERROR" in result.stdout:
-            print(f"SQL Error: {result.stdout}")
-            return False
-        return True
-    finally:
-        Path(sql_file).unlink()
+def refresh_dataset() -> DatasetSnapshot:
+    """変更されたCSVを解析してスナップショットを更新し、行の生成に使うデータセットを作り直す"""
+    global DATASET
+    DATASET = DatasetSnapshot(DATA_DIR)
+    if DATASET.parsed_files:
+        print(f"Parsed {', '.join(DATASET.parsed_files)} ({DATASET.parsed_rows} rows)")
+    return DATASET
 
-def sync_words_en(dry_run: bool = False) -> bool:
-    """words_enテーブルを同期"""
-    print("Syncing words_en...")
+def dataset() -> DatasetSnapshot:
+    """行の生成に使うデータセット（1回の同期の中では同じスナップショットを読む）"""
+    return DATASET or refresh_dataset()
 
-    csv_file = DATA_DIR / "word_gender_translations.csv"
+def rows_words_en() -> Iterator[Row]:
+    """words_en の行を生成"""
     words = set()
+    for word in dataset().words:
+        if word.en:
+            words.add(word.en.strip().lower())
 
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for row in reader:
-            if row.get("en"):
-                words.add(row["en"].strip().lower())
-
-    # INSERT OR REPLACE で全単語を挿入
-    sql_lines = []
     for i, word in enumerate(sorted(words)):
-        sql_lines.append(f"INSERT OR REPLACE INTO words_en (id, en) VALUES ({i+1}, {escape_sql(word)});")
+        yield (i + 1, word)
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(words)} words to sync")
+def rows_gender_markers() -> Iterator[Row]:
+    """gender_markers の行を生成（固定値）"""
+    yield ("m", "Masculine", "男性", "Masculine gender marker")
+    yield ("f", "Feminine", "女性", "Feminine gender marker")
+    yield ("n", "Neuter", "中性", "Neuter gender marker")
 
-    return run_d1_sql(sql, dry_run)
+def rows_language_table(lang: str) -> Iterator[Row]:
+    """words_{lang} の行を生成"""
+    for i, row in enumerate(dataset().translations[lang]):
+        en = row.en.strip().lower()
+        translation = row.translation.strip()
+        gender = row.gender.strip().lower()
 
-def sync_gender_markers(dry_run: bool = False) -> bool:
-    """gender_markersテーブルを同期"""
-    print("Syncing gender_markers...")
+        if not en or not translation:
+            continue
 
-    sql = """
-INSERT OR REPLACE INTO gender_markers VALUES('m','Masculine','男性','Masculine gender marker');
-INSERT OR REPLACE INTO gender_markers VALUES('f','Feminine','女性','Feminine gender marker');
-INSERT OR REPLACE INTO gender_markers VALUES('n','Neuter','中性','Neuter gender marker');
-"""
-    return run_d1_sql(sql, dry_run)
+        # genderが空または無効な場合はNULL
+        if gender not in ("m", "f", "n"):
+            gender = None
 
-def sync_language_table(lang: str, dry_run: bool = False) -> bool:
-    """各言語テーブルを同期"""
-    print(f"Syncing words_{lang}...")
+        yield (i + 1, en, translation, gender, 100)
 
-    csv_file = DATA_DIR / "word_gender_translations.csv"
-    col_translation = f"{lang}_translation"
-    col_gender = f"{lang}_gender"
+def rows_word_meanings() -> Iterator[Row]:
+    """word_meanings の行を生成（meaning_en は words.csv、他言語は translations_{lang}.csv）"""
+    ds = dataset()
+    meanings: Dict[str, Dict[str, str]] = {
+        lang: {row.en.strip().lower(): row.meaning_translation.strip() for row in rows}
+        for lang, rows in ds.translations.items()
+    }
 
-    sql_lines = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            en = row.get("en", "").strip().lower()
-            translation = row.get(col_translation, "").strip()
-            gender = row.get(col_gender, "").strip().lower()
+    for i, word in enumerate(ds.words):
+        en = word.en.strip().lower()
+        if not en:
+            continue
+        values = [i + 1, en, word.meaning_en.strip()]
+        values += [meanings.get(lang, {}).get(en, "") for lang in MEANING_LANGUAGES]
+        yield tuple(values)
 
-            if not en or not translation:
-                continue
+def rows_examples() -> Iterator[Row]:
+    """examples の行を生成"""
+    for i, word in enumerate(dataset().words):
+        en = word.en.strip().lower()
+        example_en = word.example_en.strip()
+
+        if not en or not example_en:
+            continue
+
+        yield (i + 1, en, example_en)
+
+def rows_example_translations() -> Iterator[Row]:
+    """example_translations の行を生成（en から例文を引いて example_en をキーにする）"""
+    ds = dataset()
+    example_by_en = {word.en.strip().lower(): word.example_en.strip() for word in ds.words}
+
+    for i, row in enumerate(ds.example_translations):
+        example_en = example_by_en.get(row.en.strip().lower(), "")
+        lang = row.lang.strip()
+        translation = row.example_translation.strip()
+
+        if not example_en or not lang or not translation:
+            continue
+
+        yield (i + 1, example_en, lang, translation)
 
-            # genderが空または無効な場合はNULL
+def rows_memory_tricks() -> Iterator[Row]:
+    """memory_tricks の行を生成（翻訳済みテキストがなければ英語版を使う）"""
+    for i, row in enumerate(dataset().memory_tricks):
+        en = row.en.strip().lower()
+        translation_lang = row.target_lang.strip()
+        ui_lang = row.ui_lang.strip()
+        trick_text = (row.trick_text_translated or row.trick_text_en).strip()
+
+        if not en or not translation_lang or not ui_lang or not trick_text:
+            continue
+
+        yield (i + 1, en, translation_lang, ui_lang, trick_text)
+
+# 単語ページの翻訳の並び順（src/lib/db.ts の ALL_LANGUAGES と同じ）
+DOC_LANGUAGES = ["ar", "fr", "de", "hi", "it", "pt", "ru", "es"]
+
+# WordData.meanings と memory_trick_{lang} のキーの並び
+UI_LANGUAGES = ["en"] + MEANING_LANGUAGES
+
+def rows_word_docs() -> Iterator[Row]:
+    """word_docs の行を生成（単語ページ用に1語の全データをまとめた JSON。src/lib/db.ts の WordData）
+
+    他のテーブルと同じ行（table_rows）から作るため、getWord がテーブルを引いて
+    組み立てていた結果と一致する（空文字は NULL、同じキーの行は getWord と同じく
+    意味・例文・翻訳は最初の行、例文翻訳・覚え方は最後の行を使う）。
+    翻訳（性別が m/f/n のもの）が1つもない単語は getWord が null を返すため行を作らない。
+    """
+    meanings: Dict[str, Row] = {}
+    for row in table_rows("word_meanings"):
+        meanings.setdefault(row[1], row)
+    examples: Dict[str, str] = {}
+    for _, en, example_en in table_rows("examples"):
+        examples.setdefault(en, example_en)
+    example_translations: Dict[str, Dict[str, str]] = {}
+    for _, example_en, lang, translation in table_rows("example_translations"):
+        example_translations.setdefault(example_en, {})[lang] = translation
+    tricks: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for _, en, translation_lang, ui_lang, trick_text in table_rows("memory_tricks"):
+        tricks.setdefault((en, translation_lang), {})[ui_lang] = trick_text
+    translations: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {}
+    for lang in DOC_LANGUAGES:
+        translations[lang] = {}
+        for _, en, translation, gender, _ in table_rows(f"words_{lang}"):
+            translations[lang].setdefault(en, (translation, gender))
+
+    for _, en in table_rows("words_en"):
+        doc_translations = []
+        for lang in DOC_LANGUAGES:
+            translation, gender = translations[lang].get(en, (None, None))
             if gender not in ("m", "f", "n"):
-                gender = None
+                continue
+            trick_map = tricks.get((en, lang), {})
+            entry = {"id": 0, "word_id": 0, "language": lang, "translation": translation, "gender": gender}
+            entry.update((f"memory_trick_{ui}", trick_map[ui]) for ui in UI_LANGUAGES if ui in trick_map)
+            doc_translations.append(entry)
+        if not doc_translations:
+            continue
 
-            sql_lines.append(
-                f"INSERT OR REPLACE INTO words_{lang} (id, en, translation, gender, confidence_score) "
-                f"VALUES ({i+1}, {escape_sql(en)}, {escape_sql(translation)}, {escape_sql(gender)}, 100);"
-            )
+        doc = {"english": en}
+        meaning = meanings.get(en)
+        if meaning is not None:
+            values = dict(zip(UI_LANGUAGES, meaning[2:]))
+            doc["meaning_en"] = values["en"] or None
+            doc["meanings"] = {lang: value for lang, value in values.items() if value}
+        else:
+            doc["meanings"] = {}
+        doc["translations"] = doc_translations
+        example_en = examples.get(en) if meaning is not None else None
+        if example_en:
+            doc["example"] = {
+                "example_en": example_en,
+                "example_translations": dict(example_translations.get(example_en, {})),
+            }
+        yield (en, json.dumps(doc, ensure_ascii=False, separators=(",", ":")))
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(sql_lines)} records to sync")
+# quiz_pool の並びを決める乱数の種。quiz_seed() で決め、1回の実行の中では同じ値を使う
+# （マニフェストのハッシュと挿入する行を一致させるため）
+QUIZ_SEED: Optional[int] = None
 
-    return run_d1_sql(sql, dry_run)
+def quiz_seed(resume: bool = False, reuse: bool = False) -> int:
+    """quiz_pool の乱数の種（最初に呼ばれたときに決める）
 
-def sync_word_meanings(dry_run: bool = False) -> bool:
-    """word_meaningsテーブルを同期"""
-    print("Syncing word_meanings...")
+    --quiz-seed で指定した種、resume なら前回の実行がジャーナルに記録した種、reuse（差分同期・
+    単語の削除）なら前回同期したときにマニフェストに記録した種、どれもなければ新しい種の順に使う。
+    """
+    global QUIZ_SEED
+    if QUIZ_SEED is None and resume:
+        QUIZ_SEED = load_journal_seed("quiz_pool")
+    if QUIZ_SEED is None and reuse:
+        QUIZ_SEED = load_manifest_seed("quiz_pool")
+    if QUIZ_SEED is None:
+        QUIZ_SEED = random.SystemRandom().randrange(2**32)
+    return QUIZ_SEED
 
-    csv_file = DATA_DIR / "word_meaning_translations.csv"
+def table_seed(table: str) -> Optional[int]:
+    """テーブルの行を作るのに使った乱数の種（マニフェストとジャーナルに記録する。quiz_pool のみ）"""
+    return quiz_seed() if table == "quiz_pool" else None
 
-    sql_lines = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            en = row.get("en", "").strip().lower()
-            if not en:
+def rows_quiz_pool() -> Iterator[Row]:
+    """quiz_pool の行を生成（言語ごとに性別で層別してシャッフルしたクイズの出題順）
+
+    言語ごとに性別（m/f/n）のグループを quiz_seed() でそれぞれシャッフルし、グループ内の i 番目を
+    (i + 位相) / グループの件数 の位置に置いて並べる。どの連続した区間を取っても性別の割合が
+    その言語全体の割合とほぼ（各性別 ±1件）同じになる。position は言語ごとの0始まりの連番。
+    """
+    seed = quiz_seed()
+    for lang in LANGUAGES:
+        rng = random.Random(f"{seed}:{lang}")
+        groups: Dict[str, List[Row]] = {"m": [], "f": [], "n": []}
+        for _, en, translation, gender, _ in table_rows(f"words_{lang}"):
+            if gender is not None:
+                groups[gender].append((en, translation, gender))
+        keyed = []
+        for order, rows in enumerate(groups.values()):
+            rng.shuffle(rows)
+            phase = rng.random()
+            keyed += [((i + phase) / len(rows), order, row) for i, row in enumerate(rows)]
+        keyed.sort(key=lambda item: item[:2])
+        for position, (_, _, row) in enumerate(keyed):
+            yield (lang, position) + row
+
+def rows_dataset_stats() -> Iterator[Row]:
+    """dataset_stats の行を生成（性別マトリクスから事前計算した /api/stats など。値はJSON）"""
+    # numpy はこのテーブルでのみ必要
+    from gender_matrix import GenderMatrix
+
+    matrix = GenderMatrix.from_dataset(dataset())
+    yield ("api_stats", json.dumps(matrix.api_stats(), ensure_ascii=False, sort_keys=True))
+    distribution = {lang: matrix.distribution(lang) for lang in matrix.languages}
+    yield ("gender_distribution", json.dumps(distribution, ensure_ascii=False, sort_keys=True))
+
+# letter_prefixes に事前計算する接頭辞の最大文字数（これより長い接頭辞は実行時に検索する）
+PREFIX_MAX_LENGTH = 3
+
+def browse_order() -> Tuple[List[str], set]:
+    """(words_en の並び順の英単語, いずれかの言語に翻訳がある英単語) を返す
+
+    並び順は words_en の id と同じ（小文字の英単語の文字列順）。英単語は小文字の英字と
+    ハイフンだけのため、アプリの `ORDER BY en COLLATE NOCASE` や localeCompare と一致する。
+    words_en と words_{lang} の行から作る。
+    """
+    words = [en for _, en in table_rows("words_en") if en]
+    translated = {en for lang in LANGUAGES for _, en, *_ in table_rows(f"words_{lang}")}
+    return words, translated
+
+def rows_word_positions() -> Iterator[Row]:
+    """word_positions の行を生成（英単語ごとの並び順の位置と前後の単語）
+
+    sort_rank は words_en 全体での順位、nav_rank は翻訳がある単語だけでの順位（1始まりの連番）。
+    """
+    words, translated = browse_order()
+    nav_rank = 0
+    for i, en in enumerate(words):
+        if en in translated:
+            nav_rank += 1
+        yield (
+            en,
+            i + 1,
+            nav_rank if en in translated else None,
+            words[i - 1] if i > 0 else None,
+            words[i + 1] if i + 1 < len(words) else None,
+        )
+
+def rows_letter_prefixes() -> Iterator[Row]:
+    """letter_prefixes の行を生成（1〜PREFIX_MAX_LENGTH 文字の接頭辞ごとの集計）
+
+    word_count・first_word・last_word・first_nav_rank・next_letters は翻訳がある単語だけ
+    （文字ナビゲーションの対象）、first_sort_rank・last_sort_rank は words_en 全体での範囲
+    （browseWords の startsWith 用）。next_letters は接頭辞の次の文字（a〜z）ごとの単語数の JSON。
+    """
+    words, translated = browse_order()
+    prefixes: Dict[str, dict] = {}
+    nav_rank = 0
+    for i, en in enumerate(words):
+        if en in translated:
+            nav_rank += 1
+        for length in range(1, min(PREFIX_MAX_LENGTH, len(en)) + 1):
+            entry = prefixes.setdefault(en[:length], {"count": 0, "first": None, "last": None, "first_nav_rank": None,
+                                                       "first_sort_rank": i + 1, "next_letters": {}})
+            entry["last_sort_rank"] = i + 1
+            if en not in translated:
                 continue
+            entry["count"] += 1
+            entry["first"] = entry["first"] or en
+            entry["last"] = en
+            entry["first_nav_rank"] = entry["first_nav_rank"] or nav_rank
+            if len(en) > length and "a" <= en[length] <= "z":
+                entry["next_letters"][en[length]] = entry["next_letters"].get(en[length], 0) + 1
 
-            values = [
-                str(i+1),
-                escape_sql(en),
-                escape_sql(row.get("meaning_en", "")),
-                escape_sql(row.get("meaning_ja", "")),
-                escape_sql(row.get("meaning_zh", "")),
-                escape_sql(row.get("meaning_fr", "")),
-                escape_sql(row.get("meaning_de", "")),
-                escape_sql(row.get("meaning_es", "")),
-                escape_sql(row.get("meaning_it", "")),
-                escape_sql(row.get("meaning_pt", "")),
-                escape_sql(row.get("meaning_ru", "")),
-                escape_sql(row.get("meaning_ar", "")),
-                escape_sql(row.get("meaning_hi", "")),
-            ]
-
-            sql_lines.append(
-                f"INSERT OR REPLACE INTO word_meanings "
-                f"(id, en, meaning_en, meaning_ja, meaning_zh, meaning_fr, meaning_de, meaning_es, "
-                f"meaning_it, meaning_pt, meaning_ru, meaning_ar, meaning_hi) "
-                f"VALUES ({', '.join(values)});"
-            )
+    for prefix in sorted(prefixes):
+        entry = prefixes[prefix]
+        yield (
+            prefix,
+            entry["count"],
+            entry["first"],
+            entry["last"],
+            entry["first_nav_rank"],
+            entry["first_sort_rank"],
+            entry["last_sort_rank"],
+            json.dumps(entry["next_letters"], sort_keys=True),
+        )
+
+# ラテン文字（ASCII、Latin-1 補助〜拡張B、拡張追加）の後に続く結合文字
+LATIN_ACCENT = re.compile("([A-Za-z\u00c0-\u024f\u1e00-\u1eff])[\u0300-\u036f]+")
+
+def fold_search_term(text: str) -> str:
+    """検索用に正規化した語（src/lib/db.ts の foldSearchTerm と同じ規則）
+
+    ラテン文字のアクセント（U+0300〜U+036F の結合文字）を除き、小文字にする。
+    キリル文字の й やデーヴァナーガリーの母音記号など、他の文字の結合文字は残す。
+    """
+    decomposed = unicodedata.normalize("NFD", text.strip())
+    return unicodedata.normalize("NFC", LATIN_ACCENT.sub(r"\1", decomposed)).lower()
+
+def rows_search_terms() -> Iterator[Row]:
+    """search_terms の行を生成（正規化した語 → 英単語）
+
+    英単語（kind = headword）と、各言語の翻訳を ; で区切った候補をそれぞれ1行にする。
+    最初の候補は translation、2つ目以降は alternative。同じ (en, lang, term) は1行だけ。
+    words_en と words_{lang} の行から作る。
+    """
+    for _, en in table_rows("words_en"):
+        if en:
+            yield (fold_search_term(en), "en", en, "headword")
+
+    for lang in LANGUAGES:
+        seen = set()
+        for _, en, translation, _, _ in table_rows(f"words_{lang}"):
+            alternatives = [a for a in translation.split(";") if a.strip()]
+            for i, alternative in enumerate(alternatives):
+                term = fold_search_term(alternative)
+                if (en, term) in seen:
+                    continue
+                seen.add((en, term))
+                yield (term, lang, en, "translation" if i == 0 else "alternative")
+
+# ---------------------------------------------------------------------------
+# マニフェスト（差分同期）
+# ---------------------------------------------------------------------------
+
+def row_key(table: str, row: Row) -> str:
+    """自然キーを文字列化（複合キーはタブで連結）"""
+    columns = TABLE_COLUMNS[table]
+    return "\t".join(str(row[columns.index(k)]) for k in TABLE_KEYS[table])
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(sql_lines)} records to sync")
+def row_hash(table: str, row: Row) -> str:
+    """id を除いた行内容のハッシュ"""
+    values = row[1:] if TABLE_COLUMNS[table][0] == "id" else row
+    content = "\x1f".join("\x00" if v is None else str(v) for v in values)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
 
-    return run_d1_sql(sql, dry_run)
+def manifest_path(table: str) -> Path:
+    """テーブルごとのマニフェストファイル"""
+    return MANIFEST_DIR / f"{table}.json"
 
-def sync_examples(dry_run: bool = False) -> bool:
-    """examplesテーブルを同期"""
-    print("Syncing examples...")
+def read_manifest(table: str) -> Optional[dict]:
+    """前回同期成功時のテーブルのマニフェストを読み込む（なければ・形式が古ければ None）"""
+    path = manifest_path(table)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
 
-    csv_file = DATA_DIR / "word_examples.csv"
+def load_manifest_table(table: str) -> Optional[Dict[str, str]]:
+    """前回同期成功時のテーブルのハッシュを読み込む（なければ None）"""
+    manifest = read_manifest(table)
+    return manifest.get("hashes") if manifest else None
 
-    sql_lines = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            en = row.get("en", "").strip().lower()
-            example_en = row.get("example_en", "").strip()
+def load_manifest_seed(table: str) -> Optional[int]:
+    """前回同期成功時にテーブルの行を作った乱数の種（記録がなければ None）"""
+    manifest = read_manifest(table)
+    return manifest.get("seed") if manifest else None
 
-            if not en or not example_en:
+def write_manifest_file(path: Path, table: str, hashes: Dict[str, str]):
+    """テーブル1つ分のハッシュ（と table_seed の乱数の種）をファイルに書き出す
+
+    同期中はチャンクと同じ作業ディレクトリに書き、テーブルの同期が成功したら
+    os.replace で manifest_path() に移す（マニフェスト全体を読み書きしない）。
+    """
+    manifest = {"version": MANIFEST_VERSION, "hashes": hashes}
+    seed = table_seed(table)
+    if seed is not None:
+        manifest["seed"] = seed
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+# ---------------------------------------------------------------------------
+# ジャーナル（再開用）
+# ---------------------------------------------------------------------------
+
+def file_hash(path: Path) -> str:
+    """チャンクファイルの内容ハッシュ"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def journal_entries() -> Iterator[dict]:
+    """ジャーナルの記録を順に返す（書き込み途中で中断された最終行は無視する）"""
+    if not JOURNAL_FILE.exists():
+        return
+    with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
                 continue
 
-            sql_lines.append(
-                f"INSERT OR REPLACE INTO examples (id, en, example_en) "
-                f"VALUES ({i+1}, {escape_sql(en)}, {escape_sql(example_en)});"
-            )
+def load_journal() -> Dict[str, str]:
+    """適用済みチャンクを読み込む（ジョブ名 → 内容ハッシュ）"""
+    return {entry["job"]: entry["hash"] for entry in journal_entries()}
+
+def load_journal_seed(table: str) -> Optional[int]:
+    """前回の実行でテーブルのチャンクを作った乱数の種（適用済みのチャンクがなければ None）"""
+    for entry in journal_entries():
+        if entry["table"] == table and entry.get("seed") is not None:
+            return entry["seed"]
+    return None
+
+def append_journal(job: str, table: str, chunk: str, content_hash: str):
+    """適用に成功したチャンクをジャーナルに追記（クラッシュしても残るよう fsync する）
+
+    quiz_pool のチャンクには行を作った乱数の種も記録する（--resume で同じ行を作り直すため）。
+    """
+    entry = {"job": job, "table": table, "chunk": chunk, "hash": content_hash}
+    seed = table_seed(table)
+    if seed is not None:
+        entry["seed"] = seed
+    with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def pack_statements(head: str, items: Iterable[str], tail: str = ";") -> Iterator[str]:
+    """値リストを `head item,item,... tail` の複数行文にまとめる（1文は STATEMENT_MAX_BYTES 以下）"""
+    max_bytes = min(STATEMENT_MAX_BYTES, CHUNK_MAX_BYTES)
+    fixed = len(head.encode("utf-8")) + len(tail.encode("utf-8"))
+
+    batch: List[str] = []
+    size = fixed
+    for item in items:
+        item_size = len(item.encode("utf-8")) + 1
+        if batch and size + item_size > max_bytes:
+            yield head + ",".join(batch) + tail
+            batch = []
+            size = fixed
+        batch.append(item)
+        size += item_size
+    if batch:
+        yield head + ",".join(batch) + tail
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(sql_lines)} records to sync")
+def values_tuple(values: Iterable) -> str:
+    """(v1, v2, ...) 形式のSQL値リスト"""
+    return "(" + ", ".join(sql_value(v) for v in values) + ")"
 
-    return run_d1_sql(sql, dry_run)
+def write_chunks(statements: Iterable[str], spool_dir: Path, prefix: str) -> Tuple[List[Path], int, int]:
+    """SQL文を1文ずつチャンクファイルに書き出す。(ファイル, 文数, 総バイト数) を返す
 
-def sync_example_translations(dry_run: bool = False) -> bool:
-    """example_translationsテーブルを同期"""
-    print("Syncing example_translations...")
+    チャンクはバイト数・文数の上限で区切る。D1 は明示的な BEGIN/COMMIT を受け付けないため、
+    チャンクごとに wrangler を1回実行し、D1側で1リクエスト単位（= 1トランザクション）として
+    適用させる。メモリに載るのは書き込み中の1文だけ。
+    """
+    files: List[Path] = []
+    total_statements = 0
+    total_bytes = 0
+    f = None
+    size = 0
+    count = 0
+    try:
+        for statement in statements:
+            data = statement.encode("utf-8") + b"\n"
+            if f is not None and (size + len(data) > CHUNK_MAX_BYTES or count >= CHUNK_MAX_STATEMENTS):
+                f.close()
+                f = None
+            if f is None:
+                path = spool_dir / f"{prefix}.{len(files) + 1:05d}.sql"
+                files.append(path)
+                f = open(path, "wb")
+                size = 0
+                count = 0
+            f.write(data)
+            size += len(data)
+            count += 1
+            total_statements += 1
+            total_bytes += len(data)
+    finally:
+        if f is not None:
+            f.close()
+    return files, total_statements, total_bytes
+
+def key_condition(table: str, row: Row) -> str:
+    """自然キーによる WHERE 条件"""
+    columns = TABLE_COLUMNS[table]
+    return " AND ".join(f"{k} = {sql_value(row[columns.index(k)])}" for k in TABLE_KEYS[table])
+
+def full_statements(table: str, rows: Iterable[Row]) -> Iterator[str]:
+    """全行の複数行 INSERT OR REPLACE 文（UPSERT_TABLES は INSERT ... ON CONFLICT DO UPDATE）"""
+    columns = ", ".join(TABLE_COLUMNS[table])
+    values = (values_tuple(row) for row in rows)
+    if table not in UPSERT_TABLES:
+        return pack_statements(f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ", values)
+
+    keys = TABLE_KEYS[table]
+    assignments = ", ".join(f"{c} = excluded.{c}" for c in TABLE_COLUMNS[table] if c not in keys)
+    return pack_statements(
+        f"INSERT INTO {table} ({columns}) VALUES ",
+        values,
+        f" ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {assignments};",
+    )
 
-    csv_file = DATA_DIR / "example_translations.csv"
+def diff_statements(table: str, current: Dict[str, str], previous: Dict[str, str]) -> Iterator[str]:
+    """前回のハッシュと比較して DELETE / UPDATE / INSERT 文を生成
 
-    sql_lines = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            example_en = row.get("example_en", "").strip()
-            lang = row.get("lang", "").strip()
-            translation = row.get("translation", "").strip()
+    id は同期ごとに振り直されるため比較にも更新にも使わない。
+    新規行は id を省略して挿入し、既存行は自然キーで UPDATE する。id のないテーブルは
+    自然キーが主キーのため、変更行も複数行の INSERT OR REPLACE（UPSERT_TABLES は UPSERT）にまとめる
+    （word_positions のように1語の追加で多数の行の順位が変わるテーブルでも文の数が増えない）。
+    行はメモリに溜めず、table_rows（row_spool の一時ファイル）を更新用・追加用にそれぞれ読み直す。
+    同じキーの行が複数ある場合は最後の行（current のハッシュと一致する行）を採用する。
+    """
+    columns = TABLE_COLUMNS[table]
+    has_id = columns[0] == "id"
+    keys = TABLE_KEYS[table]
 
-            if not example_en or not lang or not translation:
+    deleted_keys = (key.split("\t") for key in previous if key not in current)
+    if len(keys) == 1:
+        yield from pack_statements(
+            f"DELETE FROM {table} WHERE {keys[0]} IN (",
+            (escape_sql(values[0]) for values in deleted_keys),
+            ");",
+        )
+    else:
+        yield from pack_statements(
+            f"DELETE FROM {table} WHERE ({', '.join(keys)}) IN (VALUES ",
+            (values_tuple(values) for values in deleted_keys),
+            ");",
+        )
+
+    def changed_rows(new: bool) -> Iterator[Row]:
+        """新規行（new=True）または内容が変わった既存行を1キー1行で返す"""
+        seen = set()
+        for row in table_rows(table):
+            key = row_key(table, row)
+            old_hash = previous.get(key)
+            if (old_hash is None) != new or old_hash == current[key] or key in seen:
+                continue
+            if row_hash(table, row) != current[key]:
                 continue
+            seen.add(key)
+            yield row
 
-            sql_lines.append(
-                f"INSERT OR REPLACE INTO example_translations (id, example_en, lang, translation) "
-                f"VALUES ({i+1}, {escape_sql(example_en)}, {escape_sql(lang)}, {escape_sql(translation)});"
+    # 一意制約の衝突を避けるため 削除 → 更新 → 追加 の順に実行
+    if has_id:
+        for row in changed_rows(new=False):
+            assignments = ", ".join(
+                f"{c} = {sql_value(v)}"
+                for c, v in zip(columns, row)
+                if c != "id" and c not in keys
             )
+            yield f"UPDATE {table} SET {assignments} WHERE {key_condition(table, row)};"
+    else:
+        yield from full_statements(table, changed_rows(new=False))
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(sql_lines)} records to sync")
+    insert_columns = columns[1:] if has_id else columns
+    yield from pack_statements(
+        f"INSERT INTO {table} ({', '.join(insert_columns)}) VALUES ",
+        (values_tuple(row[1:] if has_id else row) for row in changed_rows(new=True)),
+    )
 
-    return run_d1_sql(sql, dry_run)
+@contextmanager
+def row_spool():
+    """この中では table_rows が各テーブルの行を1回だけ生成し、一時ファイルに書き出して読み直す
 
-def sync_memory_tricks(dry_run: bool = False) -> bool:
-    """memory_tricksテーブルを同期"""
-    print("Syncing memory_tricks...")
+    マニフェストのハッシュ・SQL文の生成・差分の更新用と追加用・派生テーブルの生成で
+    同じテーブルを何度読んでも、行を作るのは1回だけになる。
+    """
+    global ROW_SPOOL_DIR
+    with tempfile.TemporaryDirectory(prefix="sync_rows_") as spool_dir:
+        ROW_SPOOL_DIR = Path(spool_dir)
+        try:
+            yield
+        finally:
+            ROW_SPOOL_DIR = None
+            SPOOLED_ROWS.clear()
 
-    csv_file = DATA_DIR / "memory_tricks_creation.csv"
-    if not csv_file.exists():
-        print("  No memory_tricks CSV found, skipping")
-        return True
+def table_rows(table: str) -> Iterator[Row]:
+    """テーブルの行。row_spool の中では最初の呼び出しで生成して書き出し、以降はそのファイルを読む"""
+    if ROW_SPOOL_DIR is None:
+        return generate_rows(table)
+    if table not in SPOOLED_ROWS:
+        path = ROW_SPOOL_DIR / f"{table}.pickle"
+        write_rows(path, generate_rows(table), {"table": table}, ROW_SPOOL_BATCH)
+        SPOOLED_ROWS[table] = path
+    return read_rows(SPOOLED_ROWS[table])
+
+def generate_rows(table: str) -> Iterator[Row]:
+    """テーブル名に対応する行を生成"""
+    if table == "words_en":
+        return rows_words_en()
+    if table == "gender_markers":
+        return rows_gender_markers()
+    if table == "word_meanings":
+        return rows_word_meanings()
+    if table == "examples":
+        return rows_examples()
+    if table == "example_translations":
+        return rows_example_translations()
+    if table == "memory_tricks":
+        return rows_memory_tricks()
+    if table == "dataset_stats":
+        return rows_dataset_stats()
+    if table == "search_terms":
+        return rows_search_terms()
+    if table == "word_positions":
+        return rows_word_positions()
+    if table == "letter_prefixes":
+        return rows_letter_prefixes()
+    if table == "word_docs":
+        return rows_word_docs()
+    if table == "quiz_pool":
+        return rows_quiz_pool()
+    return rows_language_table(table.replace("words_", ""))
+
+def plan_table(
+    table: str, current: Dict[str, str], incremental: bool, spool_dir: Path, record: PhaseMetrics
+) -> Tuple[List[Path], bool]:
+    """テーブルの同期に必要なSQLチャンクファイルを生成。(チャンク, 差分かどうか) を返す
+
+    生成した文数・バイト数・チャンク数は record に記録する。
+    """
+    previous = load_manifest_table(table) if incremental else None
+    if previous is None:
+        if incremental:
+            print("  No manifest for this table, falling back to full sync")
+        statements = full_statements(table, table_rows(table))
+        print(f"  {len(current)} records to sync")
+    else:
+        statements = diff_statements(table, current, previous)
+        print(f"  Compared {len(current)} records against manifest")
 
-    sql_lines = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            en = row.get("en", "").strip().lower()
-            translation_lang = row.get("translation_lang", "").strip()
-            ui_lang = row.get("ui_lang", "").strip()
-            trick_text = row.get("trick_text", "").strip()
+    chunks, statement_count, total_bytes = write_chunks(statements, spool_dir, table)
+    print(f"  {statement_count} statements in {len(chunks)} chunks ({total_bytes:,} bytes)")
+    record.rows = len(current)
+    record.statements = statement_count
+    record.sql_bytes = total_bytes
+    record.chunks = len(chunks)
+    return chunks, previous is not None
 
-            if not en or not translation_lang or not ui_lang or not trick_text:
+def parse_dataset(metrics: SyncMetrics):
+    """変更されたCSVを解析してスナップショットを更新し、parse フェーズとして記録
+
+    rows は今回解析した行数（すべてのスナップショットが最新なら0）。テーブルの行数は
+    generate / load フェーズに記録する。
+    """
+    with metrics.phase("*", "parse") as record:
+        record.rows = refresh_dataset().parsed_rows
+
+def record_execution(metrics: SyncMetrics, table: str, phase: str, jobs: List[Job], rows: int):
+    """1グループ分のジョブの実行結果を記録（経過時間は最初の開始から最後の終了まで）"""
+    executed = [job for job in jobs if job.started is not None]
+    record = metrics.add(
+        table,
+        phase,
+        rows=rows if executed else 0,
+        chunks=len(executed),
+        skipped_chunks=sum(1 for job in jobs if job.skip),
+        retries=sum(job.retries for job in jobs),
+        sql_bytes=sum(job.sql_file.stat().st_size for job in executed),
+    )
+    if executed:
+        record.seconds = max(job.finished for job in executed) - min(job.started for job in executed)
+
+def sync_tables(
+    tables: List[str],
+    dry_run: bool = False,
+    incremental: bool = False,
+    truncate: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+    resume: bool = False,
+    metrics: Optional[SyncMetrics] = None,
+) -> bool:
+    """指定テーブルを同期し、成功したテーブルのマニフェストを更新
+
+    チャンクはジョブとして並列実行する。テーブル間は TABLE_DEPENDENCIES の順序を守り、
+    差分同期のチャンクは 削除 → 更新 → 追加 の順序を保つため直列に実行する。
+    truncate 時は依存元テーブルから順に全行を削除してから挿入する。
+    チャンクファイルは STATE_DIR 内の一時ディレクトリ（--dry-run 時は DRY_RUN_DIR）に書き出す。
+    resume 時はジャーナルにあるチャンクと同じ内容のチャンクを送らない。
+    テーブル・フェーズごとの計測値は metrics に記録する。
+    """
+    metrics = metrics or SyncMetrics()
+    if dry_run:
+        shutil.rmtree(DRY_RUN_DIR, ignore_errors=True)
+        DRY_RUN_DIR.mkdir(parents=True)
+        with row_spool():
+            return sync_tables_spooled(tables, DRY_RUN_DIR, dry_run, incremental, truncate, workers, retries,
+                                       resume, metrics)
+
+    # マニフェストを os.replace で移せるよう、同じファイルシステム上に作る
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="spool_", dir=STATE_DIR) as spool_dir, row_spool():
+        return sync_tables_spooled(tables, Path(spool_dir), dry_run, incremental, truncate, workers, retries,
+                                   resume, metrics)
+
+def sync_tables_spooled(
+    tables: List[str],
+    spool_dir: Path,
+    dry_run: bool,
+    incremental: bool,
+    truncate: bool,
+    workers: int,
+    retries: int,
+    resume: bool,
+    metrics: SyncMetrics,
+) -> bool:
+    """sync_tables の本体。spool_dir にチャンクを書き出してからジョブとして実行する"""
+    if truncate and incremental:
+        print("--truncate implies a full sync, ignoring --incremental")
+        incremental = False
+
+    applied: Dict[str, str] = {}
+    if resume:
+        applied = load_journal()
+        if applied:
+            print(f"Resuming: {len(applied)} chunks already applied according to {JOURNAL_FILE}")
+        else:
+            print("No journal found, syncing from the beginning")
+
+    jobs: List[Job] = []
+    # ジョブ名 → (テーブル, チャンク番号, 内容ハッシュ)。ジャーナルに記録する
+    chunk_info: Dict[str, Tuple[str, str, str]] = {}
+    # 同期成功時にマニフェストへ移すハッシュファイル
+    manifest_files: Dict[str, Path] = {}
+    # execute フェーズの rows/s 用（全行を送るテーブルのみ。差分同期は変更行しか送らない）
+    full_rows: Dict[str, int] = {}
+
+    parse_dataset(metrics)
+
+    def add_job(job: Job, table: str, chunk: str):
+        """ジョブを追加。前回の実行で同じ内容のチャンクを適用済みなら skip にする"""
+        content_hash = file_hash(job.sql_file)
+        chunk_info[job.name] = (table, chunk, content_hash)
+        job.skip = applied.get(job.name) == content_hash
+        jobs.append(job)
+
+    if truncate:
+        for table in reversed(tables):
+            if table == "gender_markers":
+                # gender_markersは固定値なので削除しない
                 continue
+            dependents = [t for t in tables if table in TABLE_DEPENDENCIES[t]]
+            files, _, _ = write_chunks([f"DELETE FROM {table};"], spool_dir, f"truncate_{table}")
+            add_job(Job(
+                name=f"truncate:{table}",
+                sql_file=files[0],
+                group=f"truncate:{table}",
+                deps=[f"truncate:{t}" for t in dependents],
+            ), table, "truncate")
 
-            sql_lines.append(
-                f"INSERT OR REPLACE INTO memory_tricks (id, en, translation_lang, ui_lang, trick_text) "
-                f"VALUES ({i+1}, {escape_sql(en)}, {escape_sql(translation_lang)}, "
-                f"{escape_sql(ui_lang)}, {escape_sql(trick_text)});"
-            )
+    for table in tables:
+        print(f"Syncing {table}...")
+        # マニフェスト用のハッシュ（キー → ハッシュ）。行そのものは保持せず（row_spool から読む）、
+        # チャンク生成後はファイルに書き出してメモリから捨てる
+        with metrics.phase(table, "generate") as record:
+            hashes = {row_key(table, row): row_hash(table, row) for row in table_rows(table)}
+            chunks, is_diff = plan_table(table, hashes, incremental, spool_dir, record)
+            if chunks:
+                manifest_files[table] = spool_dir / f"{table}.manifest.json"
+                write_manifest_file(manifest_files[table], table, hashes)
+            # 変更がなければマニフェストはそのまま
+            del hashes
+        if not is_diff:
+            full_rows[table] = record.rows
 
-    sql = "\n".join(sql_lines)
-    print(f"  {len(sql_lines)} records to sync")
+        if dry_run:
+            if chunks:
+                with open(chunks[0], "r", encoding="utf-8") as f:
+                    preview = f.read(500)
+                print(f"[DRY-RUN] SQL ({chunks[0].stat().st_size} bytes):\n{preview}...")
+            continue
 
-    return run_d1_sql(sql, dry_run)
+        groups = {job.group for job in jobs}
+        deps = [dep for dep in TABLE_DEPENDENCIES[table] if dep in groups]
+        if truncate and table != "gender_markers":
+            deps.append(f"truncate:{table}")
 
-def sync_all(dry_run: bool = False) -> bool:
-    """全テーブルを同期（外部キー制約を考慮した順序）"""
-    print("=" * 50)
-    print("Syncing all tables to D1")
-    print("=" * 50)
+        for i, chunk in enumerate(chunks):
+            name = f"{table}#{i + 1}"
+            chunk_deps = list(deps)
+            if is_diff and i > 0:
+                chunk_deps.append(f"{table}#{i}")
+            add_job(Job(name=name, sql_file=chunk, group=table, deps=chunk_deps), table, str(i + 1))
 
-    # 1. マスターテーブル
-    if not sync_words_en(dry_run):
-        return False
-    if not sync_gender_markers(dry_run):
-        return False
+    if dry_run:
+        print(f"[DRY-RUN] SQL files written to {DRY_RUN_DIR}")
+        return True
 
-    # 2. 言語テーブル
-    for lang in ["fr", "de", "es", "it", "pt", "ru", "ar", "hi"]:
-        if not sync_language_table(lang, dry_run):
-            return False
+    def on_group_done(group: str):
+        if group in manifest_files:
+            MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+            os.replace(manifest_files[group], manifest_path(group))
+            print(f"  {group} synced")
 
-    # 3. 意味・例文テーブル
-    if not sync_word_meanings(dry_run):
-        return False
-    if not sync_examples(dry_run):
+    def on_job_done(job: Job):
+        append_journal(job.name, *chunk_info[job.name])
+
+    if not resume:
+        # 新しい同期。前回のジャーナルは捨てる
+        JOURNAL_FILE.unlink(missing_ok=True)
+
+    skipped = sum(1 for job in jobs if job.skip)
+    print(f"Executing {len(jobs) - skipped} jobs with {workers} workers"
+          + (f" ({skipped} already applied, skipped)..." if skipped else "..."))
+    success = run_jobs(
+        jobs,
+        on_group_done,
+        on_job_done,
+        database=D1_DATABASE,
+        cwd=PROJECT_ROOT,
+        workers=workers,
+        retries=retries,
+    )
+
+    groups: Dict[str, List[Job]] = {}
+    for job in jobs:
+        groups.setdefault(job.group, []).append(job)
+    for group, group_jobs in groups.items():
+        if group.startswith("truncate:"):
+            record_execution(metrics, group[len("truncate:"):], "truncate", group_jobs, 0)
+        else:
+            record_execution(metrics, group, "execute", group_jobs, full_rows.get(group, 0))
+
+    if success:
+        JOURNAL_FILE.unlink(missing_ok=True)
+    else:
+        print("Some chunks failed. Run again with --resume to skip the chunks already applied")
+    return success
+
+# ---------------------------------------------------------------------------
+# 単語の削除
+# ---------------------------------------------------------------------------
+
+# 単語の削除後に現在のCSVから作り直すテーブル（並び順の位置・接頭辞の集計・クイズの出題順・統計）
+REFRESH_TABLES = ["word_positions", "letter_prefixes", "quiz_pool", "dataset_stats"]
+
+# 単語の行を持つテーブル（gender_markers と REFRESH_TABLES は対象外）
+WORD_TABLES = [t for t in SYNC_ORDER if t != "gender_markers" and t not in REFRESH_TABLES]
+
+def word_delete_statements(table: str, words: List[str]) -> Iterator[str]:
+    """単語の行を削除する `DELETE ... WHERE en IN (...)` 文
+
+    example_translations は en を持たないため、examples の例文から引く
+    （examples より先に実行すること）。
+    """
+    items = (escape_sql(word) for word in words)
+    if table == "example_translations":
+        return pack_statements(
+            "DELETE FROM example_translations WHERE example_en IN "
+            "(SELECT example_en FROM examples WHERE en IN (",
+            items,
+            "));",
+        )
+    return pack_statements(f"DELETE FROM {table} WHERE en IN (", items, ");")
+
+def prune_manifest(table: str, keys: set, spool_dir: Path) -> int:
+    """削除した行をマニフェストから除く（先頭のキー列が keys に含まれる行）。除いた行数を返す"""
+    hashes = load_manifest_table(table)
+    if hashes is None:
+        return 0
+    kept = {key: value for key, value in hashes.items() if key.split("\t", 1)[0] not in keys}
+    if len(kept) != len(hashes):
+        tmp_file = spool_dir / f"{table}.manifest.json"
+        write_manifest_file(tmp_file, table, kept)
+        os.replace(tmp_file, manifest_path(table))
+    return len(hashes) - len(kept)
+
+def delete_words(
+    words: Iterable[str],
+    examples: Iterable[str] = (),
+    dry_run: bool = False,
+    refresh_stats: bool = True,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+) -> bool:
+    """D1 から単語の行を外部キー順（依存元テーブルから）に削除
+
+    テーブルごとの削除は複数値の DELETE 文にまとめ、チャンクをジョブとして実行する。
+    依存関係のないテーブルは並列に、words_en は最後に削除する。成功したテーブルは
+    マニフェストからも削除した行を除く（examples には単語の例文を渡す）。
+    refresh_stats=True なら REFRESH_TABLES（順位が詰まる word_positions など）を現在のCSVから
+    作り直す。マニフェストがあれば差分だけを、なければ全行を削除してから入れ直す。
+    DELETE は何度実行しても結果が同じため、失敗したら同じコマンドをもう一度実行すればよい。
+    """
+    words = sorted({word.strip().lower() for word in words if word.strip()})
+    examples = {example.strip() for example in examples if example.strip()}
+    if not words:
+        print("No words to delete")
+        return True
+
+    if dry_run:
+        shutil.rmtree(DRY_RUN_DIR, ignore_errors=True)
+        DRY_RUN_DIR.mkdir(parents=True)
+        with row_spool():
+            return delete_words_spooled(words, examples, DRY_RUN_DIR, dry_run, refresh_stats, workers, retries)
+
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="spool_", dir=STATE_DIR) as spool_dir, row_spool():
+        return delete_words_spooled(words, examples, Path(spool_dir), dry_run, refresh_stats, workers, retries)
+
+def delete_words_spooled(
+    words: List[str],
+    examples: set,
+    spool_dir: Path,
+    dry_run: bool,
+    refresh_stats: bool,
+    workers: int,
+    retries: int,
+) -> bool:
+    """delete_words の本体。spool_dir にチャンクを書き出してからジョブとして実行する"""
+    print(f"Deleting {len(words)} words from D1...")
+    jobs: List[Job] = []
+    for table in reversed(WORD_TABLES):
+        chunks, statement_count, total_bytes = write_chunks(
+            word_delete_statements(table, words), spool_dir, f"delete_{table}"
+        )
+        print(f"  {table}: {statement_count} statements in {len(chunks)} chunks ({total_bytes:,} bytes)")
+        dependents = [t for t in WORD_TABLES if table in TABLE_DEPENDENCIES[t]]
+        for i, chunk in enumerate(chunks):
+            jobs.append(Job(
+                name=f"delete:{table}#{i + 1}",
+                sql_file=chunk,
+                group=f"delete:{table}",
+                deps=[f"delete:{t}" for t in dependents],
+            ))
+
+    # 作り直したテーブル → マニフェスト用のハッシュ
+    refreshed: Dict[str, Dict[str, str]] = {}
+    if refresh_stats:
+        refresh_dataset()
+        # quiz_pool は前回同期したときの種で作り直す（削除した単語の行だけが変わる）
+        quiz_seed(reuse=True)
+        for table in REFRESH_TABLES:
+            hashes = {row_key(table, row): row_hash(table, row) for row in table_rows(table)}
+            previous = load_manifest_table(table)
+            if previous is None:
+                statements = chain([f"DELETE FROM {table};"], full_statements(table, table_rows(table)))
+            else:
+                statements = diff_statements(table, hashes, previous)
+            chunks, statement_count, total_bytes = write_chunks(statements, spool_dir, table)
+            print(f"  refresh {table}: {statement_count} statements in {len(chunks)} chunks ({total_bytes:,} bytes)")
+            if chunks:
+                refreshed[table] = hashes
+            # 削除 → 更新 → 追加の順序を保つため、チャンクは順に実行する
+            for i, chunk in enumerate(chunks):
+                jobs.append(Job(
+                    name=f"{table}#{i + 1}",
+                    sql_file=chunk,
+                    group=table,
+                    deps=[f"delete:{t}" for t in WORD_TABLES] + ([f"{table}#{i}"] if i > 0 else []),
+                ))
+
+    if dry_run:
+        with open(jobs[0].sql_file, "r", encoding="utf-8") as f:
+            preview = f.read(500)
+        print(f"[DRY-RUN] SQL ({jobs[0].sql_file.stat().st_size} bytes):\n{preview}...")
+        print(f"[DRY-RUN] SQL files written to {DRY_RUN_DIR}")
+        return True
+
+    def on_group_done(group: str):
+        if group in refreshed:
+            MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = spool_dir / f"{group}.manifest.json"
+            write_manifest_file(tmp_file, group, refreshed[group])
+            os.replace(tmp_file, manifest_path(group))
+            print(f"  {group} refreshed")
+            return
+        table = group[len("delete:"):]
+        pruned = prune_manifest(table, set(examples) if table == "example_translations" else set(words),
+                                spool_dir)
+        print(f"  {table} done" + (f" ({pruned} manifest entries removed)" if pruned else ""))
+
+    print(f"Executing {len(jobs)} jobs with {workers} workers...")
+    success = run_jobs(
+        jobs,
+        on_group_done,
+        database=D1_DATABASE,
+        cwd=PROJECT_ROOT,
+        workers=workers,
+        retries=retries,
+    )
+    if not success:
+        print("Some chunks failed. Run the same command again (DELETE is idempotent)")
+    return success
+
+def delete_words_sqlite(db_path: Path, words: Iterable[str], refresh_stats: bool = True) -> Dict[str, int]:
+    """ローカルSQLiteから単語の行を外部キー順に1トランザクションで削除し、テーブルごとの削除行数を返す
+
+    refresh_stats=True なら削除後に REFRESH_TABLES を現在のCSVから作り直す。
+    """
+    words = sorted({word.strip().lower() for word in words if word.strip()})
+    deleted: Dict[str, int] = {}
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("BEGIN")
+        try:
+            for table in reversed(WORD_TABLES):
+                deleted[table] = sum(
+                    conn.execute(statement).rowcount for statement in word_delete_statements(table, words)
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        if refresh_stats:
+            refresh_dataset()
+            with row_spool():
+                for table in REFRESH_TABLES:
+                    load_sqlite_table(conn, table, table_rows(table))
+    finally:
+        conn.close()
+    return deleted
+
+def db_value(value):
+    """escape_sql と同じく空文字を NULL として扱う"""
+    return None if value == "" else value
+
+def load_sqlite_table(conn: sqlite3.Connection, table: str, rows: Iterable[Row]) -> int:
+    """1テーブルを1トランザクションで executemany により一括ロードし、行数を返す"""
+    columns = TABLE_COLUMNS[table]
+    placeholders = ", ".join("?" for _ in columns)
+    conn.execute("BEGIN")
+    try:
+        conn.execute(f"DELETE FROM {table}")
+        cursor = conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            (tuple(db_value(v) for v in row) for row in rows),
+        )
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    return cursor.rowcount
+
+def sync_sqlite(db_path: Path, tables: List[str], metrics: Optional[SyncMetrics] = None) -> bool:
+    """ローカルSQLiteに同期
+
+    全テーブル同期時はスキーマを適用した一時ファイルに構築してから置き換えるため、
+    同じCSVからは常に同じ内容のファイルができる。テーブル指定時は既存ファイルの
+    そのテーブルだけを入れ替える。
+    """
+    metrics = metrics or SyncMetrics("sqlite")
+    full_build = tables == SYNC_ORDER
+    if not full_build and not db_path.exists():
+        print(f"Error: {db_path} does not exist, run a full sync first")
         return False
-    if not sync_example_translations(dry_run):
+
+    parse_dataset(metrics)
+
+    target = db_path.with_name(db_path.name + ".tmp") if full_build else db_path
+    if full_build and target.exists():
+        target.unlink()
+
+    conn = sqlite3.connect(target, isolation_level=None)
+    try:
+        if full_build:
+            conn.executescript(SCHEMA_FILE.read_text(encoding="utf-8"))
+        with row_spool():
+            for table in tables:
+                print(f"Loading {table}...")
+                with metrics.phase(table, "load") as record:
+                    record.rows = load_sqlite_table(conn, table, table_rows(table))
+                print(f"  {record.rows} records loaded")
+    except sqlite3.Error as e:
+        print(f"SQLite Error: {e}")
         return False
-    if not sync_memory_tricks(dry_run):
+    finally:
+        conn.close()
+
+    if full_build:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(target, db_path)
+    print(f"Wrote {db_path}")
+    return True
+
+def with_derived_tables(tables: List[str]) -> List[str]:
+    """tables に、それらから作る派生テーブル（DERIVED_TABLES）を加えて SYNC_ORDER の順に並べる"""
+    wanted = set(tables)
+    wanted.update(derived for derived, sources in DERIVED_TABLES.items() if wanted.intersection(sources))
+    return [table for table in SYNC_ORDER if table in wanted]
+
+def sync_all(
+    dry_run: bool = False,
+    incremental: bool = False,
+    truncate: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+    resume: bool = False,
+    metrics: Optional[SyncMetrics] = None,
+) -> bool:
+    """全テーブルを同期（外部キー制約を考慮した順序）"""
+    print("=" * 50)
+    print("Syncing all tables to D1" + (" (incremental)" if incremental else ""))
+    print("=" * 50)
+
+    if not sync_tables(SYNC_ORDER, dry_run, incremental, truncate, workers, retries, resume, metrics):
+        print("Sync failed")
         return False
 
     print("=" * 50)
@@ -286,34 +1297,77 @@ def sync_all(dry_run: bool = False) -> bool:
     return True
 
 def main():
+    global CHUNK_MAX_BYTES, CHUNK_MAX_STATEMENTS, QUIZ_SEED
     import argparse
     parser = argparse.ArgumentParser(description="Sync CSV to D1")
     parser.add_argument("--dry-run", action="store_true", help="Generate SQL but don't execute")
     parser.add_argument("--table", type=str, help="Sync specific table only")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only sync rows changed since the last successful sync")
+    parser.add_argument("--truncate", action="store_true",
+                        help="Delete all rows of the synced tables before inserting")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip chunks already applied by the previous (failed) run")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_MAX_BYTES,
+                        help="Max SQL bytes per wrangler execution")
+    parser.add_argument("--chunk-statements", type=int, default=CHUNK_MAX_STATEMENTS,
+                        help="Max SQL statements per wrangler execution")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Number of concurrent wrangler executions")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="Retries per chunk for transient failures")
+    parser.add_argument("--target", type=str, default="d1",
+                        help="Sync target: d1 (default) or sqlite:PATH")
+    parser.add_argument("--metrics", type=Path,
+                        help="Append per-table/phase metrics to this JSON Lines file")
+    parser.add_argument("--quiz-seed", type=int,
+                        help="Random seed for the quiz_pool order (default: the recorded seed with --resume or "
+                             "--incremental, otherwise a new seed per run)")
     args = parser.parse_args()
 
+    CHUNK_MAX_BYTES = args.chunk_bytes
+    CHUNK_MAX_STATEMENTS = args.chunk_statements
+    QUIZ_SEED = args.quiz_seed
+
+    tables = SYNC_ORDER
     if args.table:
         table = args.table.lower()
-        if table == "words_en":
-            success = sync_words_en(args.dry_run)
-        elif table == "gender_markers":
-            success = sync_gender_markers(args.dry_run)
-        elif table.startswith("words_"):
-            lang = table.replace("words_", "")
-            success = sync_language_table(lang, args.dry_run)
-        elif table == "word_meanings":
-            success = sync_word_meanings(args.dry_run)
-        elif table == "examples":
-            success = sync_examples(args.dry_run)
-        elif table == "example_translations":
-            success = sync_example_translations(args.dry_run)
-        elif table == "memory_tricks":
-            success = sync_memory_tricks(args.dry_run)
-        else:
+        if table not in TABLE_COLUMNS:
             print(f"Unknown table: {table}")
             sys.exit(1)
+        tables = with_derived_tables([table])
+        if len(tables) > 1:
+            print(f"Also syncing tables derived from {table}: {', '.join(t for t in tables if t != table)}")
+    if "quiz_pool" in tables:
+        print(f"Quiz pool seed: {quiz_seed(args.resume, args.incremental)}")
+
+    mode = "truncate" if args.truncate else "incremental" if args.incremental else "full"
+    if args.resume:
+        mode += "+resume"
+    if args.dry_run:
+        mode += "+dry-run"
+
+    if args.target.startswith("sqlite:"):
+        metrics = SyncMetrics("sqlite", "full")
+        db_path = Path(args.target[len("sqlite:"):])
+        success = sync_sqlite(db_path, tables, metrics)
+    elif args.target != "d1":
+        print(f"Unknown target: {args.target}")
+        sys.exit(1)
+    elif args.table:
+        metrics = SyncMetrics("d1", mode)
+        success = sync_tables(tables, args.dry_run, args.incremental, args.truncate,
+                              args.workers, args.retries, args.resume, metrics)
     else:
-        success = sync_all(args.dry_run)
+        metrics = SyncMetrics("d1", mode)
+        success = sync_all(args.dry_run, args.incremental, args.truncate, args.workers, args.retries,
+                           args.resume, metrics)
+
+    print()
+    metrics.print_summary()
+    if args.metrics:
+        metrics.write_jsonl(args.metrics)
+        print(f"Metrics appended to {args.metrics}")
 
     sys.exit(0 if success else 1)
 
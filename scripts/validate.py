@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+統合検証エンジン
+
+verify_all_translations_quality.py / verify_meaning_en_quality.py /
+verify_translations.py / detect_typos.py の各チェックをルール（Rule）として登録し、
+ファイルごとに1回の走査ですべてのルールを適用する。ファイル（words.csv、
+translations_{lang}.csv、example_translations.csv）はプロセスプールで並列に検証するため、全体の所要時間は
+最も遅いファイルで決まる。結果は1つの JSON レポートにまとめる。
+
+行ごとの検出結果は行の内容のハッシュとルールのキーで .cache/validation/ に保存し、
+次回は内容が変わった行と、実装が変わったルールだけを評価する。
+
+ルールの追加:
+    @register
+    class MyRule(Rule):
+        name = "my_rule"
+        target = "translations"          # "words" / "translations" / "example_translations"
+        languages = ("fr", "de")         # None なら全言語
+        depends = (helper, some_module)  # check が使う関数・モジュール（キャッシュのキーに含める）
+
+        def check(self, row, lang):
+            if ...:
+                yield "メッセージ", row.translation
+
+    chain を同じ名前にしたルールは宣言順に評価し、最初に問題を報告したルールで
+    その行の同じ chain の残りを打ち切る（元のスクリプトの continue と同じ動作）。
+
+使い方:
+    python scripts/validate.py                          # 全ファイルを検証して要約を表示
+    python scripts/validate.py --output report.json     # JSON レポートを保存
+    python scripts/validate.py --json --lang fr --rule has_article
+    python scripts/validate.py --list-rules
+    python scripts/validate.py --no-cache               # キャッシュを使わず全行を評価
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import detect_typos
+import prefix_matcher
+import verify_all_translations_quality as translation_quality
+import verify_meaning_en_quality as meaning_quality
+from dataset import (
+    CACHE_DIR,
+    DATA_DIR,
+    RECORD_SPECS,
+    TRANSLATION_LANGUAGES,
+    file_stamp,
+    read_rows,
+    refresh_snapshot,
+    snapshot_file,
+)
+
+# 致命的な問題（終了コード1）と警告
+ERROR = "error"
+WARNING = "warning"
+
+# 詳細表示するときの1ルールあたりの件数
+DETAIL_LIMIT = 5
+
+
+class Issue(NamedTuple):
+    """ルールが検出した1件の問題（row はヘッダーを除いた1始まりの行番号）"""
+
+    rule: str
+    severity: str
+    file: str
+    row: int
+    en: str
+    message: str
+    value: str
+
+
+# (ルール名, 重要度, メッセージ, 値)。行番号と en を除いた検出結果（キャッシュの単位）
+Finding = Tuple[str, str, str, str]
+
+
+class Rule:
+    """検証ルールの基底クラス
+
+    check() は問題ごとに (メッセージ, 対象の値) を yield する。depends には check() が使う
+    他の関数・モジュールを挙げる（そのソースが変わるとこのルールのキャッシュだけが無効になる）。
+    """
+
+    name = ""
+    target = "translations"
+    severity = ERROR
+    languages: Optional[Tuple[str, ...]] = None
+    chain: Optional[str] = None
+    depends: Tuple[object, ...] = ()
+    description = ""
+
+    def applies(self, lang: Optional[str]) -> bool:
+        return self.languages is None or lang in self.languages
+
+    def check(self, row, lang: Optional[str]) -> Iterable[Tuple[str, str]]:
+        raise NotImplementedError
+
+
+RULES: List[Rule] = []
+
+
+def register(cls):
+    """ルールクラスを登録するデコレーター（登録順が評価順）"""
+    RULES.append(cls())
+    return cls
+
+
+def rules_for(target: str, lang: Optional[str], names: Optional[List[str]] = None):
+    """ファイルに適用するルール（宣言順）"""
+    return [
+        rule
+        for rule in RULES
+        if rule.target == target and rule.applies(lang) and (names is None or rule.name in names)
+    ]
+
+
+# --- translations_{lang}.csv（verify_all_translations_quality / verify_translations）
+
+GENDERED_LANGUAGES = tuple(translation_quality.LANGUAGES)
+
+
+@register
+class EmptyTranslation(Rule):
+    name = "empty_translation"
+    languages = GENDERED_LANGUAGES
+    chain = "translation"
+    description = "翻訳が空"
+
+    def check(self, row, lang):
+        if not row.translation.strip():
+            yield "translation is empty", ""
+
+
+@register
+class EmptyGender(Rule):
+    name = "empty_gender"
+    languages = GENDERED_LANGUAGES
+    chain = "translation"
+    description = "性別が空"
+
+    def check(self, row, lang):
+        if not row.gender.strip():
+            yield "gender is empty", row.translation.strip()
+
+
+@register
+class InvalidGender(Rule):
+    name = "invalid_gender"
+    languages = GENDERED_LANGUAGES
+    chain = "translation"
+    depends = (translation_quality,)
+    description = "性別フォーマットが不正（m/f/n 以外、その言語にない性別）"
+
+    def check(self, row, lang):
+        valid_genders = translation_quality.LANGUAGES[lang]["genders"]
+        is_valid, issue = translation_quality.check_gender_format(row.gender, valid_genders)
+        if not is_valid:
+            yield issue, row.gender.strip()
+
+
+@register
+class HasArticle(Rule):
+    name = "has_article"
+    languages = GENDERED_LANGUAGES
+    depends = (translation_quality, prefix_matcher)
+    description = "翻訳に冠詞が含まれている"
+
+    def check(self, row, lang):
+        articles = translation_quality.LANGUAGES[lang]["articles"]
+        has_article, article = translation_quality.check_article(row.translation, articles, row.en)
+        if has_article:
+            yield f"starts with article '{article}'", row.translation.strip()
+
+
+@register
+class EmptyMeaningTranslation(Rule):
+    name = "empty_meaning"
+    severity = WARNING
+    languages = GENDERED_LANGUAGES
+    description = "意味翻訳が空"
+
+    def check(self, row, lang):
+        # 翻訳がない行は empty_translation で報告済み
+        if row.translation.strip() and not row.meaning_translation.strip():
+            yield "meaning_translation is empty", row.translation.strip()
+
+
+# 文字種・文字化け・誤字（detect_typos.py）。translation と meaning_translation の両方を見る
+
+
+def translation_texts(row):
+    yield "translation", row.translation
+    yield "meaning_translation", row.meaning_translation
+
+
+@register
+class ScriptMismatch(Rule):
+    name = "script_mismatch"
+    severity = WARNING
+    languages = tuple(detect_typos.LANGUAGE_SCRIPTS)
+    depends = (translation_texts, detect_typos)
+    description = "その言語で使わない文字種の混入、その言語の文字がない"
+
+    def check(self, row, lang):
+        for column, text in translation_texts(row):
+            for issue in detect_typos.detect_script_issues(text, lang):
+                yield f"{column}: {issue}", text
+
+
+@register
+class EncodingIssues(Rule):
+    name = "encoding_issues"
+    severity = WARNING
+    depends = (translation_texts, detect_typos)
+    description = "文字化けの疑い"
+
+    def check(self, row, lang):
+        for column, text in translation_texts(row):
+            for issue in detect_typos.detect_encoding_issues(text):
+                yield f"{column}: {issue}", text
+
+
+@register
+class SuspiciousCharacters(Rule):
+    name = "suspicious_chars"
+    severity = WARNING
+    languages = detect_typos.TYPO_LANGUAGES
+    depends = (translation_texts, detect_typos)
+    description = "誤字の疑いがある漢字"
+
+    def check(self, row, lang):
+        for column, text in translation_texts(row):
+            for char, code, desc in detect_typos.detect_suspicious_characters(text):
+                yield f"{column}: '{char}' (U+{code:04X}): {desc}", text
+
+
+@register
+class PatternAnomalies(Rule):
+    name = "pattern_anomalies"
+    severity = WARNING
+    languages = detect_typos.TYPO_LANGUAGES
+    depends = (translation_texts, detect_typos)
+    description = "重複語・簡体字の混入"
+
+    def check(self, row, lang):
+        for column, text in translation_texts(row):
+            for anomaly in detect_typos.detect_pattern_anomalies(text):
+                yield f"{column}: {anomaly}", text
+
+
+# --- example_translations.csv（言語は行の lang 列）
+
+
+@register
+class ExampleScriptMismatch(Rule):
+    name = "example_script_mismatch"
+    target = "example_translations"
+    severity = WARNING
+    depends = (detect_typos,)
+    description = "例文の文字種の不一致"
+
+    def check(self, row, lang):
+        for issue in detect_typos.detect_script_issues(row.example_translation, row.lang):
+            yield f"{row.lang}: {issue}", row.example_translation
+
+
+@register
+class ExampleEncodingIssues(Rule):
+    name = "example_encoding_issues"
+    target = "example_translations"
+    severity = WARNING
+    depends = (detect_typos,)
+    description = "例文の文字化けの疑い"
+
+    def check(self, row, lang):
+        for issue in detect_typos.detect_encoding_issues(row.example_translation):
+            yield f"{row.lang}: {issue}", row.example_translation
+
+
+# --- words.csv（verify_meaning_en_quality）。chain で最初の1件のみ報告する
+
+
+def first_meaning(row) -> str:
+    """セミコロン区切りの最初の意味"""
+    return row.meaning_en.split(";")[0].strip()
+
+
+@register
+class EmptyMeaningEn(Rule):
+    name = "meaning_empty"
+    target = "words"
+    chain = "meaning_en"
+    description = "meaning_en が空"
+
+    def check(self, row, lang):
+        if not row.meaning_en.strip():
+            yield "meaning_en is empty", ""
+
+
+@register
+class MeaningPartOfSpeech(Rule):
+    name = "meaning_not_noun"
+    target = "words"
+    chain = "meaning_en"
+    depends = (first_meaning, meaning_quality, prefix_matcher)
+    description = "動詞・動名詞・形容詞・副詞の定義（POS_MATCHER で1回の走査で分類）"
+
+    def check(self, row, lang):
+        meaning = first_meaning(row)
+        category = meaning_quality.POS_MATCHER.match(meaning)
+        if category is not None:
+            yield f"definition is not a noun ({category})", meaning[:80]
+
+
+@register
+class MeaningTooShort(Rule):
+    name = "meaning_too_short"
+    target = "words"
+    chain = "meaning_en"
+    description = "定義が短すぎる（セミコロンなしで20文字未満）"
+
+    def check(self, row, lang):
+        if ";" not in row.meaning_en and len(row.meaning_en) < 20:
+            yield "definition is too short", row.meaning_en
+
+
+@register
+class MeaningCircular(Rule):
+    name = "meaning_circular"
+    target = "words"
+    chain = "meaning_en"
+    depends = (first_meaning,)
+    description = "定義に見出し語そのものを使っている"
+
+    def check(self, row, lang):
+        meaning = first_meaning(row).lower()
+        if f" {row.en.lower()} " in f" {meaning} ":
+            yield "definition uses the word itself", first_meaning(row)[:80]
+
+
+# --- エンジン
+
+
+def data_files(
+    data_dir: Path, languages: Optional[List[str]] = None
+) -> List[Tuple[str, Optional[str], Path]]:
+    """検証対象の (種別, 言語, パス)。存在するファイルのみ"""
+    files: List[Tuple[str, Optional[str], Path]] = []
+    if languages is None and (data_dir / "words.csv").exists():
+        files.append(("words", None, data_dir / "words.csv"))
+    for lang in languages or TRANSLATION_LANGUAGES:
+        path = data_dir / f"translations_{lang}.csv"
+        if path.exists():
+            files.append(("translations", lang, path))
+    if languages is None and (data_dir / "example_translations.csv").exists():
+        files.append(("example_translations", None, data_dir / "example_translations.csv"))
+    return files
+
+
+def check_row(
+    row, rules: List[Rule], lang: Optional[str], keys: List[str], cached: Dict[str, List[Finding]]
+) -> Dict[str, List[Finding]]:
+    """1行に全ルールを適用し、ルールのキー（rule_keys）→ 検出結果を返す
+
+    cached にキーがあるルールは評価せずにその結果を使う。chain を打ち切ったルールの結果は空。
+    """
+    results: Dict[str, List[Finding]] = {}
+    stopped = set()
+    for rule, key in zip(rules, keys):
+        if rule.chain is not None and rule.chain in stopped:
+            findings: List[Finding] = []
+        elif key in cached:
+            findings = cached[key]
+        else:
+            findings = [
+                (rule.name, rule.severity, message, value) for message, value in rule.check(row, lang)
+            ]
+        if findings and rule.chain is not None:
+            stopped.add(rule.chain)
+        results[key] = findings
+    return results
+
+
+# --- 検証キャッシュ
+#
+# データファイルごとに .cache/validation/{ファイル名}.pickle に
+# 「行の内容のハッシュ → {ルールのキー: その行の検出結果}」を保存する。ルールのキーは
+# ルールのクラスと depends のソースのハッシュのため、実装を変えたルールだけを評価し直し、
+# 他のルールは保存した結果を使う。--rule で一部のルールだけを実行しても、他のルールの
+# 結果は残す。ファイルの (mtime, size) とルールのキーが前回と同じなら、ファイルを読まずに
+# 前回の結果をそのまま使う。
+
+VALIDATION_CACHE_DIR = CACHE_DIR / "validation"
+
+# キャッシュの形式や check_row の動作を変えたら上げる（全ルールの結果を捨てる）
+VALIDATION_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def rule_source_digest(rule_class: type) -> str:
+    """ルールの実装のハッシュ（クラスと depends に挙げた関数・モジュールのソース）"""
+    digest = hashlib.blake2b(digest_size=16)
+    for obj in (rule_class, *rule_class.depends):
+        digest.update(inspect.getsource(obj).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def rule_keys(rules: List[Rule], lang: Optional[str]) -> List[str]:
+    """ルールごとのキャッシュのキー（"ルール名:ハッシュ"）
+
+    chain のルールは前のルールが問題を報告したかどうかで評価するかが決まるため、
+    同じ chain の前のルールの実装もハッシュに含める（前のルールを変えると後ろも評価し直す）。
+    """
+    keys = []
+    chains: Dict[str, str] = {}
+    for rule in rules:
+        source = f"{VALIDATION_CACHE_VERSION}:{lang}:{rule_source_digest(type(rule))}"
+        if rule.chain is not None:
+            source = chains[rule.chain] = f"{chains.get(rule.chain, '')}|{source}"
+        keys.append(f"{rule.name}:{hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()}")
+    return keys
+
+
+def row_digest(row) -> bytes:
+    """行の内容のハッシュ（列の区切りを含めて連結）"""
+    return hashlib.blake2b("\x1f".join(row).encode("utf-8"), digest_size=16).digest()
+
+
+def read_validation_cache(cache_file: Path) -> Optional[Dict]:
+    """キャッシュを読み込む（壊れている・形式が古いなら None）"""
+    try:
+        with open(cache_file, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != VALIDATION_CACHE_VERSION:
+        return None
+    return cache
+
+
+def write_validation_cache(cache_file: Path, cache: Dict):
+    """キャッシュを一時ファイル経由で書き込む"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".tmp")
+    with open(tmp_file, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+
+
+def validate_file(
+    kind: str, lang: Optional[str], path: Path, rule_names: Optional[List[str]], use_cache: bool = True
+) -> Dict:
+    """1ファイルを検証する（プロセスプールのワーカーで実行）
+
+    キャッシュに同じ内容の行の同じキーのルールの結果があれば、そのルールは評価しない。
+    """
+    start = time.perf_counter()
+    rules = rules_for(kind, lang, rule_names)
+    keys = rule_keys(rules, lang)
+    cache_file = VALIDATION_CACHE_DIR / f"{path.name}.pickle"
+    cache = read_validation_cache(cache_file) if use_cache else None
+    stamp = (str(path), file_stamp(path))
+
+    if cache is not None and cache["stamp"] == stamp and cache["keys"] == keys:
+        result = dict(cache["result"])
+        result["cached_rows"] = result["rows"]
+        result["checked_rows"] = 0
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        return result
+
+    previous: Dict[bytes, Dict[str, List[Finding]]] = cache["rows"] if cache else {}
+    current: Dict[bytes, Dict[str, List[Finding]]] = {}
+    # --rule で外したルールの結果は残す（今回のルールの古いキーと、なくなったルールの結果は捨てる）
+    kept_rules = {rule.name for rule in RULES} - {rule.name for rule in rules}
+    issues: List[Dict] = []
+    checked = 0
+    count = 0
+    # ワーカーは担当ファイルのスナップショットだけを更新して読む（sync_to_d1.py と共有するため、
+    # 同期で解析済みのファイルは解析し直さない）
+    key = f"translations_{lang}" if kind == "translations" else kind
+    refresh_snapshot(key, kind, path)
+    make = RECORD_SPECS[kind][0]._make
+    for count, values in enumerate(read_rows(snapshot_file(key)), 1):
+        row = make(values)
+        digest = row_digest(row)
+        cached = previous.get(digest, {})
+        if any(rule_key not in cached for rule_key in keys):
+            checked += 1
+        results = check_row(row, rules, lang, keys, cached)
+        entry = {rule_key: f for rule_key, f in cached.items() if rule_key.split(":", 1)[0] in kept_rules}
+        entry.update(results)
+        current[digest] = entry
+        for rule_key in keys:
+            for rule, severity, message, value in results[rule_key]:
+                issues.append(Issue(rule, severity, path.name, count, row.en, message, value)._asdict())
+
+    result = {
+        "file": path.name,
+        "language": lang,
+        "rows": count,
+        "rules": [rule.name for rule in rules],
+        "issues": issues,
+    }
+    if use_cache:
+        write_validation_cache(
+            cache_file,
+            {
+                "version": VALIDATION_CACHE_VERSION,
+                "keys": keys,
+                "stamp": stamp,
+                "rows": current,
+                "result": result,
+            },
+        )
+    result = dict(result)
+    result["cached_rows"] = count - checked
+    result["checked_rows"] = checked
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def validate(
+    data_dir: Path = DATA_DIR,
+    languages: Optional[List[str]] = None,
+    rule_names: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> Dict:
+    """全ファイルを並列に検証し、レポート（JSON化できる dict）を返す
+
+    languages を指定すると translations_{lang}.csv のみを検証する。
+    workers=1 ならプロセスプールを使わずに順に検証する。
+    use_cache=False なら検証キャッシュを読み書きせず全行を評価する。
+    """
+    start = time.perf_counter()
+    files = data_files(Path(data_dir), languages)
+    workers = workers or min(len(files), os.cpu_count() or 1) or 1
+
+    if workers == 1:
+        results = [validate_file(kind, lang, path, rule_names, use_cache) for kind, lang, path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(validate_file, kind, lang, path, rule_names, use_cache)
+                for kind, lang, path in files
+            ]
+            results = [future.result() for future in futures]
+
+    by_rule: Dict[str, int] = {}
+    severities = {rule.name: rule.severity for rule in RULES}
+    for result in results:
+        for issue in result["issues"]:
+            by_rule[issue["rule"]] = by_rule.get(issue["rule"], 0) + 1
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "data_dir": str(data_dir),
+        "workers": workers,
+        "seconds": round(time.perf_counter() - start, 4),
+        "summary": {
+            "files": len(results),
+            "rows": sum(r["rows"] for r in results),
+            "checked_rows": sum(r["checked_rows"] for r in results),
+            "errors": sum(n for name, n in by_rule.items() if severities[name] == ERROR),
+            "warnings": sum(n for name, n in by_rule.items() if severities[name] == WARNING),
+            "by_rule": dict(sorted(by_rule.items())),
+        },
+        "files": results,
+    }
+
+
+def print_report(report: Dict):
+    """要約を表示"""
+    print("=" * 80)
+    print("統合検証レポート")
+    print("=" * 80)
+
+    for result in report["files"]:
+        issues = result["issues"]
+        errors = sum(1 for issue in issues if issue["severity"] == ERROR)
+        warnings = len(issues) - errors
+        mark = "❌" if errors else ("⚠️ " if warnings else "✅")
+        print(
+            f"\n{mark} {result['file']}: {result['rows']}行, "
+            f"エラー {errors}件 / 警告 {warnings}件 "
+            f"(評価 {result['checked_rows']}行, {result['seconds'] * 1000:.0f} ms)"
+        )
+
+        by_rule: Dict[str, List[Dict]] = {}
+        for issue in issues:
+            by_rule.setdefault(issue["rule"], []).append(issue)
+        for name, rule_issues in by_rule.items():
+            print(f"  [{name}] {len(rule_issues)}件")
+            for issue in rule_issues[:DETAIL_LIMIT]:
+                value = f" → {issue['value']}" if issue["value"] else ""
+                print(f"    Line {issue['row']}: {issue['en']}{value} - {issue['message']}")
+            if len(rule_issues) > DETAIL_LIMIT:
+                print(f"    ... and {len(rule_issues) - DETAIL_LIMIT} more")
+
+    summary = report["summary"]
+    print("\n" + "=" * 80)
+    print(
+        f"🔍 {summary['files']}ファイル / {summary['rows']}行: "
+        f"エラー {summary['errors']}件, 警告 {summary['warnings']}件 "
+        f"({report['seconds']:.2f}s, {report['workers']} workers)"
+    )
+    print(f"   評価した行: {summary['checked_rows']}行（残りはキャッシュ）")
+    if summary["errors"]:
+        print("❌ 致命的な問題が見つかりました。修正が必要です。")
+    else:
+        print("✅ 致命的な問題はありません！")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run all validation rules in one pass per dataset file")
+    parser.add_argument(
+        "--lang", action="append", choices=TRANSLATION_LANGUAGES, help="Only validate translations_{lang}.csv"
+    )
+    parser.add_argument("--rule", action="append", help="Only run this rule (repeatable, see --list-rules)")
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per file, up to the CPU count)"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of the summary")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check every row and leave the validation cache untouched"
+    )
+    parser.add_argument("--list-rules", action="store_true", help="List the rules")
+    args = parser.parse_args()
+
+    if args.list_rules:
+        for rule in RULES:
+            langs = ",".join(rule.languages) if rule.languages else "*"
+            print(f"{rule.name:<24} {rule.target:<21} {rule.severity:<8} {langs:<30} {rule.description}")
+        return 0
+
+    known = {rule.name for rule in RULES}
+    unknown = sorted(set(args.rule or []) - known)
+    if unknown:
+        print(f"❌ 不明なルール: {', '.join(unknown)}")
+        return 1
+
+    report = validate(
+        languages=args.lang, rule_names=args.rule, workers=args.workers, use_cache=not args.no_cache
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+        if args.output:
+            print(f"📄 レポート: {args.output}")
+
+    return 1 if report["summary"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
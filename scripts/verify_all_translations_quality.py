@@ -9,11 +9,14 @@ Phase 3 全言語品質検証スクリプト
 4. 翻訳が名詞形式か（動詞・形容詞でないか）
 """
 
-import csv
 import sys
 import re
+from functools import lru_cache
 from typing import List, Tuple, Dict
 
+from dataset import Translation, load_dataset
+from prefix_matcher import PrefixMatcher
+
 # 言語設定
 LANGUAGES = {
     "fr": {
@@ -96,6 +99,20 @@ def check_gender_format(gender: str, valid_genders: List[str]) -> Tuple[bool, st
     return True, ""
 
 
+@lru_cache(maxsize=None)
+def article_matcher(articles: Tuple[str, ...]) -> PrefixMatcher:
+    """冠詞のリストをトライ木にまとめる（言語ごとに1回だけ構築）"""
+    matcher = PrefixMatcher()
+    for article in articles:
+        article = article.lower()
+        # 冠詞が単語の最初にある場合のみ検出
+        matcher.add(article + " ", article)
+        # アポストロフィ付き冠詞 (l', l')
+        if "'" in article:
+            matcher.add(article, article)
+    return matcher
+
+
 def check_article(
     translation: str, articles: List[str], en_word: str = ""
 ) -> Tuple[bool, str]:
@@ -116,34 +133,15 @@ def check_article(
     if en_word.lower() in EXCEPTIONS:
         return False, ""
 
-    translation_lower = translation.strip().lower()
-
-    for article in articles:
-        # 冠詞が単語の最初にある場合のみ検出
-        if translation_lower.startswith(article.lower() + " "):
-            return True, article
-        # アポストロフィ付き冠詞 (l', l')
-        if "'" in article and translation_lower.startswith(article.lower()):
-            return True, article
-
-    return False, ""
-
-    translation_lower = translation.strip().lower()
-
-    for article in articles:
-        # 冠詞が単語の最初にある場合のみ検出
-        if translation_lower.startswith(article.lower() + " "):
-            return True, article
-        # アポストロフィ付き冠詞 (l', l')
-        if "'" in article and translation_lower.startswith(article.lower()):
-            return True, article
-
+    article = article_matcher(tuple(articles)).match(translation.strip().lower())
+    if article is not None:
+        return True, article
     return False, ""
 
 
-def check_translation_quality(lang: str, csv_path: str) -> Dict:
+def check_translation_quality(lang: str, rows: List[Translation]) -> Dict:
     """
-    特定言語の翻訳品質をチェック
+    特定言語の翻訳品質をチェック（rows は translations_{lang}.csv の行）
 
     Returns:
         問題のある行の詳細を含む辞書
@@ -158,44 +156,39 @@ def check_translation_quality(lang: str, csv_path: str) -> Dict:
     }
     total_rows = 0
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-
-        for i, row in enumerate(reader, 1):
-            total_rows += 1
-            en_word = row.get("en", "") or ""
-            translation = (row.get("translation") or "").strip()
-            gender = (row.get("gender") or "").strip()
-            meaning = (row.get("meaning_translation") or "").strip()
-
-            # チェック1: 翻訳が空
-            if not translation:
-                issues["empty_translation"].append((i, en_word))
-                continue
-
-            # チェック2: 性別が空
-            if not gender:
-                issues["empty_gender"].append((i, en_word, translation))
-                continue
-
-            # チェック3: 性別フォーマットが不正
-            is_valid, issue_desc = check_gender_format(gender, config["genders"])
-            if not is_valid:
-                issues["invalid_gender"].append(
-                    (i, en_word, translation, gender, issue_desc)
-                )
-                continue
-
-            # チェック4: 冠詞が含まれている
-            has_article, article = check_article(
-                translation, config["articles"], en_word
+    for i, row in enumerate(rows, 1):
+        total_rows += 1
+        en_word = row.en
+        translation = row.translation.strip()
+        gender = row.gender.strip()
+        meaning = row.meaning_translation.strip()
+
+        # チェック1: 翻訳が空
+        if not translation:
+            issues["empty_translation"].append((i, en_word))
+            continue
+
+        # チェック2: 性別が空
+        if not gender:
+            issues["empty_gender"].append((i, en_word, translation))
+            continue
+
+        # チェック3: 性別フォーマットが不正
+        is_valid, issue_desc = check_gender_format(gender, config["genders"])
+        if not is_valid:
+            issues["invalid_gender"].append(
+                (i, en_word, translation, gender, issue_desc)
             )
-            if has_article:
-                issues["has_article"].append((i, en_word, translation, article))
+            continue
+
+        # チェック4: 冠詞が含まれている
+        has_article, article = check_article(translation, config["articles"], en_word)
+        if has_article:
+            issues["has_article"].append((i, en_word, translation, article))
 
-            # チェック5: 意味翻訳が空（警告レベル）
-            if not meaning:
-                issues["empty_meaning"].append((i, en_word, translation))
+        # チェック5: 意味翻訳が空（警告レベル）
+        if not meaning:
+            issues["empty_meaning"].append((i, en_word, translation))
 
     return {
         "language": lang,
@@ -296,14 +289,15 @@ def print_report(results: List[Dict]):
 def main():
     """メイン処理"""
     results = []
+    dataset = load_dataset()
 
     for lang in ["fr", "de", "es", "it", "pt", "ru", "ar", "hi"]:
-        csv_path = f"data/translations_{lang}.csv"
+        if lang not in dataset.translations:
+            print(f"⚠️  Warning: data/translations_{lang}.csv not found, skipping...")
+            continue
         try:
-            result = check_translation_quality(lang, csv_path)
+            result = check_translation_quality(lang, dataset.translations[lang])
             results.append(result)
-        except FileNotFoundError:
-            print(f"⚠️  Warning: {csv_path} not found, skipping...")
         except Exception as e:
             print(f"❌ Error checking {lang}: {e}")
 
@@ -6,10 +6,12 @@ meaning_en列が名詞の定義になっているかチェックする。
 動詞・副詞・形容詞の定義が混入していないか検出。
 """
 
-import csv
 import sys
 from typing import List, Tuple
 
+from dataset import Word, load_dataset
+from prefix_matcher import PrefixMatcher
+
 # 明確な非名詞パターン
 VERB_PATTERNS = [
     "To ",
@@ -46,12 +48,24 @@ ADVERB_PATTERNS = [
     "Into the depths",  # "Into the depths" (副詞句)
 ]
 
+# 品詞パターンを1つのトライ木にまとめたもの（先に一致した分類を優先する順で登録）
+POS_MATCHER = PrefixMatcher(
+    (pattern, category)
+    for category, patterns in [
+        ("VERB", VERB_PATTERNS),
+        ("GERUND", GERUND_PATTERNS),
+        ("ADJECTIVE", ADJECTIVE_PATTERNS),
+        ("ADVERB", ADVERB_PATTERNS),
+    ]
+    for pattern in patterns
+)
+
 
 def check_meaning_quality(
-    csv_path: str = "data/words.csv",
+    words: List[Word],
 ) -> Tuple[List[Tuple[int, str, str, str]], int]:
     """
-    meaning_en列の品質をチェックする
+    meaning_en列の品質をチェックする（words は words.csv の行）
 
     Returns:
         (問題のある行のリスト, 総行数)
@@ -59,53 +73,36 @@ def check_meaning_quality(
     issues = []
     total_rows = 0
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-
-        for i, row in enumerate(reader, 1):
-            total_rows += 1
-            word = row["en"]
-            meaning = row["meaning_en"]
-
-            if not meaning.strip():
-                issues.append((i, word, "EMPTY", "meaning_en is empty"))
-                continue
-
-            # セミコロンがあれば最初の意味のみチェック
-            first_meaning = meaning.split(";")[0].strip()
-
-            # チェック1: 動詞 ("To + 動詞")
-            if any(first_meaning.startswith(pattern) for pattern in VERB_PATTERNS):
-                issues.append((i, word, "VERB", first_meaning[:80]))
-                continue
-
-            # チェック2: 動名詞（動詞的）
-            if any(first_meaning.startswith(pattern) for pattern in GERUND_PATTERNS):
-                issues.append((i, word, "GERUND", first_meaning[:80]))
-                continue
-
-            # チェック3: 形容詞
-            if any(first_meaning.startswith(pattern) for pattern in ADJECTIVE_PATTERNS):
-                issues.append((i, word, "ADJECTIVE", first_meaning[:80]))
-                continue
-
-            # チェック4: 副詞（慎重に）
-            if any(first_meaning.startswith(pattern) for pattern in ADVERB_PATTERNS):
-                issues.append((i, word, "ADVERB", first_meaning[:80]))
-                continue
-
-            # チェック5: 全体が短すぎる（セミコロンなし かつ 20文字未満）
-            if ";" not in meaning and len(meaning) < 20:
-                issues.append((i, word, "TOO_SHORT", meaning))
+    for i, row in enumerate(words, 1):
+        total_rows += 1
+        word = row.en
+        meaning = row.meaning_en
+
+        if not meaning.strip():
+            issues.append((i, word, "EMPTY", "meaning_en is empty"))
+            continue
+
+        # セミコロンがあれば最初の意味のみチェック
+        first_meaning = meaning.split(";")[0].strip()
+
+        # チェック1-4: 動詞 ("To + 動詞")・動名詞・形容詞・副詞（1回の走査で分類）
+        category = POS_MATCHER.match(first_meaning)
+        if category is not None:
+            issues.append((i, word, category, first_meaning[:80]))
+            continue
+
+        # チェック5: 全体が短すぎる（セミコロンなし かつ 20文字未満）
+        if ";" not in meaning and len(meaning) < 20:
+            issues.append((i, word, "TOO_SHORT", meaning))
+            continue
+
+        # チェック6: 同じ単語を使っている（定義になっていない）
+        if word.lower() in first_meaning.lower().split():
+            # 例外: "absence" in "in the absence of" は許容
+            if f" {word.lower()} " in f" {first_meaning.lower()} ":
+                issues.append((i, word, "CIRCULAR", first_meaning[:80]))
                 continue
 
-            # チェック6: 同じ単語を使っている（定義になっていない）
-            if word.lower() in first_meaning.lower().split():
-                # 例外: "absence" in "in the absence of" は許容
-                if f" {word.lower()} " in f" {first_meaning.lower()} ":
-                    issues.append((i, word, "CIRCULAR", first_meaning[:80]))
-                    continue
-
     return issues, total_rows
 
 
@@ -115,7 +112,7 @@ def main():
 
     print(f"Phase 2 (Stage 1) 品質検証: {csv_path}\n")
 
-    issues, total_rows = check_meaning_quality(csv_path)
+    issues, total_rows = check_meaning_quality(load_dataset().words)
 
     if not issues:
         print(f"✅ すべての meaning_en が名詞定義です！")
@@ -4,52 +4,55 @@
 使用例: python verify_translations.py fr 1 230
 """
 
-import csv
 import sys
 
+from word_index import open_index
+
 
 def verify(lang, start, end):
     """指定範囲の翻訳が完了しているか検証"""
     filename = f"data/translations_{lang}.csv"
 
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-
-            missing = []
-            invalid_gender = []
-
-            for i, row in enumerate(reader, 1):
-                if start <= i <= end:
-                    en = row["en"]
-                    translation = row.get("translation", "").strip()
-                    gender = row.get("gender", "").strip()
-
-                    if not translation or not gender:
-                        missing.append(f"Line {i}: {en}")
-                    elif gender not in ["m", "f", "n"]:
-                        invalid_gender.append(f"Line {i}: {en} (gender='{gender}')")
-
-            total = end - start + 1
-            filled = total - len(missing)
-
-            if missing:
-                print(f"❌ {lang.upper()}[{start}:{end}] 未完了: {len(missing)}語")
-                print(f"   完了: {filled}/{total} ({filled / total * 100:.1f}%)")
-                print("\n未完了単語（最初の10語）:")
-                for m in missing[:10]:
-                    print(f"  {m}")
-                return False
-            elif invalid_gender:
-                print(
-                    f"⚠️  {lang.upper()}[{start}:{end}] 性別エラー: {len(invalid_gender)}語"
-                )
-                for ig in invalid_gender[:10]:
-                    print(f"  {ig}")
-                return False
-            else:
-                print(f"✅ {lang.upper()}[{start}:{end}] 完全完了: {total}語")
-                return True
+        with open_index() as index:
+            if lang not in index.languages:
+                raise FileNotFoundError(filename)
+            # 指定範囲の行だけを参照する（ファイル全体は読まない）
+            rows = list(index.translations(lang, max(start, 1) - 1, end))
+
+        missing = []
+        invalid_gender = []
+
+        for i, row in enumerate(rows, max(start, 1)):
+            en = row.en
+            translation = row.translation.strip()
+            gender = row.gender.strip()
+
+            if not translation or not gender:
+                missing.append(f"Line {i}: {en}")
+            elif gender not in ["m", "f", "n"]:
+                invalid_gender.append(f"Line {i}: {en} (gender='{gender}')")
+
+        total = end - start + 1
+        filled = total - len(missing)
+
+        if missing:
+            print(f"❌ {lang.upper()}[{start}:{end}] 未完了: {len(missing)}語")
+            print(f"   完了: {filled}/{total} ({filled / total * 100:.1f}%)")
+            print("\n未完了単語（最初の10語）:")
+            for m in missing[:10]:
+                print(f"  {m}")
+            return False
+        elif invalid_gender:
+            print(
+                f"⚠️  {lang.upper()}[{start}:{end}] 性別エラー: {len(invalid_gender)}語"
+            )
+            for ig in invalid_gender[:10]:
+                print(f"  {ig}")
+            return False
+        else:
+            print(f"✅ {lang.upper()}[{start}:{end}] 完全完了: {total}語")
+            return True
 
     except FileNotFoundError:
         print(f"❌ ファイルが見つかりません: {filename}")
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+単語インデックス（mmap で開くバイナリスナップショット）
+
+words.csv と translations_{lang}.csv を1つのバイナリファイル（.cache/word_index.bin）に
+コンパイルし、mmap で開いて解析なしに参照する。英単語による検索は en のソート済み
+インデックスの二分探索（O(log n)）、行番号による参照は固定長レコードの直接参照（O(1)）。
+
+ファイル形式（リトルエンディアン、バージョン1）:
+    ヘッダー         magic "NGWIDX\\0\\0", version, 単語数, 言語数, ソースのダイジェスト,
+                     各セクションのオフセット
+    言語ディレクトリ 言語ごとに (コード, 行数, 行レコードのオフセット, 単語→行のオフセット)
+    単語レコード     words.csv の行順。(en, meaning_en, example_en) の文字列参照
+    ソート済み索引   en の UTF-8 バイト順に並べた単語レコード番号（u32）
+    言語ごと
+      行レコード     translations_{lang}.csv の行順。(en, translation, gender, meaning) の文字列参照
+      単語→行        単語レコード番号 → 行レコード番号（u32。なければ NO_ROW）
+    文字列ヒープ     UTF-8 文字列を重複なく連結したもの
+
+文字列参照は (ヒープ内オフセット u32, バイト長 u32)。ソースCSVの (mtime_ns, size) から
+作ったダイジェストをヘッダーに持ち、CSVが変わっていれば open_index() が作り直す。
+
+使い方:
+    from word_index import open_index
+    with open_index() as index:
+        row = index.find("abbey")                 # 単語レコード番号（なければ None）
+        t = index.translation_for("fr", "abbey")  # Translation（dataset.py と同じ型）
+        for t in index.translations("fr", 0, 230):
+            ...
+
+    python scripts/word_index.py build           # 作り直す
+    python scripts/word_index.py lookup abbey    # 全言語の翻訳を表示
+    python scripts/word_index.py bench           # 検索速度を計測
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dataset import CACHE_DIR, DATA_DIR, TRANSLATION_LANGUAGES, Translation, Word, file_stamp, load_dataset
+
+INDEX_FILE = CACHE_DIR / "word_index.bin"
+
+MAGIC = b"NGWIDX\0\0"
+# 形式を変えたら上げる（古いファイルは open_index() が作り直す）
+FORMAT_VERSION = 1
+
+# magic, version, 単語数, 言語数, ダイジェスト, 単語レコード, ソート済み索引, ヒープ, ヒープ長
+HEADER = struct.Struct("<8sIII20sQQQQ")
+# 言語コード, 行数, 予約, 行レコードのオフセット, 単語→行のオフセット
+LANG_ENTRY = struct.Struct("<8sIIQQ")
+# en, meaning_en, example_en の (オフセット, 長さ)
+WORD_RECORD = struct.Struct("<6I")
+# en, translation, gender, meaning_translation の (オフセット, 長さ)
+TRANSLATION_RECORD = struct.Struct("<8I")
+U32 = struct.Struct("<I")
+
+NO_ROW = 0xFFFFFFFF
+
+
+def source_digest(data_dir: Path = DATA_DIR) -> bytes:
+    """ソースCSVの (ファイル名, mtime_ns, size) から作るダイジェスト"""
+    digest = hashlib.sha1()
+    paths = [data_dir / "words.csv"] + [
+        data_dir / f"translations_{lang}.csv" for lang in TRANSLATION_LANGUAGES
+    ]
+    for path in paths:
+        digest.update(f"{path.name}\t{file_stamp(path)}\n".encode("utf-8"))
+    return digest.digest()
+
+
+class StringHeap:
+    """文字列ヒープ。同じ文字列は1回だけ格納する"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.refs: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, value: str) -> Tuple[int, int]:
+        ref = self.refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.data), len(encoded))
+            if ref[0] + ref[1] > 0xFFFFFFFF:
+                raise ValueError("String heap exceeds 4 GiB")
+            self.data += encoded
+            self.refs[value] = ref
+        return ref
+
+
+def build_index(data_dir: Path = DATA_DIR, index_file: Path = INDEX_FILE) -> Path:
+    """データセットからインデックスファイルを作る（一時ファイル経由で置き換え）"""
+    digest = source_digest(data_dir)
+    ds = load_dataset(data_dir)
+    heap = StringHeap()
+
+    words = bytearray()
+    first_row: Dict[str, int] = {}
+    for i, word in enumerate(ds.words):
+        words += WORD_RECORD.pack(*heap.add(word.en), *heap.add(word.meaning_en), *heap.add(word.example_en))
+        first_row.setdefault(word.en, i)
+
+    # en の UTF-8 バイト順（同じ en は行順）
+    order = sorted(range(len(ds.words)), key=lambda i: (ds.words[i].en.encode("utf-8"), i))
+    sorted_index = b"".join(U32.pack(i) for i in order)
+
+    languages = []
+    for lang, rows in ds.translations.items():
+        records = bytearray()
+        by_word = [NO_ROW] * len(ds.words)
+        for j, row in enumerate(rows):
+            records += TRANSLATION_RECORD.pack(
+                *heap.add(row.en),
+                *heap.add(row.translation),
+                *heap.add(row.gender),
+                *heap.add(row.meaning_translation),
+            )
+            word_row = first_row.get(row.en)
+            if word_row is not None and by_word[word_row] == NO_ROW:
+                by_word[word_row] = j
+        languages.append((lang, len(rows), records, struct.pack(f"<{len(by_word)}I", *by_word)))
+
+    # セクションの配置を決める（ヘッダー → 言語ディレクトリ → 各セクション → ヒープ）
+    offset = HEADER.size + LANG_ENTRY.size * len(languages)
+    words_offset = offset
+    offset += len(words)
+    sorted_offset = offset
+    offset += len(sorted_index)
+    lang_entries = []
+    for lang, count, records, by_word in languages:
+        lang_entries.append(LANG_ENTRY.pack(lang.encode("ascii"), count, 0, offset, offset + len(records)))
+        offset += len(records) + len(by_word)
+    heap_offset = offset
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(ds.words),
+        len(languages),
+        digest,
+        words_offset,
+        sorted_offset,
+        heap_offset,
+        len(heap.data),
+    )
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = index_file.with_suffix(".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(header)
+        for entry in lang_entries:
+            f.write(entry)
+        f.write(words)
+        f.write(sorted_index)
+        for _, _, records, by_word in languages:
+            f.write(records)
+            f.write(by_word)
+        f.write(heap.data)
+    os.replace(tmp_file, index_file)
+    return index_file
+
+
+class WordIndex:
+    """mmap したインデックスファイルの読み取り
+
+    行番号はすべて0始まり（CSVのヘッダーを除いた行順）。
+    """
+
+    def __init__(self, path: Path = INDEX_FILE):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                self._n_words,
+                n_langs,
+                self.digest,
+                self._words_offset,
+                self._sorted_offset,
+                self._heap_offset,
+                _,
+            ) = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported index format: {self.path}")
+
+            # 言語コード → (行数, 行レコードのオフセット, 単語→行のオフセット)
+            self._languages: Dict[str, Tuple[int, int, int]] = {}
+            for k in range(n_langs):
+                code, count, _, rows_offset, by_word_offset = LANG_ENTRY.unpack_from(
+                    self._mm, HEADER.size + LANG_ENTRY.size * k
+                )
+                lang = code.rstrip(b"\0").decode("ascii")
+                self._languages[lang] = (count, rows_offset, by_word_offset)
+        except struct.error as e:
+            self._mm.close()
+            raise ValueError(f"Truncated index file: {self.path}") from e
+        except Exception:
+            self._mm.close()
+            raise
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> "WordIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self._languages)
+
+    def row_count(self, lang: str) -> int:
+        """translations_{lang}.csv の行数"""
+        return self._languages[lang][0]
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._heap_offset + offset
+        return self._mm[start : start + length].decode("utf-8")
+
+    def _en_bytes(self, row: int) -> bytes:
+        offset, length = struct.unpack_from("<II", self._mm, self._words_offset + WORD_RECORD.size * row)
+        start = self._heap_offset + offset
+        return self._mm[start : start + length]
+
+    def word(self, row: int) -> Word:
+        """words.csv の row 行目"""
+        if not 0 <= row < self._n_words:
+            raise IndexError(row)
+        refs = WORD_RECORD.unpack_from(self._mm, self._words_offset + WORD_RECORD.size * row)
+        return Word._make(self._string(refs[k], refs[k + 1]) for k in range(0, 6, 2))
+
+    def words(self, start: int = 0, end: Optional[int] = None) -> Iterator[Word]:
+        """words.csv の [start, end) 行"""
+        end = self._n_words if end is None else min(end, self._n_words)
+        for row in range(max(start, 0), end):
+            yield self.word(row)
+
+    def find(self, en: str) -> Optional[int]:
+        """en の単語レコード番号を二分探索（同じ en が複数あれば最初の行）"""
+        key = en.encode("utf-8")
+        lo, hi = 0, self._n_words
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = U32.unpack_from(self._mm, self._sorted_offset + 4 * mid)[0]
+            if self._en_bytes(row) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n_words:
+            row = U32.unpack_from(self._mm, self._sorted_offset + 4 * lo)[0]
+            if self._en_bytes(row) == key:
+                return row
+        return None
+
+    def __contains__(self, en: str) -> bool:
+        return self.find(en) is not None
+
+    def lookup(self, en: str) -> Optional[Word]:
+        """en の words.csv の行"""
+        row = self.find(en)
+        return None if row is None else self.word(row)
+
+    def translation(self, lang: str, row: int) -> Translation:
+        """translations_{lang}.csv の row 行目"""
+        count, rows_offset, _ = self._languages[lang]
+        if not 0 <= row < count:
+            raise IndexError(row)
+        refs = TRANSLATION_RECORD.unpack_from(self._mm, rows_offset + TRANSLATION_RECORD.size * row)
+        return Translation._make(self._string(refs[k], refs[k + 1]) for k in range(0, 8, 2))
+
+    def translations(self, lang: str, start: int = 0, end: Optional[int] = None) -> Iterator[Translation]:
+        """translations_{lang}.csv の [start, end) 行"""
+        count = self._languages[lang][0]
+        end = count if end is None else min(end, count)
+        for row in range(max(start, 0), end):
+            yield self.translation(lang, row)
+
+    def translation_for(self, lang: str, en: str) -> Optional[Translation]:
+        """en の translations_{lang}.csv の行"""
+        row = self.find(en)
+        if row is None:
+            return None
+        _, _, by_word_offset = self._languages[lang]
+        lang_row = U32.unpack_from(self._mm, by_word_offset + 4 * row)[0]
+        return None if lang_row == NO_ROW else self.translation(lang, lang_row)
+
+
+def open_index(data_dir: Path = DATA_DIR, index_file: Path = INDEX_FILE, rebuild: bool = True) -> WordIndex:
+    """インデックスを開く。ないか古い（CSVが変わった・形式が違う）場合は作り直す"""
+    index_file = Path(index_file)
+    if index_file.exists():
+        try:
+            index = WordIndex(index_file)
+        except ValueError:
+            index = None
+        if index is not None:
+            if not rebuild or index.digest == source_digest(data_dir):
+                return index
+            index.close()
+    elif not rebuild:
+        raise FileNotFoundError(index_file)
+
+    build_index(data_dir, index_file)
+    return WordIndex(index_file)
+
+
+def bench(index: WordIndex, repeat: int = 20000):
+    """英単語検索と行番号参照の平均時間を表示"""
+    words = [index.word(row).en for row in range(0, len(index), max(1, len(index) // 1000))]
+    lang = index.languages[0]
+
+    start = time.perf_counter()
+    for k in range(repeat):
+        index.find(words[k % len(words)])
+    find_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for k in range(repeat):
+        index.translation_for(lang, words[k % len(words)])
+    lookup_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for k in range(repeat):
+        index.translation(lang, k % index.row_count(lang))
+    row_us = (time.perf_counter() - start) / repeat * 1e6
+
+    print(f"find(en):               {find_us:.2f} µs")
+    print(f"translation_for({lang}, en): {lookup_us:.2f} µs")
+    print(f"translation({lang}, row):    {row_us:.2f} µs")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or query the binary word index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Rebuild the index from the CSV files")
+    lookup_parser = sub.add_parser("lookup", help="Show an English word in every language")
+    lookup_parser.add_argument("word")
+    sub.add_parser("bench", help="Measure lookup latency")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        path = build_index()
+        elapsed = time.perf_counter() - start
+        with WordIndex(path) as index:
+            print(
+                f"Built {path} ({path.stat().st_size:,} bytes, {len(index)} words, "
+                f"{len(index.languages)} languages) in {elapsed * 1000:.0f} ms"
+            )
+        return
+
+    start = time.perf_counter()
+    with open_index() as index:
+        opened = time.perf_counter() - start
+        if args.command == "bench":
+            print(f"open_index(): {opened * 1000:.2f} ms")
+            bench(index)
+            return
+
+        word = index.lookup(args.word)
+        if word is None:
+            print(f"Not found: {args.word}")
+            sys.exit(1)
+        print(f"{word.en}: {word.meaning_en}")
+        for lang in index.languages:
+            t = index.translation_for(lang, word.en)
+            if t is not None:
+                print(f"  {lang}: {t.translation} ({t.gender}) {t.meaning_translation}")
+
+
+if __name__ == "__main__":
+    main()
@@ -89,9 +89,28 @@ async function getAllEnglishWordsWithTranslations(db: D1Database): Promise<strin
   return Array.from(wordSet).sort((a, b) => a.toLowerCase().localeCompare(b.toLowerCase()));
 }
 
+/**
+ * 単語ページのデータ。同期時に作る word_docs（1語分の WordData の JSON）を1行読む。
+ * word_docs に行がない・テーブルがない場合は各テーブルから組み立てる。
+ */
 export async function getWord(word: string): Promise<WordData | null> {
   const db = getDB();
 
+  try {
+    const row = await db
+      .prepare(`SELECT doc FROM word_docs WHERE en = ?`)
+      .bind(word.toLowerCase())
+      .first<{ doc: string }>();
+    if (row) {
+      return JSON.parse(row.doc) as WordData;
+    }
+    // 行がない = 単語がないか性別のある翻訳がない、または同期中・未同期で word_docs が
+    // 揃っていない。後者で 404 にしないよう、下の組み立てで確かめる
+  } catch (error) {
+    // word_docs がまだない（スキーマ適用前）場合は下の組み立てにフォールバック
+    console.warn('word_docs unavailable, querying word tables:', error);
+  }
+
   // 1. 単語の意味を取得
   const meaning = await db
     .prepare(
@@ -244,15 +263,30 @@ export interface LetterStat {
   count: number;
 }
 
-export async function getStats(): Promise<{
+export interface Stats {
   totalWords: number;
   totalTranslations: number;
   multilingualTerms: number;
   searchLanguages: number;
   languageStats: { language: string; count: number }[];
-}> {
+}
+
+export async function getStats(): Promise<Stats> {
   const db = getDB();
 
+  // 同期時に scripts/gender_matrix.py で事前計算した統計（1行の読み込みで済む）
+  try {
+    const precomputed = await db
+      .prepare(`SELECT value FROM dataset_stats WHERE key = 'api_stats'`)
+      .first<{ value: string }>();
+    if (precomputed) {
+      return JSON.parse(precomputed.value) as Stats;
+    }
+  } catch (error) {
+    // dataset_stats がまだない（スキーマ適用前）場合は下の集計にフォールバック
+    console.warn('dataset_stats unavailable, computing stats:', error);
+  }
+
   // 各言語テーブルから統計を個別に取得
   const languageStats: { language: string; count: number }[] = [];
   const wordSets: Set<string>[] = [];
@@ -308,17 +342,101 @@ export async function getStats(): Promise<{
   };
 }
 
-export async function search(
+// ラテン文字（scripts/sync_to_d1.py の LATIN_ACCENT と同じ範囲）の後に続く結合文字
+const LATIN_ACCENT = /([A-Za-z\u00c0-\u024f\u1e00-\u1eff])[\u0300-\u036f]+/g;
+
+/**
+ * 検索用に正規化した語（scripts/sync_to_d1.py の fold_search_term と同じ規則）。
+ * ラテン文字のアクセントを除き、小文字にする。
+ */
+export function foldSearchTerm(text: string): string {
+  return text.trim().normalize('NFD').replace(LATIN_ACCENT, '$1').normalize('NFC').toLowerCase();
+}
+
+// 前方一致の上限（どの文字よりも大きい U+10FFFF を付ける）
+const PREFIX_END = '\u{10FFFF}';
+
+// search_terms_fts（trigram）で部分一致を引ける最短の語の長さ
+const TRIGRAM_MIN_LENGTH = 3;
+
+/**
+ * FTS5 の MATCH に渡すフレーズ（語全体を1つのフレーズとして引用し、演算子として解釈させない）。
+ */
+function ftsPhrase(term: string): string {
+  return `"${term.replace(/"/g, '""')}"`;
+}
+
+/**
+ * search_terms（同期時に作る正規化済みの語の索引）から一致する英単語と優先順位を返す。
+ * 完全一致・前方一致は term の索引の範囲検索。前方一致だけで limit 語に満たない場合のみ
+ * 部分一致を追加する（部分一致は優先順位が最も低いため、結果は変わらない）。
+ * 部分一致は3文字以上なら trigram 索引（search_terms_fts）、それより短ければ全行の走査。
+ */
+async function findMatchesInSearchTerms(
+  db: D1Database,
   query: string,
   languages: LanguageCode[],
   limit: number
-): Promise<SearchResult[]> {
-  const db = getDB();
+): Promise<Map<string, number>> {
+  const term = foldSearchTerm(query);
+  const langPlaceholders = languages.map(() => '?').join(',');
+  // 英単語の一致は、選択した言語の翻訳がある単語だけを対象にする（翻訳がなければ結果から外れるため）
+  const languageFilter = `(s.lang IN (${langPlaceholders}) OR (s.kind = 'headword' AND EXISTS (
+    SELECT 1 FROM search_terms t WHERE t.en = s.en AND t.lang IN (${langPlaceholders}))))`;
+
+  const { results: prefixMatches } = await db
+    .prepare(
+      `SELECT s.en, MIN(CASE
+         WHEN s.term = ? THEN (CASE s.kind WHEN 'headword' THEN 1 ELSE 2 END)
+         WHEN s.kind = 'headword' AND LENGTH(s.en) <= 4 THEN 2.5
+         WHEN s.kind = 'headword' THEN 3
+         ELSE 4 END) AS priority
+       FROM search_terms s
+       WHERE s.term >= ? AND s.term < ? AND ${languageFilter}
+       GROUP BY s.en`
+    )
+    .bind(term, term, term + PREFIX_END, ...languages, ...languages)
+    .all();
 
-  if (languages.length === 0) {
-    return [];
+  const priorities = new Map<string, number>();
+  for (const row of prefixMatches as { en: string; priority: number }[]) {
+    priorities.set(row.en, row.priority);
+  }
+
+  if (priorities.size < limit) {
+    // trigram は3文字単位のため、短い語は索引を引けない
+    const useTrigram = Array.from(term).length >= TRIGRAM_MIN_LENGTH;
+    const containsCondition = useTrigram
+      ? 'rowid IN (SELECT rowid FROM search_terms_fts WHERE search_terms_fts MATCH ?)'
+      : 'instr(term, ?) > 0';
+    const { results: containsMatches } = await db
+      .prepare(
+        // 先に部分一致で絞り込む（DISTINCT のために en の索引順で全行を引くのを避ける）
+        `WITH s AS MATERIALIZED (
+           SELECT en, lang, kind FROM search_terms WHERE ${containsCondition}
+         )
+         SELECT DISTINCT s.en FROM s WHERE ${languageFilter}`
+      )
+      .bind(useTrigram ? ftsPhrase(term) : term, ...languages, ...languages)
+      .all();
+    for (const row of containsMatches as { en: string }[]) {
+      if (!priorities.has(row.en)) {
+        priorities.set(row.en, 5);
+      }
+    }
   }
 
+  return priorities;
+}
+
+/**
+ * search_terms がない場合の検索（英単語と各言語テーブルの LIKE '%q%' による全件走査）。
+ */
+async function findMatchesByScan(
+  db: D1Database,
+  query: string,
+  languages: LanguageCode[]
+): Promise<Map<string, number>> {
   const searchTerm = `%${query.toLowerCase()}%`;
   const exactTerm = query.toLowerCase();
 
@@ -375,16 +493,43 @@ export async function search(
     }
   }
 
-  // 2. ユニークな英単語を取得してソート
-  const uniqueWords = Array.from(matchedEnWords);
-  // matchTypeの最小値でソート（優先度が高いものが先）
+  // matchTypeの最小値（優先度が高いもの）を単語の優先順位にする
   const wordPriority = new Map<string, number>();
+  for (const en of matchedEnWords) {
+    wordPriority.set(en, 999);
+  }
   for (const match of rawMatches) {
     const current = wordPriority.get(match.en) ?? 999;
     if (match.matchType < current) {
       wordPriority.set(match.en, match.matchType);
     }
   }
+  return wordPriority;
+}
+
+export async function search(
+  query: string,
+  languages: LanguageCode[],
+  limit: number
+): Promise<SearchResult[]> {
+  const db = getDB();
+
+  if (languages.length === 0) {
+    return [];
+  }
+
+  // 1. 検索条件に一致する英単語と優先順位を収集
+  let wordPriority: Map<string, number>;
+  try {
+    wordPriority = await findMatchesInSearchTerms(db, query, languages, limit);
+  } catch (error) {
+    // search_terms がまだない（スキーマ適用前）場合は各言語テーブルの走査にフォールバック
+    console.warn('search_terms unavailable, scanning language tables:', error);
+    wordPriority = await findMatchesByScan(db, query, languages);
+  }
+
+  // 2. ユニークな英単語を優先順位でソート
+  const uniqueWords = Array.from(wordPriority.keys());
   uniqueWords.sort((a, b) => {
     const pa = wordPriority.get(a) ?? 999;
     const pb = wordPriority.get(b) ?? 999;
@@ -542,6 +687,61 @@ export async function search(
   return Array.from(grouped.values()).filter((word) => word.translations.length > 0);
 }
 
+// letter_prefixes に事前計算した接頭辞の最大文字数（scripts/sync_to_d1.py の PREFIX_MAX_LENGTH と同じ）
+const PREFIX_MAX_LENGTH = 3;
+
+/**
+ * browseWords の1ページ分の英単語（英単語順）。
+ * 同期時に作る word_positions の sort_rank と letter_prefixes の接頭辞の範囲から求める。
+ * 接頭辞が PREFIX_MAX_LENGTH より長い場合とテーブルがない場合は words_en を LIMIT/OFFSET で読む。
+ */
+async function browseWordList(
+  db: D1Database,
+  startsWith: string | undefined,
+  limit: number,
+  offset: number
+): Promise<string[]> {
+  const prefix = (startsWith ?? '').toLowerCase();
+
+  if (prefix.length <= PREFIX_MAX_LENGTH) {
+    try {
+      const statement = prefix
+        ? db
+            .prepare(
+              `SELECT wp.en FROM letter_prefixes lp
+               JOIN word_positions wp
+                 ON wp.sort_rank >= lp.first_sort_rank + ? AND wp.sort_rank <= lp.last_sort_rank
+               WHERE lp.prefix = ?
+               ORDER BY wp.sort_rank LIMIT ?`
+            )
+            .bind(offset, prefix, limit)
+        : db
+            .prepare(`SELECT en FROM word_positions WHERE sort_rank > ? ORDER BY sort_rank LIMIT ?`)
+            .bind(offset, limit);
+      const { results } = await statement.all();
+      return (results as { en: string }[]).map((r) => r.en);
+    } catch (error) {
+      // word_positions / letter_prefixes がまだない（スキーマ適用前）場合は words_en を読む
+      console.warn('word_positions unavailable, paging words_en:', error);
+    }
+  }
+
+  // words_enから直接ページネーション（COLLATE NOCASEインデックス使用）
+  let wordQuery = `SELECT en FROM words_en`;
+  const params: (string | number)[] = [];
+
+  if (startsWith) {
+    wordQuery += ` WHERE en LIKE ? COLLATE NOCASE`;
+    params.push(`${startsWith}%`);
+  }
+
+  wordQuery += ` ORDER BY en COLLATE NOCASE LIMIT ? OFFSET ?`;
+  params.push(limit, offset);
+
+  const { results: wordRows } = await db.prepare(wordQuery).bind(...params).all();
+  return (wordRows as { en: string }[]).map((r) => r.en);
+}
+
 export async function browseWords(options: {
   limit?: number;
   offset?: number;
@@ -569,20 +769,8 @@ export async function browseWords(options: {
   const db = getDB();
   const targetLangs = language ? [language] : ALL_LANGUAGES;
 
-  // 1. words_enから直接ページネーション（COLLATE NOCASEインデックス使用）
-  let wordQuery = `SELECT en FROM words_en`;
-  const params: (string | number)[] = [];
-
-  if (startsWith) {
-    wordQuery += ` WHERE en LIKE ? COLLATE NOCASE`;
-    params.push(`${startsWith}%`);
-  }
-
-  wordQuery += ` ORDER BY en COLLATE NOCASE LIMIT ? OFFSET ?`;
-  params.push(limit, offset);
-
-  const { results: wordRows } = await db.prepare(wordQuery).bind(...params).all();
-  const englishList = (wordRows as { en: string }[]).map((r) => r.en);
+  // 1. ページの英単語を取得（並び順の位置の範囲検索。OFFSET で読み飛ばさない）
+  const englishList = await browseWordList(db, startsWith, limit, offset);
 
   if (englishList.length === 0) {
     return [];
@@ -736,9 +924,28 @@ export async function browseWords(options: {
   return finalResults;
 }
 
+/**
+ * 文字ナビゲーション（翻訳がある英単語の先頭の文字ごとの単語数）。
+ * 同期時に作る letter_prefixes の1文字の接頭辞を読む（テーブルがなければ各言語テーブルを走査）。
+ */
 export async function getLetterStats(): Promise<LetterStat[]> {
   const db = getDB();
 
+  try {
+    const letters = 'abcdefghijklmnopqrstuvwxyz'.split('');
+    const { results } = await db
+      .prepare(
+        `SELECT prefix AS letter, word_count AS count FROM letter_prefixes
+         WHERE prefix IN (${letters.map(() => '?').join(',')}) AND word_count > 0
+         ORDER BY prefix`
+      )
+      .bind(...letters)
+      .all();
+    return results as LetterStat[];
+  } catch (error) {
+    console.warn('letter_prefixes unavailable, scanning language tables:', error);
+  }
+
   // 各言語テーブルから翻訳がある英単語を収集
   const wordSet = new Set<string>();
 
@@ -769,9 +976,32 @@ export async function getLetterStats(): Promise<LetterStat[]> {
     .map(([letter, count]) => ({ letter, count }));
 }
 
+/**
+ * 接頭辞に続く文字（a〜z）ごとの単語数。PREFIX_MAX_LENGTH 文字までは letter_prefixes の1行を読む。
+ */
 export async function getLetterStatsDetailed(prefix: string): Promise<{ next_letter: string; count: number }[]> {
   const db = getDB();
   const prefixLower = prefix.toLowerCase();
+
+  if (prefixLower === '') {
+    const letters = await getLetterStats();
+    return letters.map(({ letter, count }) => ({ next_letter: letter, count }));
+  }
+  if (prefixLower.length <= PREFIX_MAX_LENGTH) {
+    try {
+      const row = await db
+        .prepare(`SELECT next_letters FROM letter_prefixes WHERE prefix = ?`)
+        .bind(prefixLower)
+        .first<{ next_letters: string }>();
+      // 行がない = その接頭辞の単語がない
+      const counts = row ? (JSON.parse(row.next_letters) as Record<string, number>) : {};
+      return Object.entries(counts)
+        .sort((a, b) => a[0].localeCompare(b[0]))
+        .map(([next_letter, count]) => ({ next_letter, count }));
+    } catch (error) {
+      console.warn('letter_prefixes unavailable, scanning language tables:', error);
+    }
+  }
   const prefixLength = prefix.length;
 
   // 各言語テーブルから翻訳がある英単語を収集
@@ -808,8 +1038,37 @@ export async function getLetterStatsDetailed(prefix: string): Promise<{ next_let
     .map(([next_letter, count]) => ({ next_letter, count }));
 }
 
+/**
+ * 接頭辞に一致する（翻訳がある）英単語のうち offset 番目（0始まり）の単語。
+ * PREFIX_MAX_LENGTH 文字までは letter_prefixes の先頭の順位から word_positions を1行引く。
+ */
 export async function getWordAtOffset(prefix: string, offset: number): Promise<string | null> {
   const db = getDB();
+  const prefixLower = prefix.toLowerCase();
+
+  if (!Number.isInteger(offset) || offset < 0) {
+    return null;
+  }
+  if (prefixLower.length <= PREFIX_MAX_LENGTH) {
+    try {
+      const row = prefixLower
+        ? await db
+            .prepare(
+              `SELECT wp.en FROM letter_prefixes lp
+               JOIN word_positions wp ON wp.nav_rank = lp.first_nav_rank + ?
+               WHERE lp.prefix = ? AND ? < lp.word_count`
+            )
+            .bind(offset, prefixLower, offset)
+            .first<{ en: string }>()
+        : await db
+            .prepare(`SELECT en FROM word_positions WHERE nav_rank = ?`)
+            .bind(offset + 1)
+            .first<{ en: string }>();
+      return row?.en ?? null;
+    } catch (error) {
+      console.warn('word_positions unavailable, scanning language tables:', error);
+    }
+  }
 
   // 各言語テーブルから翻訳がある英単語を収集
   const wordSet = new Set<string>();
@@ -836,8 +1095,41 @@ export async function getWordAtOffset(prefix: string, offset: number): Promise<s
   return sortedWords[offset] ?? null;
 }
 
+/**
+ * 接頭辞に一致する（翻訳がある）英単語の最初と最後の単語と単語数。
+ * PREFIX_MAX_LENGTH 文字までは letter_prefixes の1行、空の接頭辞は word_positions の両端を読む。
+ */
 export async function getWordRange(prefix: string): Promise<{ firstWord?: string; lastWord?: string; totalCount: number }> {
   const db = getDB();
+  const prefixLower = prefix.toLowerCase();
+
+  if (prefixLower.length <= PREFIX_MAX_LENGTH) {
+    try {
+      const row = prefixLower
+        ? await db
+            .prepare(
+              `SELECT first_word, last_word, word_count FROM letter_prefixes WHERE prefix = ?`
+            )
+            .bind(prefixLower)
+            .first<{ first_word: string | null; last_word: string | null; word_count: number }>()
+        : await db
+            .prepare(
+              `SELECT
+                 (SELECT en FROM word_positions WHERE nav_rank = 1) AS first_word,
+                 (SELECT en FROM word_positions
+                  WHERE nav_rank = (SELECT MAX(nav_rank) FROM word_positions)) AS last_word,
+                 (SELECT IFNULL(MAX(nav_rank), 0) FROM word_positions) AS word_count`
+            )
+            .first<{ first_word: string | null; last_word: string | null; word_count: number }>();
+      return {
+        firstWord: row?.first_word ?? undefined,
+        lastWord: row?.last_word ?? undefined,
+        totalCount: row?.word_count ?? 0,
+      };
+    } catch (error) {
+      console.warn('letter_prefixes unavailable, scanning language tables:', error);
+    }
+  }
 
   // 各言語テーブルから翻訳がある英単語を収集
   const wordSet = new Set<string>();
@@ -868,18 +1160,68 @@ export async function getWordRange(prefix: string): Promise<{ firstWord?: string
   };
 }
 
-export async function getQuizQuestions(
-  languages: string[],
-  count: number
-): Promise<{ english: string; translation: string; language: string; gender: string }[]> {
+type QuizRow = { english: string; translation: string; language: string; gender: string };
+
+function shuffle<T>(items: T[]): T[] {
+  for (let i = items.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [items[i], items[j]] = [items[j], items[i]];
+  }
+  return items;
+}
+
+/**
+ * クイズの問題。出題数を言語に均等に振り分け（余りはランダムな言語に）、同期時に作る
+ * quiz_pool（言語ごとに性別で層別してシャッフルした出題順）からランダムな位置の連続した
+ * 区間を主キーの範囲で読む。quiz_pool がない場合は各言語テーブルの全候補からシャッフルする。
+ */
+export async function getQuizQuestions(languages: string[], count: number): Promise<QuizRow[]> {
   const db = getDB();
+  const targetLangs = Array.from(new Set(languages)).filter((lang) =>
+    ALL_LANGUAGES.includes(lang as (typeof ALL_LANGUAGES)[number])
+  );
+  if (targetLangs.length === 0 || !(count > 0)) {
+    return [];
+  }
 
-  // 各言語テーブルから候補を収集
-  const allCandidates: { english: string; translation: string; language: string; gender: string }[] = [];
+  try {
+    const shares = shuffle([...targetLangs])
+      .map((lang, i) => ({
+        lang,
+        take: Math.floor(count / targetLangs.length) + (i < count % targetLangs.length ? 1 : 0),
+      }))
+      .filter(({ take }) => take > 0);
+    // 区間の開始位置は 0〜(件数 - take) から一様に選ぶ（件数 = MAX(position) + 1）
+    const batchResults = await db.batch(
+      shares.map(({ lang, take }) =>
+        db
+          .prepare(
+            `SELECT en AS english, translation, gender FROM quiz_pool
+             WHERE lang = ?
+             AND position >= CAST(? * MAX((SELECT MAX(position) FROM quiz_pool WHERE lang = ?) + 2 - ?, 1) AS INTEGER)
+             ORDER BY position LIMIT ?`
+          )
+          .bind(lang, Math.random(), lang, take, take)
+      )
+    );
+    const questions: QuizRow[] = [];
+    shares.forEach(({ lang }, i) => {
+      for (const row of batchResults[i].results as { english: string; translation: string; gender: string }[]) {
+        questions.push({ ...row, language: lang });
+      }
+    });
+    // 行がない = 同期前の空の quiz_pool のため、下の全候補からの抽出にフォールバック
+    if (questions.length > 0) {
+      return shuffle(questions);
+    }
+  } catch (error) {
+    console.warn('quiz_pool unavailable, sampling language tables:', error);
+  }
 
-  for (const lang of languages) {
-    if (!ALL_LANGUAGES.includes(lang as (typeof ALL_LANGUAGES)[number])) continue;
+  // 各言語テーブルから候補を収集
+  const allCandidates: QuizRow[] = [];
 
+  for (const lang of targetLangs) {
     const { results } = await db
       .prepare(
         `SELECT en as english, translation, gender
@@ -900,12 +1242,7 @@ export async function getQuizQuestions(
   }
 
   // シャッフルしてcount個を返却
-  for (let i = allCandidates.length - 1; i > 0; i--) {
-    const j = Math.floor(Math.random() * (i + 1));
-    [allCandidates[i], allCandidates[j]] = [allCandidates[j], allCandidates[i]];
-  }
-
-  return allCandidates.slice(0, count);
+  return shuffle(allCandidates).slice(0, count);
 }
 
 export async function getMemoryTricksForWord(